@@ -11,7 +11,39 @@
 // ──── Execute Script Helper ────────────────────────────────
 // ═══════════════════════════════════════════════════════════
 
+// Run a parsed program against a fresh global scope (shared by --script and --serve)
+void runProgram(const std::shared_ptr<BlockStmt> &program)
+{
+    Scope globalScope;
+    globalScope.define("PI", var(3.14159265));
+    globalScope.define("e", var(2.7182818));
+    for (auto &stmt : program->statements)
+        stmt->execute(globalScope);
+}
+
 void executeScript(const std::string &content)
+{
+    if (content.empty())
+        return;
+    try
+    {
+        Tokenizer tokenizer;
+        auto tokens = tokenizer.tokenize(content);
+        Parser parser(tokens);
+        runProgram(parser.parseProgram());
+    }
+    catch (ReturnException &e)
+    {
+        std::cout << format_output(e.value) << std::endl;
+    }
+    catch (std::exception &e)
+    {
+        std::cout << "Error: " << e.what() << std::endl;
+    }
+}
+
+// Parse-only pass shared by --check and --serve: report syntax errors, run nothing
+void checkScript(const std::string &content)
 {
     if (content.empty())
         return;
@@ -21,11 +53,62 @@ void executeScript(const std::string &content)
         auto tokens = tokenizer.tokenize(content);
         Parser parser(tokens);
         auto program = parser.parseProgram();
-        Scope globalScope;
-        globalScope.define("PI", var(3.14159265));
-        globalScope.define("e", var(2.7182818));
-        for (auto &stmt : program->statements)
-            stmt->execute(globalScope);
+        // Parse succeeded — no errors
+    }
+    catch (std::exception &e)
+    {
+        std::cout << "Error: " << e.what() << std::endl;
+    }
+}
+
+// ═══════════════════════════════════════════════════════════
+// ──── Serve Mode ───────────────────────────────────────────
+// ═══════════════════════════════════════════════════════════
+// Long-lived batch runner for test harnesses. Each snippet is read from stdin
+// up to a line holding SERVE_SENTINEL and executed exactly like --script (fresh
+// scope, no open files), or up to SERVE_CHECK_SENTINEL and only parsed, like --check. Either
+// way SERVE_SENTINEL is then written on its own line to stdout and stderr so
+// the client knows the snippet finished without waiting for process exit.
+
+// `extern`-declared in scriptit_builtins.hpp: input() must not consume the next snippet
+bool _scriptit_serve_mode = false;
+const std::string SERVE_SENTINEL = "---SCRIPTIT-END---";
+const std::string SERVE_CHECK_SENTINEL = "---SCRIPTIT-CHECK---";
+
+// Parsed programs keyed on snippet source. An AST is never mutated by execution
+// (Expression::compile only fills its own lowering cache), so a repeated
+// snippet reuses its tree and only gets a fresh scope. Failed parses are not
+// cached; re-parsing reproduces the same error.
+struct ServeParseCache
+{
+    static constexpr size_t MAX_ENTRIES = 512;
+    std::unordered_map<std::string, std::shared_ptr<BlockStmt>> programs;
+
+    std::shared_ptr<BlockStmt> parse(const std::string &content)
+    {
+        auto it = programs.find(content);
+        if (it != programs.end())
+            return it->second;
+        Tokenizer tokenizer;
+        auto tokens = tokenizer.tokenize(content);
+        Parser parser(tokens);
+        auto program = parser.parseProgram();
+        if (programs.size() >= MAX_ENTRIES)
+            programs.clear();
+        programs.emplace(content, program);
+        return program;
+    }
+};
+
+void serveSnippet(ServeParseCache &cache, const std::string &content, bool check)
+{
+    if (content.empty())
+        return;
+    try
+    {
+        auto program = cache.parse(content);
+        if (!check)
+            runProgram(program);
     }
     catch (ReturnException &e)
     {
@@ -35,6 +118,42 @@ void executeScript(const std::string &content)
     {
         std::cout << "Error: " << e.what() << std::endl;
     }
+    // Files the snippet left open would leak into the next one (and shift its
+    // handle ids); a --script run gets a fresh registry with its process
+    FileRegistry::instance().reset();
+}
+
+void runServe()
+{
+    _scriptit_serve_mode = true;
+    // Build the dispatch tables while the client is still writing the first
+    // snippet, instead of inside whichever snippet touches them first
+    get_binary_ops();
+    get_math_ops();
+    get_builtins();
+    ServeParseCache cache;
+    std::string line;
+    std::string content;
+    bool first = true;
+    while (std::getline(std::cin, line))
+    {
+        bool check = line == SERVE_CHECK_SENTINEL;
+        if (!check && line != SERVE_SENTINEL)
+        {
+            if (!first)
+                content += '\n';
+            content += line;
+            first = false;
+            continue;
+        }
+        serveSnippet(cache, content, check);
+        std::cout << '\n'
+                  << SERVE_SENTINEL << std::endl;
+        std::cerr << '\n'
+                  << SERVE_SENTINEL << std::endl;
+        content.clear();
+        first = true;
+    }
 }
 
 // ═══════════════════════════════════════════════════════════
@@ -213,20 +332,13 @@ int main(int argc, char *argv[])
     {
         // Parse-only mode for diagnostics / linting — no execution
         std::string content((std::istreambuf_iterator<char>(std::cin)), std::istreambuf_iterator<char>());
-        if (content.empty())
-            return 0;
-        try
-        {
-            Tokenizer tokenizer;
-            auto tokens = tokenizer.tokenize(content);
-            Parser parser(tokens);
-            auto program = parser.parseProgram();
-            // Parse succeeded — no errors
-        }
-        catch (std::exception &e)
-        {
-            std::cout << "Error: " << e.what() << std::endl;
-        }
+        checkScript(content);
+        return 0;
+    }
+
+    if (argc > 1 && std::string(argv[1]) == "--serve")
+    {
+        runServe();
         return 0;
     }
 
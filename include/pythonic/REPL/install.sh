@@ -15,7 +15,7 @@ echo "🔨 Building ScriptIt v2..."
 echo "   Source: $SRC"
 echo "   Include: $INCLUDE"
 
-g++ -std=c++20 -O2 -I"$INCLUDE" -o /tmp/scriptit_build "$SRC" "$STUBS"
+g++ -std=c++20 -O3 -I"$INCLUDE" -o /tmp/scriptit_build "$SRC" "$STUBS"
 
 echo "📦 Installing to $OUTPUT..."
 sudo cp /tmp/scriptit_build "$OUTPUT"
@@ -51,7 +51,7 @@ if ! command -v "$BINARY" &>/dev/null && [ ! -f "$BINARY" ]; then
     STUBS_DIR="$(cd "$SCRIPT_DIR/../../.." 2>/dev/null && pwd)/src/pythonicDispatchStubs.cpp"
     if [ -f "$CPP_SOURCE" ] && [ -f "$STUBS_DIR" ]; then
         echo -e "${CYAN}Building ScriptIt...${NC}"
-        g++ -std=c++20 -I"$INCLUDE_DIR" -O2 -o "$SCRIPT_DIR/scriptit" "$CPP_SOURCE" "$STUBS_DIR"
+        g++ -std=c++20 -I"$INCLUDE_DIR" -O3 -o "$SCRIPT_DIR/scriptit" "$CPP_SOURCE" "$STUBS_DIR"
         BINARY="$SCRIPT_DIR/scriptit"
         echo -e "${GREEN}✓ Built successfully${NC}"
     else
@@ -16,7 +16,15 @@ public:
         std::vector<Token> tokens;
         int line = 1;
 
-        static const std::unordered_map<std::string, TokenType> keywords = {
+        // Word operators map to their symbolic spelling so one lookup covers both
+        struct Keyword
+        {
+            TokenType type;
+            const char *spelling; // nullptr: keep the word as written
+            Keyword(TokenType t, const char *s = nullptr) : type(t), spelling(s) {}
+        };
+        static const std::unordered_map<std::string, Keyword> keywords = {
+            {"and", {TokenType::Operator, "&&"}}, {"or", {TokenType::Operator, "||"}}, {"not", {TokenType::Operator, "!"}},
             {"var", TokenType::KeywordVar}, {"fn", TokenType::KeywordFn}, {"give", TokenType::KeywordGive}, {"if", TokenType::KeywordIf}, {"elif", TokenType::KeywordElif}, {"else", TokenType::KeywordElse}, {"for", TokenType::KeywordFor}, {"in", TokenType::KeywordIn}, {"range", TokenType::KeywordRange}, {"from", TokenType::KeywordFrom}, {"to", TokenType::KeywordTo}, {"step", TokenType::KeywordStep}, {"pass", TokenType::KeywordPass}, {"while", TokenType::KeywordWhile}, {"are", TokenType::KeywordAre}, {"new", TokenType::KeywordNew}, {"let", TokenType::KeywordLet}, {"be", TokenType::KeywordBe}, {"of", TokenType::KeywordOf}, {"is", TokenType::KeywordIs}, {"points", TokenType::KeywordPoints}};
 
         static const std::unordered_map<char, TokenType> simpleSymbols = {
@@ -56,29 +64,20 @@ public:
             // Comments: --> ... <--
             if (c == '-' && i + 2 < source.length() && source[i + 1] == '-' && source[i + 2] == '>')
             {
-                i += 2;
-                while (i < source.length())
-                {
-                    if (source[i] == '\n')
-                        line++;
-                    if (source[i] == '<' && i + 2 < source.length() && source[i + 1] == '-' && source[i + 2] == '-')
-                    {
-                        i += 2;
-                        break;
-                    }
-                    i++;
-                }
+                // An unterminated comment runs to the end of the source
+                size_t close = source.find("<--", i + 3);
+                size_t end = close == std::string::npos ? source.length() : close + 3;
+                line += (int)std::count(source.begin() + i + 3, source.begin() + end, '\n');
+                i = end - 1;
                 continue;
             }
 
             // Single-line comments: # ... (skip to end of line)
             if (c == '#')
             {
-                while (i < source.length() && source[i] != '\n')
-                    i++;
+                size_t nl = source.find('\n', i);
                 // Don't consume the \n — let the normal newline handler emit it
-                if (i < source.length())
-                    i--; // back up so the main loop's i++ lands on \n
+                i = (nl == std::string::npos ? source.length() : nl) - 1;
                 continue;
             }
 
@@ -107,9 +106,17 @@ public:
                     }
                     else
                     {
-                        if (source[i] == '\n')
-                            line++;
-                        str += source[i];
+                        // Copy a run of plain characters in one append
+                        size_t end = i;
+                        do
+                        {
+                            if (source[end] == '\n')
+                                line++;
+                            ++end;
+                        } while (end < source.length() && source[end] != quote && source[end] != '\\');
+                        str.append(source, i, end - i);
+                        i = end;
+                        continue;
                     }
                     i++;
                 }
@@ -122,7 +129,6 @@ public:
             // Numbers
             if (std::isdigit(c) || (c == '.' && i + 1 < source.length() && std::isdigit(source[i + 1])))
             {
-                std::string numStr;
                 int startPos = i;
                 bool hasDecimal = false;
                 while (i < source.length() && (std::isdigit(source[i]) || source[i] == '.'))
@@ -135,20 +141,20 @@ public:
                             break;
                         hasDecimal = true;
                     }
-                    numStr += source[i++];
+                    i++;
                 }
+                tokens.emplace_back(TokenType::Number, source.substr(startPos, i - startPos), startPos, line);
                 i--;
-                tokens.emplace_back(TokenType::Number, numStr, startPos, line);
                 continue;
             }
 
             // Identifiers / Keywords
             if (std::isalpha(c) || c == '_')
             {
-                std::string value;
                 int startPos = i;
                 while (i < source.length() && (std::isalnum(source[i]) || source[i] == '_'))
-                    value += source[i++];
+                    i++;
+                std::string value = source.substr(startPos, i - startPos);
                 i--;
 
                 // Multi-word type names: "long double", "long long", "unsigned int", "unsigned long", "unsigned long long"
@@ -160,10 +166,10 @@ public:
                         j++;
                     if (j < source.length() && (std::isalpha(source[j]) || source[j] == '_'))
                     {
-                        std::string nextWord;
                         size_t k = j;
                         while (k < source.length() && (std::isalnum(source[k]) || source[k] == '_'))
-                            nextWord += source[k++];
+                            k++;
+                        std::string nextWord = source.substr(j, k - j);
 
                         if (value == "long" && nextWord == "double")
                         {
@@ -191,10 +197,10 @@ public:
                                 j2++;
                             if (j2 < source.length() && std::isalpha(source[j2]))
                             {
-                                std::string thirdWord;
                                 size_t k2 = j2;
                                 while (k2 < source.length() && (std::isalnum(source[k2]) || source[k2] == '_'))
-                                    thirdWord += source[k2++];
+                                    k2++;
+                                std::string thirdWord = source.substr(j2, k2 - j2);
                                 if (thirdWord == "long")
                                 {
                                     i = k2 - 1;
@@ -209,14 +215,9 @@ public:
                     }
                 }
 
-                if (keywords.count(value))
-                    tokens.emplace_back(keywords.at(value), value, startPos, line);
-                else if (value == "and")
-                    tokens.emplace_back(TokenType::Operator, "&&", startPos, line);
-                else if (value == "or")
-                    tokens.emplace_back(TokenType::Operator, "||", startPos, line);
-                else if (value == "not")
-                    tokens.emplace_back(TokenType::Operator, "!", startPos, line);
+                auto kw = keywords.find(value);
+                if (kw != keywords.end())
+                    tokens.emplace_back(kw->second.type, kw->second.spelling ? std::string(kw->second.spelling) : value, startPos, line);
                 else
                     tokens.emplace_back(TokenType::Identifier, value, startPos, line);
                 continue;
@@ -335,9 +336,9 @@ public:
             }
 
             // Single char symbols
-            if (simpleSymbols.count(c))
+            if (auto sym = simpleSymbols.find(c); sym != simpleSymbols.end())
             {
-                tokens.emplace_back(simpleSymbols.at(c), std::string(1, c), i, line);
+                tokens.emplace_back(sym->second, std::string(1, c), i, line);
                 continue;
             }
 
@@ -379,291 +380,570 @@ public:
 // ──── Evaluator (Expression::evaluate) ─────────────────────
 // ═══════════════════════════════════════════════════════════
 
-var Expression::evaluate(Scope &scope)
+// Binary operator table — resolved once per call site by Expression::compile()
+inline const std::unordered_map<std::string, BinaryOpFn> &get_binary_ops()
+{
+    static const std::unordered_map<std::string, BinaryOpFn> binaryOps = {
+        {"+", [](const var &a, const var &b) -> var
+         {
+             if (a.is_string() || b.is_string())
+             {
+                 std::string sa = a.is_string() ? a.as_string_unchecked() : a.str();
+                 std::string sb = b.is_string() ? b.as_string_unchecked() : b.str();
+                 return var(sa + sb);
+             }
+             if (a.is_list() && b.is_list())
+                 return a + b;
+             return pythonic::math::add(a, b, Overflow::Promote);
+         }},
+        {"-", [](const var &a, const var &b) -> var
+         { return pythonic::math::sub(a, b, Overflow::Promote); }},
+        {"*", [](const var &a, const var &b) -> var
+         {
+             if (a.is_string() && (b.is_int() || b.is_long() || b.is_long_long()))
+                 return a * b;
+             if (b.is_string() && (a.is_int() || a.is_long() || a.is_long_long()))
+                 return b * a;
+             if (a.is_list() && (b.is_int() || b.is_long() || b.is_long_long()))
+                 return a * b;
+             return pythonic::math::mul(a, b, Overflow::Promote);
+         }},
+        {"/", [](const var &a, const var &b) -> var
+         {
+             double bd = var_to_double(b);
+             if (std::abs(bd) < 1e-15)
+                 throw std::runtime_error("Division by zero");
+             return pythonic::math::div(a, b, Overflow::Promote);
+         }},
+        {"%", [](const var &a, const var &b) -> var
+         {
+             double bd = var_to_double(b);
+             if (std::abs(bd) < 1e-15)
+                 throw std::runtime_error("Modulo by zero");
+             return pythonic::math::mod(a, b, Overflow::Promote);
+         }},
+        {"^", [](const var &a, const var &b) -> var
+         { return pythonic::math::pow(a, b, Overflow::Promote); }},
+        {"==", [](const var &a, const var &b) -> var
+         {
+             if (a.is_string() && b.is_string())
+                 return var(a.as_string_unchecked() == b.as_string_unchecked());
+             if (a.is_none() || b.is_none())
+                 return var(a.is_none() && b.is_none());
+             if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
+                 a.is_dict() || b.is_dict())
+                 return var(a == b);
+             double ad = var_to_double(a), bd = var_to_double(b);
+             return var(std::abs(ad - bd) < 1e-9);
+         }},
+        {"!=", [](const var &a, const var &b) -> var
+         {
+             if (a.is_string() && b.is_string())
+                 return var(a.as_string_unchecked() != b.as_string_unchecked());
+             if (a.is_none() || b.is_none())
+                 return var(!(a.is_none() && b.is_none()));
+             if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
+                 a.is_dict() || b.is_dict())
+                 return var(a != b);
+             double ad = var_to_double(a), bd = var_to_double(b);
+             return var(std::abs(ad - bd) > 1e-9);
+         }},
+        {"<", [](const var &a, const var &b) -> var
+         { return var(var_to_double(a) < var_to_double(b)); }},
+        {">", [](const var &a, const var &b) -> var
+         { return var(var_to_double(a) > var_to_double(b)); }},
+        {"<=", [](const var &a, const var &b) -> var
+         { return var(var_to_double(a) <= var_to_double(b)); }},
+        {">=", [](const var &a, const var &b) -> var
+         { return var(var_to_double(a) >= var_to_double(b)); }},
+        {"is", [](const var &a, const var &b) -> var
+         {
+             // Value-based equality (like ==)
+             if (a.is_string() && b.is_string())
+                 return var(a.as_string_unchecked() == b.as_string_unchecked());
+             if (a.is_none() || b.is_none())
+                 return var(a.is_none() && b.is_none());
+             if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
+                 a.is_dict() || b.is_dict())
+                 return var(a == b);
+             double ad = var_to_double(a), bd = var_to_double(b);
+             return var(std::abs(ad - bd) < 1e-9);
+         }},
+        {"is not", [](const var &a, const var &b) -> var
+         {
+             // Value-based inequality (like !=)
+             if (a.is_string() && b.is_string())
+                 return var(a.as_string_unchecked() != b.as_string_unchecked());
+             if (a.is_none() || b.is_none())
+                 return var(!(a.is_none() && b.is_none()));
+             if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
+                 a.is_dict() || b.is_dict())
+                 return var(a != b);
+             double ad = var_to_double(a), bd = var_to_double(b);
+             return var(std::abs(ad - bd) > 1e-9);
+         }},
+        {"points", [](const var &a, const var &b) -> var
+         {
+             // Identity/reference check — in a value-semantics language,
+             // containers are always copies, so this checks if two vars
+             // hold the exact same type + value (stricter than ==, no tolerance).
+             if (a.type() != b.type())
+                 return var(false);
+             if (a.is_none() && b.is_none())
+                 return var(true);
+             if (a.is_bool() && b.is_bool())
+                 return var(a.as_bool_unchecked() == b.as_bool_unchecked());
+             if (a.is_int() && b.is_int())
+                 return var(a.as_int_unchecked() == b.as_int_unchecked());
+             if (a.is_string() && b.is_string())
+                 return var(a.as_string_unchecked() == b.as_string_unchecked());
+             // For containers: value compare (since all vars are value types)
+             return var(a == b);
+         }},
+        {"not points", [](const var &a, const var &b) -> var
+         {
+             if (a.type() != b.type())
+                 return var(true);
+             if (a.is_none() && b.is_none())
+                 return var(false);
+             if (a.is_bool() && b.is_bool())
+                 return var(a.as_bool_unchecked() != b.as_bool_unchecked());
+             if (a.is_int() && b.is_int())
+                 return var(a.as_int_unchecked() != b.as_int_unchecked());
+             if (a.is_string() && b.is_string())
+                 return var(a.as_string_unchecked() != b.as_string_unchecked());
+             return var(a != b);
+         }},
+        {"&&", [](const var &a, const var &b) -> var
+         { return var(static_cast<bool>(a) && static_cast<bool>(b)); }},
+        {"||", [](const var &a, const var &b) -> var
+         { return var(static_cast<bool>(a) || static_cast<bool>(b)); }},
+        {"->", [](const var &a, const var &b) -> var
+         {
+             // Edge spec: directed edge from a to b
+             Dict d;
+             d["__from__"] = a;
+             d["__to__"] = b;
+             d["__dir__"] = var("directed");
+             return var(std::move(d));
+         }},
+        {"<->", [](const var &a, const var &b) -> var
+         {
+             // Edge spec: bidirectional edge between a and b
+             Dict d;
+             d["__from__"] = a;
+             d["__to__"] = b;
+             d["__dir__"] = var("bidirectional");
+             return var(std::move(d));
+         }},
+        {"---", [](const var &a, const var &b) -> var
+         {
+             // Edge spec: undirected edge between a and b
+             Dict d;
+             d["__from__"] = a;
+             d["__to__"] = b;
+             d["__dir__"] = var("undirected");
+             return var(std::move(d));
+         }},
+    };
+    return binaryOps;
+}
+
+inline IntOp get_int_op(const std::string &op)
+{
+    static const std::unordered_map<std::string, IntOp> intOps = {
+        {"+", IntOp::Add}, {"-", IntOp::Sub}, {"*", IntOp::Mul}, {"<", IntOp::Lt}, {">", IntOp::Gt}, {"<=", IntOp::Le}, {">=", IntOp::Ge}, {"==", IntOp::Eq}, {"!=", IntOp::Ne}, {"is", IntOp::Eq}, {"is not", IntOp::Ne}, {"points", IntOp::Eq}, {"not points", IntOp::Ne}};
+    auto it = intOps.find(op);
+    return it == intOps.end() ? IntOp::None : it->second;
+}
+
+// int × int without the generic dispatch. Gives the same result as the
+// binaryOps entry; returns false (caller falls back) when +, - or * would
+// overflow int and need promotion.
+inline bool int_binary(IntOp op, int x, int y, var &out)
+{
+    int r;
+    switch (op)
+    {
+    case IntOp::Add:
+        if (__builtin_add_overflow(x, y, &r))
+            return false;
+        out = var(r);
+        return true;
+    case IntOp::Sub:
+        if (__builtin_sub_overflow(x, y, &r))
+            return false;
+        out = var(r);
+        return true;
+    case IntOp::Mul:
+        if (__builtin_mul_overflow(x, y, &r))
+            return false;
+        out = var(r);
+        return true;
+    case IntOp::Lt:
+        out = var(x < y);
+        return true;
+    case IntOp::Gt:
+        out = var(x > y);
+        return true;
+    case IntOp::Le:
+        out = var(x <= y);
+        return true;
+    case IntOp::Ge:
+        out = var(x >= y);
+        return true;
+    case IntOp::Eq:
+        out = var(x == y);
+        return true;
+    case IntOp::Ne:
+        out = var(x != y);
+        return true;
+    default:
+        return false;
+    }
+}
+
+// Number literal → var: doubles if there is a '.', else int, widening to long long
+inline var decode_number(const std::string &text)
+{
+    if (text.find('.') != std::string::npos)
+        return var(std::stod(text));
+    try
+    {
+        return var(std::stoi(text));
+    }
+    catch (...)
+    {
+        return var((long long)std::stoll(text));
+    }
+}
+
+// Payload equality of two same-tag shareable constants. Compares the raw
+// values instead of going through var::operator== (None == None has no Eq
+// dispatch entry and throws).
+inline bool same_const_payload(const var &a, const var &b)
 {
-    // Short-circuit evaluation for logical operators
-    if (!logicalOp.empty() && lhs && rhs)
+    if (a.is_none())
+        return true;
+    if (a.is_bool())
+        return a.var_get<bool>() == b.var_get<bool>();
+    if (a.is_int())
+        return a.var_get<int>() == b.var_get<int>();
+    if (a.is_long())
+        return a.var_get<long>() == b.var_get<long>();
+    if (a.is_long_long())
+        return a.var_get<long long>() == b.var_get<long long>();
+    return a.var_get<std::string>() == b.var_get<std::string>();
+}
+
+// Add v to an expression's constant pool, reusing an existing entry for an
+// identical int, bool, None or string. Floating-point values are never merged
+// (-0.0 == 0.0, NaN != NaN).
+inline int intern_const(std::vector<var> &consts, var v)
+{
+    bool shareable = v.is_int() || v.is_long() || v.is_long_long() ||
+                     v.is_bool() || v.is_none() || v.is_string();
+    if (shareable)
+        for (size_t i = 0; i < consts.size(); ++i)
+            if (consts[i].type_tag() == v.type_tag() && same_const_payload(consts[i], v))
+                return (int)i;
+    consts.push_back(std::move(v));
+    return (int)consts.size() - 1;
+}
+
+// Constant folding: if the instruction just emitted is a pure operator whose
+// operands are all Const, evaluate it now and replace the run with one Const.
+// Anything that throws (e.g. division by zero) is left to fail at run time.
+inline void fold_constant_tail(std::vector<Instr> &code, std::vector<var> &consts)
+{
+    const Instr &last = code.back();
+    size_t operands = 0;
+    if (last.op == OpCode::Binary && last.fn)
+        operands = 2;
+    else if (last.op == OpCode::Neg)
+        operands = 1;
+    if (operands == 0 || code.size() <= operands)
+        return;
+    size_t first = code.size() - 1 - operands;
+    for (size_t i = first; i < code.size() - 1; ++i)
+        if (code[i].op != OpCode::Const)
+            return;
+
+    // String/list repetition is left to run time: its result can be
+    // arbitrarily large and would be built here even on a branch never taken
+    if (last.op == OpCode::Binary && last.tok && last.tok->value == "*")
+    {
+        const var &a = consts[code[first].arg];
+        const var &b = consts[code[first + 1].arg];
+        if (a.is_string() || b.is_string() || a.is_list() || b.is_list())
+            return;
+    }
+
+    var result;
+    try
     {
-        var leftVal = lhs->evaluate(scope);
-        if (logicalOp == "&&")
+        if (last.op == OpCode::Binary)
+            result = last.fn(consts[code[first].arg], consts[code[first + 1].arg]);
+        else
         {
-            if (!static_cast<bool>(leftVal))
-                return var(false);
-            return var(static_cast<bool>(rhs->evaluate(scope)));
+            const var &a = consts[code[first].arg];
+            result = a.is_int() ? var(-a.as_int_unchecked()) : var(-var_to_double(a));
         }
-        else
+    }
+    catch (...)
+    {
+        return;
+    }
+
+    // Drop operand constants from the pool when they are its newest,
+    // otherwise-unreferenced entries
+    Instr folded{OpCode::Const, 0, last.tok};
+    for (size_t i = code.size() - 1; i-- > first;)
+    {
+        int idx = code[i].arg;
+        bool shared = std::any_of(code.begin(), code.begin() + first, [idx](const Instr &c)
+                                  { return c.op == OpCode::Const && c.arg == idx; });
+        if (idx == (int)consts.size() - 1 && !shared)
+            consts.pop_back();
+    }
+    folded.arg = intern_const(consts, std::move(result));
+    code.resize(first);
+    code.push_back(folded);
+}
+
+void Expression::compile()
+{
+    code.clear();
+    consts.clear();
+    lower(*this);
+    compiled = true;
+}
+
+// Append e's instructions to this expression's code/consts
+void Expression::lower(const Expression &e)
+{
+    if (!e.logicalOp.empty() && e.lhs && e.rhs)
+    {
+        // a && b  →  <a> JumpIfFalse end <b> ToBool end:   (|| uses JumpIfTrue)
+        static const Token andTok(TokenType::Operator, "&&", -1, -1);
+        static const Token orTok(TokenType::Operator, "||", -1, -1);
+        bool isAnd = e.logicalOp == "&&";
+        const Token *opTok = isAnd ? &andTok : &orTok;
+        lower(*e.lhs);
+        size_t jump = code.size();
+        code.push_back(Instr{isAnd ? OpCode::JumpIfFalse : OpCode::JumpIfTrue, 0, opTok});
+        lower(*e.rhs);
+        code.push_back(Instr{OpCode::ToBool, 0, opTok});
+        code[jump].arg = (int)code.size();
+        return;
+    }
+
+    const auto &binaryOps = get_binary_ops();
+    const auto &mathOps = get_math_ops();
+    const auto &builtins = get_builtins();
+    for (const Token &token : e.rpn)
+    {
+        Instr in{OpCode::Const, 0, &token};
+        switch (token.type)
+        {
+        case TokenType::Number:
+            try
+            {
+                in.arg = intern_const(consts, decode_number(token.value));
+            }
+            catch (...)
+            {
+                in.op = OpCode::Literal; // keep the error at its original point of evaluation
+            }
+            break;
+        case TokenType::String:
+            in.arg = intern_const(consts, var(token.value));
+            break;
+        case TokenType::Identifier:
+            if (token.value == "True")
+                in.arg = intern_const(consts, var(true));
+            else if (token.value == "False")
+                in.arg = intern_const(consts, var(false));
+            else if (token.value == "None")
+                in.arg = intern_const(consts, var(NoneType{}));
+            else
+                in.op = OpCode::Name;
+            break;
+        case TokenType::Operator:
+            if (token.value == "~")
+                in.op = OpCode::Neg;
+            else if (token.value == "!")
+                in.op = OpCode::Not;
+            else
+            {
+                in.op = OpCode::Binary;
+                auto it = binaryOps.find(token.value);
+                if (it != binaryOps.end())
+                {
+                    in.fn = it->second;
+                    in.intOp = get_int_op(token.value);
+                }
+            }
+            break;
+        case TokenType::LeftBracket:
+            if (token.value != "LIST")
+                continue;
+            in.op = OpCode::List;
+            in.arg = token.position;
+            break;
+        case TokenType::LeftBrace:
+            if (token.value == "SET")
+                in.op = OpCode::Set;
+            else if (token.value == "DICT")
+                in.op = OpCode::Dict;
+            else
+                continue;
+            in.arg = token.position;
+            break;
+        case TokenType::At:
+            in.op = OpCode::Method;
+            in.arg = token.position;
+            break;
+        case TokenType::KeywordFn:
         {
-            if (static_cast<bool>(leftVal))
-                return var(true);
-            return var(static_cast<bool>(rhs->evaluate(scope)));
+            // Resolve the callee kind once: math, then builtin, then user-defined
+            in.arg = token.position;
+            if (is_math_function(token.value))
+            {
+                in.op = OpCode::Math;
+                auto it = mathOps.find(token.value);
+                if (it != mathOps.end())
+                    in.mathFn = it->second;
+            }
+            else
+            {
+                auto it = builtins.find(token.value);
+                if (it != builtins.end())
+                {
+                    in.op = OpCode::Builtin;
+                    in.builtin = &it->second;
+                }
+                else
+                    in.op = OpCode::Call;
+            }
+            break;
+        }
+        default:
+            continue; // not an evaluable token
         }
+        code.push_back(in);
+        fold_constant_tail(code, consts);
     }
+}
 
-    std::stack<var> stk;
-    std::stack<std::string> nameStk; // tracks source variable name for pass-by-ref
+var Expression::evaluate(Scope &scope)
+{
+    if (!compiled)
+        compile();
 
-    auto pushVal = [&](const var &v, const std::string &name = "")
+    // Literals, folded constants and bare names skip the stack machinery
+    if (code.size() == 1)
     {
-        stk.push(v);
+        if (code[0].op == OpCode::Const)
+            return consts[code[0].arg];
+        if (code[0].op == OpCode::Name)
+            return scope.get(code[0].tok->value);
+    }
+
+    // Operand stack, sized up front: no instruction pushes more than one value
+    std::vector<var> stackBuf;
+    stackBuf.reserve(code.size());
+    EvalStack stk(std::move(stackBuf));
+    // Source variable name of each stack slot for pass-by-ref (nullptr = none);
+    // names point at rpn tokens, which outlive this call
+    std::vector<const std::string *> nameBuf;
+    nameBuf.reserve(code.size());
+    std::stack<const std::string *, std::vector<const std::string *>> nameStk(std::move(nameBuf));
+
+    auto pushVal = [&](var v, const std::string *name = nullptr)
+    {
+        stk.push(std::move(v));
         nameStk.push(name);
     };
     auto popVal = [&]() -> var
     {
-        var v = stk.top();
+        var v = std::move(stk.top());
         stk.pop();
         if (!nameStk.empty())
             nameStk.pop();
         return v;
     };
-    auto topName = [&]() -> std::string
+    auto topName = [&]() -> const std::string *
     {
-        return nameStk.empty() ? "" : nameStk.top();
+        return nameStk.empty() ? nullptr : nameStk.top();
     };
 
-    for (const auto &token : rpn)
+    size_t pc = 0;
+    while (pc < code.size())
     {
-        if (token.type == TokenType::Number)
+        const Instr &in = code[pc++];
+        const Token &token = *in.tok;
+        switch (in.op)
         {
-            if (token.value.find('.') != std::string::npos)
-                pushVal(var(std::stod(token.value)));
-            else
-            {
-                try
-                {
-                    pushVal(var(std::stoi(token.value)));
-                }
-                catch (...)
-                {
-                    pushVal(var((long long)std::stoll(token.value)));
-                }
-            }
-        }
-        else if (token.type == TokenType::String)
+        case OpCode::Const:
+            pushVal(consts[in.arg]);
+            break;
+        case OpCode::Literal:
+            pushVal(decode_number(token.value));
+            break;
+        case OpCode::Name:
+            pushVal(scope.get(token.value), &token.value);
+            break;
+        case OpCode::Neg:
         {
-            pushVal(var(token.value));
+            if (stk.empty())
+                throw std::runtime_error("Stack underflow for unary '~' at line " + std::to_string(token.line));
+            var a = popVal();
+            if (a.is_int())
+                pushVal(var(-a.as_int_unchecked()));
+            else
+                pushVal(var(-var_to_double(a)));
+            break;
         }
-        else if (token.type == TokenType::Identifier)
+        case OpCode::Not:
         {
-            if (token.value == "True")
-                pushVal(var(true));
-            else if (token.value == "False")
-                pushVal(var(false));
-            else if (token.value == "None")
-                pushVal(var(NoneType{}));
-            else
-                pushVal(scope.get(token.value), token.value);
+            if (stk.empty())
+                throw std::runtime_error("Stack underflow for unary '!' at line " + std::to_string(token.line));
+            var a = popVal();
+            pushVal(var(!static_cast<bool>(a)));
+            break;
         }
-        else if (token.type == TokenType::Operator)
+        case OpCode::Binary:
         {
-            if (token.value == "~")
-            {
-                if (stk.empty())
-                    throw std::runtime_error("Stack underflow for unary '~' at line " + std::to_string(token.line));
-                var a = popVal();
-                if (a.is_int())
-                    pushVal(var(-a.as_int_unchecked()));
-                else
-                    pushVal(var(-var_to_double(a)));
+            if (stk.size() < 2)
+                throw std::runtime_error("Stack underflow for binary operator '" + token.value + "' at line " + std::to_string(token.line));
+            var b = popVal();
+            var a = popVal();
+            if (!in.fn)
+                throw std::runtime_error("Unknown binary operator: " + token.value + " at line " + std::to_string(token.line));
+            if (in.intOp != IntOp::None && a.is_int() && b.is_int())
+            {
+                var r;
+                if (int_binary(in.intOp, a.as_int_unchecked(), b.as_int_unchecked(), r))
+                {
+                    pushVal(std::move(r));
+                    break;
+                }
             }
-            else if (token.value == "!")
+            try
             {
-                if (stk.empty())
-                    throw std::runtime_error("Stack underflow for unary '!' at line " + std::to_string(token.line));
-                var a = popVal();
-                pushVal(var(!static_cast<bool>(a)));
+                pushVal(in.fn(a, b));
             }
-            else
+            catch (const std::runtime_error &e)
             {
-                if (stk.size() < 2)
-                    throw std::runtime_error("Stack underflow for binary operator '" + token.value + "' at line " + std::to_string(token.line));
-                var b = popVal();
-                var a = popVal();
-
-                using BinOp = std::function<var(const var &, const var &)>;
-                static const std::unordered_map<std::string, BinOp> binaryOps = {
-                    {"+", [](const var &a, const var &b) -> var
-                     {
-                         if (a.is_string() || b.is_string())
-                         {
-                             std::string sa = a.is_string() ? a.as_string_unchecked() : a.str();
-                             std::string sb = b.is_string() ? b.as_string_unchecked() : b.str();
-                             return var(sa + sb);
-                         }
-                         if (a.is_list() && b.is_list())
-                             return a + b;
-                         return pythonic::math::add(a, b, Overflow::Promote);
-                     }},
-                    {"-", [](const var &a, const var &b) -> var
-                     { return pythonic::math::sub(a, b, Overflow::Promote); }},
-                    {"*", [](const var &a, const var &b) -> var
-                     {
-                         if (a.is_string() && (b.is_int() || b.is_long() || b.is_long_long()))
-                             return a * b;
-                         if (b.is_string() && (a.is_int() || a.is_long() || a.is_long_long()))
-                             return b * a;
-                         if (a.is_list() && (b.is_int() || b.is_long() || b.is_long_long()))
-                             return a * b;
-                         return pythonic::math::mul(a, b, Overflow::Promote);
-                     }},
-                    {"/", [](const var &a, const var &b) -> var
-                     {
-                         double bd = var_to_double(b);
-                         if (std::abs(bd) < 1e-15)
-                             throw std::runtime_error("Division by zero");
-                         return pythonic::math::div(a, b, Overflow::Promote);
-                     }},
-                    {"%", [](const var &a, const var &b) -> var
-                     {
-                         double bd = var_to_double(b);
-                         if (std::abs(bd) < 1e-15)
-                             throw std::runtime_error("Modulo by zero");
-                         return pythonic::math::mod(a, b, Overflow::Promote);
-                     }},
-                    {"^", [](const var &a, const var &b) -> var
-                     { return pythonic::math::pow(a, b, Overflow::Promote); }},
-                    {"==", [](const var &a, const var &b) -> var
-                     {
-                         if (a.is_string() && b.is_string())
-                             return var(a.as_string_unchecked() == b.as_string_unchecked());
-                         if (a.is_none() || b.is_none())
-                             return var(a.is_none() && b.is_none());
-                         if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
-                             a.is_dict() || b.is_dict())
-                             return var(a == b);
-                         double ad = var_to_double(a), bd = var_to_double(b);
-                         return var(std::abs(ad - bd) < 1e-9);
-                     }},
-                    {"!=", [](const var &a, const var &b) -> var
-                     {
-                         if (a.is_string() && b.is_string())
-                             return var(a.as_string_unchecked() != b.as_string_unchecked());
-                         if (a.is_none() || b.is_none())
-                             return var(!(a.is_none() && b.is_none()));
-                         if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
-                             a.is_dict() || b.is_dict())
-                             return var(a != b);
-                         double ad = var_to_double(a), bd = var_to_double(b);
-                         return var(std::abs(ad - bd) > 1e-9);
-                     }},
-                    {"<", [](const var &a, const var &b) -> var
-                     { return var(var_to_double(a) < var_to_double(b)); }},
-                    {">", [](const var &a, const var &b) -> var
-                     { return var(var_to_double(a) > var_to_double(b)); }},
-                    {"<=", [](const var &a, const var &b) -> var
-                     { return var(var_to_double(a) <= var_to_double(b)); }},
-                    {">=", [](const var &a, const var &b) -> var
-                     { return var(var_to_double(a) >= var_to_double(b)); }},
-                    {"is", [](const var &a, const var &b) -> var
-                     {
-                         // Value-based equality (like ==)
-                         if (a.is_string() && b.is_string())
-                             return var(a.as_string_unchecked() == b.as_string_unchecked());
-                         if (a.is_none() || b.is_none())
-                             return var(a.is_none() && b.is_none());
-                         if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
-                             a.is_dict() || b.is_dict())
-                             return var(a == b);
-                         double ad = var_to_double(a), bd = var_to_double(b);
-                         return var(std::abs(ad - bd) < 1e-9);
-                     }},
-                    {"is not", [](const var &a, const var &b) -> var
-                     {
-                         // Value-based inequality (like !=)
-                         if (a.is_string() && b.is_string())
-                             return var(a.as_string_unchecked() != b.as_string_unchecked());
-                         if (a.is_none() || b.is_none())
-                             return var(!(a.is_none() && b.is_none()));
-                         if (a.is_list() || b.is_list() || a.is_set() || b.is_set() ||
-                             a.is_dict() || b.is_dict())
-                             return var(a != b);
-                         double ad = var_to_double(a), bd = var_to_double(b);
-                         return var(std::abs(ad - bd) > 1e-9);
-                     }},
-                    {"points", [](const var &a, const var &b) -> var
-                     {
-                         // Identity/reference check — in a value-semantics language,
-                         // containers are always copies, so this checks if two vars
-                         // hold the exact same type + value (stricter than ==, no tolerance).
-                         if (a.type() != b.type())
-                             return var(false);
-                         if (a.is_none() && b.is_none())
-                             return var(true);
-                         if (a.is_bool() && b.is_bool())
-                             return var(a.as_bool_unchecked() == b.as_bool_unchecked());
-                         if (a.is_int() && b.is_int())
-                             return var(a.as_int_unchecked() == b.as_int_unchecked());
-                         if (a.is_string() && b.is_string())
-                             return var(a.as_string_unchecked() == b.as_string_unchecked());
-                         // For containers: value compare (since all vars are value types)
-                         return var(a == b);
-                     }},
-                    {"not points", [](const var &a, const var &b) -> var
-                     {
-                         if (a.type() != b.type())
-                             return var(true);
-                         if (a.is_none() && b.is_none())
-                             return var(false);
-                         if (a.is_bool() && b.is_bool())
-                             return var(a.as_bool_unchecked() != b.as_bool_unchecked());
-                         if (a.is_int() && b.is_int())
-                             return var(a.as_int_unchecked() != b.as_int_unchecked());
-                         if (a.is_string() && b.is_string())
-                             return var(a.as_string_unchecked() != b.as_string_unchecked());
-                         return var(a != b);
-                     }},
-                    {"&&", [](const var &a, const var &b) -> var
-                     { return var(static_cast<bool>(a) && static_cast<bool>(b)); }},
-                    {"||", [](const var &a, const var &b) -> var
-                     { return var(static_cast<bool>(a) || static_cast<bool>(b)); }},
-                    {"->", [](const var &a, const var &b) -> var
-                     {
-                         // Edge spec: directed edge from a to b
-                         Dict d;
-                         d["__from__"] = a;
-                         d["__to__"] = b;
-                         d["__dir__"] = var("directed");
-                         return var(std::move(d));
-                     }},
-                    {"<->", [](const var &a, const var &b) -> var
-                     {
-                         // Edge spec: bidirectional edge between a and b
-                         Dict d;
-                         d["__from__"] = a;
-                         d["__to__"] = b;
-                         d["__dir__"] = var("bidirectional");
-                         return var(std::move(d));
-                     }},
-                    {"---", [](const var &a, const var &b) -> var
-                     {
-                         // Edge spec: undirected edge between a and b
-                         Dict d;
-                         d["__from__"] = a;
-                         d["__to__"] = b;
-                         d["__dir__"] = var("undirected");
-                         return var(std::move(d));
-                     }},
-                };
-
-                auto opIt = binaryOps.find(token.value);
-                if (opIt != binaryOps.end())
-                {
-                    try
-                    {
-                        pushVal(opIt->second(a, b));
-                    }
-                    catch (const std::runtime_error &e)
-                    {
-                        throw std::runtime_error(std::string(e.what()) + " at line " + std::to_string(token.line));
-                    }
-                }
-                else
-                    throw std::runtime_error("Unknown binary operator: " + token.value + " at line " + std::to_string(token.line));
+                throw std::runtime_error(std::string(e.what()) + " at line " + std::to_string(token.line));
             }
+            break;
         }
         // List literal
-        else if (token.type == TokenType::LeftBracket && token.value == "LIST")
+        case OpCode::List:
         {
-            int count = token.position;
+            int count = in.arg;
             std::vector<var> temp;
             for (int i = 0; i < count; ++i)
             {
@@ -676,11 +956,12 @@ var Expression::evaluate(Scope &scope)
             std::reverse(temp.begin(), temp.end());
             List items(temp.begin(), temp.end());
             pushVal(var(std::move(items)));
+            break;
         }
         // Set literal
-        else if (token.type == TokenType::LeftBrace && token.value == "SET")
+        case OpCode::Set:
         {
-            int count = token.position;
+            int count = in.arg;
             Set items;
             for (int i = 0; i < count; ++i)
             {
@@ -691,11 +972,12 @@ var Expression::evaluate(Scope &scope)
                 stk.pop();
             }
             pushVal(var(std::move(items)));
+            break;
         }
         // Dict literal {key -> value, ...}
-        else if (token.type == TokenType::LeftBrace && token.value == "DICT")
+        case OpCode::Dict:
         {
-            int count = token.position; // number of key-value pairs
+            int count = in.arg; // number of key-value pairs
             std::vector<std::pair<var, var>> pairs;
             for (int i = 0; i < count; ++i)
             {
@@ -713,12 +995,13 @@ var Expression::evaluate(Scope &scope)
                 d[key] = p.second;
             }
             pushVal(var(std::move(d)));
+            break;
         }
         // ── Method call via dtype dispatch ──
-        else if (token.type == TokenType::At)
+        case OpCode::Method:
         {
-            std::string method = token.value;
-            int argc = token.position;
+            const std::string &method = token.value;
+            int argc = in.arg;
 
             std::vector<var> args;
             for (int i = 0; i < argc; ++i)
@@ -731,18 +1014,18 @@ var Expression::evaluate(Scope &scope)
 
             if (stk.empty())
                 throw std::runtime_error("Stack underflow for method call (no object) at line " + std::to_string(token.line));
-            std::string selfName = topName();
+            const std::string *selfName = topName();
             var self = popVal();
 
             var result = dispatch_method(self, method, args);
 
             // Write back mutations to the original scope variable
             // (methods like clear(), append(), etc. mutate `self` in-place)
-            if (!selfName.empty())
+            if (selfName)
             {
                 try
                 {
-                    scope.set(selfName, self);
+                    scope.set(*selfName, self);
                 }
                 catch (...)
                 {
@@ -750,69 +1033,94 @@ var Expression::evaluate(Scope &scope)
             }
 
             pushVal(result);
+            break;
         }
-        // ── Function calls ──
-        else if (token.type == TokenType::KeywordFn)
+        // ── Short-circuit && / || ──
+        case OpCode::JumpIfFalse:
+        case OpCode::JumpIfTrue:
         {
-            std::string fname = token.value;
-            int argc = token.position;
-            int callLine = token.line;
-
-            if (is_math_function(fname))
+            // An operand that left nothing on the stack evaluates to 0
+            bool truth = !stk.empty() && static_cast<bool>(popVal());
+            if (truth == (in.op == OpCode::JumpIfTrue))
             {
-                try
+                pushVal(var(truth));
+                pc = in.arg;
+            }
+            break;
+        }
+        case OpCode::ToBool:
+        {
+            bool truth = !stk.empty() && static_cast<bool>(popVal());
+            pushVal(var(truth));
+            break;
+        }
+        // ── Function calls ──
+        case OpCode::Math:
+            try
+            {
+                if (in.mathFn)
                 {
-                    stk.push(dispatch_math(fname, stk));
+                    if (stk.empty())
+                        throw std::runtime_error("Missing arg for " + token.value);
+                    // One value in, one out: nameStk keeps its depth
+                    var arg = stk.top();
+                    stk.pop();
+                    stk.push(in.mathFn(arg));
+                }
+                else
+                {
+                    stk.push(dispatch_math(token.value, stk));
                     // Sync nameStk: math functions may pop args; push empty name for result
                     while (nameStk.size() > stk.size())
                         nameStk.pop();
                     while (nameStk.size() < stk.size())
-                        nameStk.push("");
+                        nameStk.push(nullptr);
                 }
-                catch (const std::runtime_error &e)
-                {
-                    std::string msg = e.what();
-                    if (msg.find("at line") == std::string::npos)
-                        throw std::runtime_error(msg + " at line " + std::to_string(callLine));
-                    throw;
-                }
-                continue;
             }
-
-            const auto &builtins = get_builtins();
-            auto builtinIt = builtins.find(fname);
-            if (builtinIt != builtins.end())
+            catch (const std::runtime_error &e)
             {
-                try
-                {
-                    builtinIt->second(stk, argc);
-                    // Sync nameStk
-                    while (nameStk.size() > stk.size())
-                        nameStk.pop();
-                    while (nameStk.size() < stk.size())
-                        nameStk.push("");
-                }
-                catch (const std::runtime_error &e)
-                {
-                    std::string msg = e.what();
-                    if (msg.find("at line") == std::string::npos)
-                        throw std::runtime_error(msg + " at line " + std::to_string(callLine));
-                    throw;
-                }
-                continue;
+                std::string msg = e.what();
+                if (msg.find("at line") == std::string::npos)
+                    throw std::runtime_error(msg + " at line " + std::to_string(token.line));
+                throw;
             }
+            break;
+        case OpCode::Builtin:
+            try
+            {
+                (*in.builtin)(stk, in.arg);
+                // Sync nameStk
+                while (nameStk.size() > stk.size())
+                    nameStk.pop();
+                while (nameStk.size() < stk.size())
+                    nameStk.push(nullptr);
+            }
+            catch (const std::runtime_error &e)
+            {
+                std::string msg = e.what();
+                if (msg.find("at line") == std::string::npos)
+                    throw std::runtime_error(msg + " at line " + std::to_string(token.line));
+                throw;
+            }
+            break;
+        case OpCode::Call:
+        {
+            const std::string &fname = token.value;
+            int argc = in.arg;
 
             // User-defined function call
             try
             {
-                FunctionDef def = scope.getFunction(fname, argc);
-                if (!def.body)
+                auto def = scope.getFunction(fname, argc);
+                if (!def->body)
                     throw std::runtime_error("Function '" + fname + "' was forward-declared but never defined at line " + std::to_string(token.line));
                 if ((int)stk.size() < argc)
                     throw std::runtime_error("Stack underflow for function args at line " + std::to_string(token.line));
+                if (stack_exhausted())
+                    throw std::runtime_error("Maximum recursion depth exceeded in '" + fname + "' at line " + std::to_string(token.line));
                 Scope funcScope(&scope, true);
                 std::vector<var> args;
-                std::vector<std::string> argNames; // caller variable names for ref params
+                std::vector<const std::string *> argNames; // caller variable names for ref params
                 for (int i = 0; i < argc; ++i)
                 {
                     argNames.push_back(topName());
@@ -820,28 +1128,28 @@ var Expression::evaluate(Scope &scope)
                 }
                 std::reverse(args.begin(), args.end());
                 std::reverse(argNames.begin(), argNames.end());
-                for (size_t i = 0; i < def.params.size(); ++i)
-                    funcScope.define(def.params[i], args[i]);
+                for (size_t i = 0; i < def->params.size(); ++i)
+                    funcScope.define(def->params[i], args[i]);
                 try
                 {
-                    def.body->execute(funcScope);
+                    def->body->execute(funcScope);
                 }
                 catch (ReturnException &ret)
                 {
                     // Write back ref params to caller's scope
-                    for (size_t i = 0; i < def.params.size(); ++i)
+                    for (size_t i = 0; i < def->params.size(); ++i)
                     {
-                        if (i < def.isRefParam.size() && def.isRefParam[i] && !argNames[i].empty())
-                            scope.set(argNames[i], funcScope.get(def.params[i]));
+                        if (i < def->isRefParam.size() && def->isRefParam[i] && argNames[i])
+                            scope.set(*argNames[i], funcScope.get(def->params[i]));
                     }
                     pushVal(ret.value);
                     continue;
                 }
                 // Write back ref params to caller's scope (even if no give)
-                for (size_t i = 0; i < def.params.size(); ++i)
+                for (size_t i = 0; i < def->params.size(); ++i)
                 {
-                    if (i < def.isRefParam.size() && def.isRefParam[i] && !argNames[i].empty())
-                        scope.set(argNames[i], funcScope.get(def.params[i]));
+                    if (i < def->isRefParam.size() && def->isRefParam[i] && argNames[i])
+                        scope.set(*argNames[i], funcScope.get(def->params[i]));
                 }
                 // Function returned without give() → return None
                 pushVal(var(NoneType{}));
@@ -852,6 +1160,8 @@ var Expression::evaluate(Scope &scope)
                     throw std::runtime_error("Unknown function call: " + fname + " at line " + std::to_string(token.line));
                 throw;
             }
+            break;
+        }
         }
     }
 
@@ -899,6 +1209,56 @@ void IfStmt::execute(Scope &scope)
         elseBlock->execute(scope);
 }
 
+// `for i in range(...): s = s + i ;` (or s += i) adds an arithmetic series to s.
+// When every value involved is an integer below 2^53 the double additions the
+// loop would do are exact, so one add of the closed-form sum gives the same
+// value and type. Returns false (caller runs the loop) when the body or the
+// operands do not fit that shape.
+inline bool add_series_closed_form(const ForStmt &loop, Scope &loopScope, double start, double end, double step)
+{
+    if (loop.body->statements.size() != 1)
+        return false;
+    auto assign = std::dynamic_pointer_cast<AssignStmt>(loop.body->statements[0]);
+    if (!assign || assign->isDeclaration || assign->name == loop.iteratorName || !assign->expr->logicalOp.empty())
+        return false;
+    const auto &rpn = assign->expr->rpn;
+    if (rpn.size() != 3 || rpn[0].type != TokenType::Identifier || rpn[1].type != TokenType::Identifier ||
+        rpn[2].type != TokenType::Operator || rpn[2].value != "+")
+        return false;
+    bool accFirst = rpn[0].value == assign->name && rpn[1].value == loop.iteratorName;
+    bool iterFirst = rpn[0].value == loop.iteratorName && rpn[1].value == assign->name;
+    if (!accFirst && !iterFirst)
+        return false;
+
+    constexpr double exact = 9007199254740992.0; // 2^53
+    auto integral = [&](double x)
+    { return std::floor(x) == x && std::abs(x) < exact; };
+    if (!integral(start) || !integral(end) || !integral(step))
+        return false;
+    if (step > 0 ? end < start : end > start)
+        return true; // the loop body never runs
+
+    var acc = loopScope.get(assign->name);
+    if (!acc.is_double() && !pythonic::math::is_signed_integer_type(acc))
+        return false;
+    double accValue = var_to_double(acc);
+    if (!integral(accValue))
+        return false;
+
+    int64_t first = (int64_t)start;
+    int64_t n = (int64_t)((end - start) / step) + 1;
+    int64_t last = first + (n - 1) * (int64_t)step;
+    // Every partial sum is bounded by |s| + n * max(|first|, |last|)
+    long double bound = std::abs((long double)accValue) +
+                        (long double)n * std::max(std::abs((long double)first), std::abs((long double)last));
+    if (bound >= exact)
+        return false;
+    double sum = (double)(n * (first + last) / 2);
+    loopScope.set(assign->name, accFirst ? pythonic::math::add(acc, var(sum), Overflow::Promote)
+                                         : pythonic::math::add(var(sum), acc, Overflow::Promote));
+    return true;
+}
+
 void ForStmt::execute(Scope &scope)
 {
     double start = var_to_double(startExpr->evaluate(scope));
@@ -916,6 +1276,8 @@ void ForStmt::execute(Scope &scope)
     }
     Scope loopScope(&scope);
     loopScope.define(iteratorName, var(start));
+    if (add_series_closed_form(*this, loopScope, start, end, step))
+        return;
     double current = start;
     if (step > 0)
     {
@@ -1071,18 +1433,32 @@ public:
 
     std::shared_ptr<Statement> parseStatement()
     {
-        if (match(TokenType::KeywordIf))
+        // One dispatch on the leading keyword instead of a chain of match() calls
+        while (check(TokenType::Newline))
+            advance();
+        switch (peek().type)
+        {
+        case TokenType::KeywordIf:
+            advance();
             return parseIf();
-        if (match(TokenType::KeywordFor))
+        case TokenType::KeywordFor:
+            advance();
             return parseFor();
-        if (match(TokenType::KeywordWhile))
+        case TokenType::KeywordWhile:
+            advance();
             return parseWhile();
-        if (match(TokenType::KeywordFn))
+        case TokenType::KeywordFn:
+            advance();
             return parseFunction();
-        if (match(TokenType::KeywordGive))
+        case TokenType::KeywordGive:
+            advance();
             return parseReturn();
-        if (match(TokenType::KeywordPass))
+        case TokenType::KeywordPass:
+            advance();
             return parsePass();
+        default:
+            break;
+        }
 
         // let x be expr.  OR  let x be expr : block ;
         if (match(TokenType::KeywordLet))
@@ -1438,7 +1814,7 @@ public:
         return stmt;
     }
 
-    std::shared_ptr<BlockStmt> parseBlock(const std::vector<TokenType> &terminators)
+    std::shared_ptr<BlockStmt> parseBlock(std::initializer_list<TokenType> terminators)
     {
         auto block = std::make_shared<BlockStmt>();
         while (!isAtEnd())
@@ -1543,6 +1919,7 @@ public:
         auto expr = std::make_shared<Expression>();
         std::queue<Token> out;
         std::stack<Token> opStack;
+        int openParens = 0; // LeftParen tokens currently on opStack
         TokenType lastTokenType = TokenType::Eof;
 
         while (!isAtEnd())
@@ -1637,34 +2014,12 @@ public:
 
             if (t.type == TokenType::Operator && (t.value == "&&" || t.value == "||"))
             {
-                bool hasParen = false;
-                auto temp = opStack;
-                while (!temp.empty())
-                {
-                    if (temp.top().type == TokenType::LeftParen)
-                    {
-                        hasParen = true;
-                        break;
-                    }
-                    temp.pop();
-                }
-                if (!hasParen)
+                if (openParens == 0)
                     break;
             }
             if (t.type == TokenType::Comma || t.type == TokenType::RightParen)
             {
-                bool hasParen = false;
-                auto temp = opStack;
-                while (!temp.empty())
-                {
-                    if (temp.top().type == TokenType::LeftParen)
-                    {
-                        hasParen = true;
-                        break;
-                    }
-                    temp.pop();
-                }
-                if (!hasParen)
+                if (openParens == 0)
                     break;
             }
             if (t.type == TokenType::RightBracket || t.type == TokenType::RightBrace)
@@ -1675,18 +2030,7 @@ public:
             if (t.type == TokenType::Identifier && pos + 1 < tokens.size() &&
                 tokens[pos + 1].type == TokenType::Equals)
             {
-                bool hasParen = false;
-                auto temp = opStack;
-                while (!temp.empty())
-                {
-                    if (temp.top().type == TokenType::LeftParen)
-                    {
-                        hasParen = true;
-                        break;
-                    }
-                    temp.pop();
-                }
-                if (!hasParen)
+                if (openParens == 0)
                     break;
             }
 
@@ -1905,7 +2249,10 @@ public:
                 continue;
             }
             else if (token.type == TokenType::LeftParen)
+            {
                 opStack.push(token);
+                openParens++;
+            }
             else if (token.type == TokenType::RightParen)
             {
                 while (!opStack.empty() && opStack.top().type != TokenType::LeftParen)
@@ -1914,7 +2261,10 @@ public:
                     opStack.pop();
                 }
                 if (!opStack.empty())
+                {
                     opStack.pop();
+                    openParens--;
+                }
                 else
                 {
                     pos--;
@@ -1945,23 +2295,33 @@ public:
         return expr;
     }
 
-    void flattenExprToQueue(std::shared_ptr<Expression> expr, std::queue<Token> &out)
+    // Post-order walk (lhs, rhs, op) with an explicit work stack: && / ||
+    // chains nest one level per operand
+    void flattenExprToQueue(const std::shared_ptr<Expression> &expr, std::queue<Token> &out)
     {
-        if (expr->logicalOp.empty())
-            for (auto &t : expr->rpn)
-                out.push(t);
-        else
+        std::vector<std::pair<const Expression *, bool>> work{{expr.get(), false}};
+        while (!work.empty())
         {
-            flattenExprToQueue(expr->lhs, out);
-            flattenExprToQueue(expr->rhs, out);
-            out.push(Token(TokenType::Operator, expr->logicalOp, -1, -1));
+            auto [node, expanded] = work.back();
+            work.pop_back();
+            if (node->logicalOp.empty())
+                for (auto &t : node->rpn)
+                    out.push(t);
+            else if (expanded)
+                out.push(Token(TokenType::Operator, node->logicalOp, -1, -1));
+            else
+            {
+                work.push_back({node, true});
+                work.push_back({node->rhs.get(), false});
+                work.push_back({node->lhs.get(), false});
+            }
         }
     }
 
 private:
     int lastConsumedLine = 1;
-    Token peek() { return pos < tokens.size() ? tokens[pos] : tokens.back(); }
-    Token peekNext()
+    const Token &peek() const { return pos < tokens.size() ? tokens[pos] : tokens.back(); }
+    const Token &peekNext() const
     {
         // Skip over Newline tokens to find the next meaningful token
         size_t nextPos = pos + 1;
@@ -121,6 +121,13 @@ struct FileRegistry
         scriptit_file_internal::FileStore::instance().streams.clear();
     }
 
+    // Close everything and restart handle numbering: the state a new process starts in
+    void reset()
+    {
+        closeAll();
+        nextId_ = 1;
+    }
+
 private:
     int nextId_ = 1;
     std::unordered_map<int, std::unique_ptr<std::fstream>> files_;
@@ -163,20 +170,9 @@ inline bool is_file_var(const var &v, int &outId)
 
 // ─── Math Function Dispatch ─────────────────────────────
 
-inline var dispatch_math(const std::string &fname, std::stack<var> &stk)
+// Single-argument math functions, also resolved per call site by Expression::compile()
+inline const std::unordered_map<std::string, MathFn> &get_math_ops()
 {
-    if (fname == "min" || fname == "max")
-    {
-        if (stk.size() < 2)
-            throw std::runtime_error("Missing args for " + fname);
-        var b = stk.top();
-        stk.pop();
-        var a = stk.top();
-        stk.pop();
-        return fname == "min" ? pythonic::math::min(a, b) : pythonic::math::max(a, b);
-    }
-
-    using MathFn = std::function<var(const var &)>;
     static const std::unordered_map<std::string, MathFn> mathOps = {
         {"sin", [](const var &x)
          { return pythonic::math::sin(x); }},
@@ -213,11 +209,27 @@ inline var dispatch_math(const std::string &fname, std::stack<var> &stk)
         {"csc", [](const var &x)
          { return pythonic::math::csc(x); }},
     };
+    return mathOps;
+}
+
+inline var dispatch_math(const std::string &fname, EvalStack &stk)
+{
+    if (fname == "min" || fname == "max")
+    {
+        if (stk.size() < 2)
+            throw std::runtime_error("Missing args for " + fname);
+        var b = stk.top();
+        stk.pop();
+        var a = stk.top();
+        stk.pop();
+        return fname == "min" ? pythonic::math::min(a, b) : pythonic::math::max(a, b);
+    }
 
     if (stk.empty())
         throw std::runtime_error("Missing arg for " + fname);
     var arg = stk.top();
     stk.pop();
+    const auto &mathOps = get_math_ops();
     auto it = mathOps.find(fname);
     if (it == mathOps.end())
         throw std::runtime_error("Unknown math function: " + fname);
@@ -226,15 +238,13 @@ inline var dispatch_math(const std::string &fname, std::stack<var> &stk)
 
 // ─── Built-in Free Functions ────────────────────────────
 
-using BuiltinFn = std::function<void(std::stack<var> &, int)>;
-
 inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
 {
     static const std::unordered_map<std::string, BuiltinFn> builtins = {
 
         // ── I/O ──────────────────────────────────────
 
-        {"print", [](std::stack<var> &s, int argc)
+        {"print", [](EvalStack &s, int argc)
          {
              std::vector<var> args;
              for (int i = 0; i < argc; ++i)
@@ -255,7 +265,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(NoneType{}));
          }},
 
-        {"pprint", [](std::stack<var> &s, int argc)
+        {"pprint", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("pprint() takes 1 argument");
@@ -265,7 +275,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(NoneType{}));
          }},
 
-        {"input", [](std::stack<var> &s, int argc)
+        {"input", [](EvalStack &s, int argc)
          {
              std::string prompt;
              if (argc >= 1)
@@ -280,6 +290,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              extern bool _scriptit_kernel_mode;
              extern std::streambuf *_scriptit_kernel_real_stdout;
              extern std::string _scriptit_kernel_cell_id;
+             extern bool _scriptit_serve_mode;
 
              if (_scriptit_kernel_mode)
              {
@@ -327,6 +338,12 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
                  }
                  s.push(var(inputText));
              }
+             else if (_scriptit_serve_mode)
+             {
+                 // stdin carries the next snippet; behave like --script at EOF
+                 std::cout << prompt;
+                 s.push(var(std::string()));
+             }
              else
              {
                  std::cout << prompt;
@@ -337,7 +354,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              }
          }},
 
-        {"read", [](std::stack<var> &s, int argc)
+        {"read", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("read(filename) takes exactly 1 argument");
@@ -352,7 +369,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(content));
          }},
 
-        {"readLine", [](std::stack<var> &s, int argc)
+        {"readLine", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("readLine(filename) takes exactly 1 argument");
@@ -370,7 +387,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(std::move(lines)));
          }},
 
-        {"write", [](std::stack<var> &s, int argc)
+        {"write", [](EvalStack &s, int argc)
          {
              if (argc < 2 || argc > 3)
                  throw std::runtime_error("write(filename, data [, mode]) takes 2-3 arguments");
@@ -398,7 +415,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
 
         // ── Type / Conversion ────────────────────────
 
-        {"len", [](std::stack<var> &s, int argc)
+        {"len", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("len() takes exactly 1 argument");
@@ -407,7 +424,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(a.len());
          }},
 
-        {"type", [](std::stack<var> &s, int argc)
+        {"type", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("type() takes exactly 1 argument");
@@ -416,7 +433,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.type()));
          }},
 
-        {"str", [](std::stack<var> &s, int argc)
+        {"str", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("str() takes exactly 1 argument");
@@ -425,7 +442,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.str()));
          }},
 
-        {"int", [](std::stack<var> &s, int argc)
+        {"int", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("int() takes exactly 1 argument");
@@ -434,7 +451,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toInt()));
          }},
 
-        {"float", [](std::stack<var> &s, int argc)
+        {"float", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("float() takes exactly 1 argument");
@@ -443,7 +460,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toFloat()));
          }},
 
-        {"double", [](std::stack<var> &s, int argc)
+        {"double", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("double() takes exactly 1 argument");
@@ -452,7 +469,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toDouble()));
          }},
 
-        {"long", [](std::stack<var> &s, int argc)
+        {"long", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("long() takes exactly 1 argument");
@@ -461,7 +478,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toLong()));
          }},
 
-        {"long_long", [](std::stack<var> &s, int argc)
+        {"long_long", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("long_long() takes exactly 1 argument");
@@ -470,7 +487,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toLongLong()));
          }},
 
-        {"long_double", [](std::stack<var> &s, int argc)
+        {"long_double", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("long_double() takes exactly 1 argument");
@@ -479,7 +496,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toLongDouble()));
          }},
 
-        {"uint", [](std::stack<var> &s, int argc)
+        {"uint", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("uint() takes exactly 1 argument");
@@ -488,7 +505,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toUInt()));
          }},
 
-        {"ulong", [](std::stack<var> &s, int argc)
+        {"ulong", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("ulong() takes exactly 1 argument");
@@ -497,7 +514,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toULong()));
          }},
 
-        {"ulong_long", [](std::stack<var> &s, int argc)
+        {"ulong_long", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("ulong_long() takes exactly 1 argument");
@@ -506,7 +523,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.toULongLong()));
          }},
 
-        {"auto_numeric", [](std::stack<var> &s, int argc)
+        {"auto_numeric", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("auto_numeric() takes exactly 1 argument");
@@ -515,7 +532,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(pythonic::vars::AutoNumeric(a));
          }},
 
-        {"bool", [](std::stack<var> &s, int argc)
+        {"bool", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("bool() takes exactly 1 argument");
@@ -524,7 +541,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(static_cast<bool>(a)));
          }},
 
-        {"repr", [](std::stack<var> &s, int argc)
+        {"repr", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("repr() takes exactly 1 argument");
@@ -533,7 +550,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(a.pretty_str()));
          }},
 
-        {"isinstance", [](std::stack<var> &s, int argc)
+        {"isinstance", [](EvalStack &s, int argc)
          {
              if (argc != 2)
                  throw std::runtime_error("isinstance(obj, type_name) takes exactly 2 arguments");
@@ -547,7 +564,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
 
         // ── Container Constructors ───────────────────
 
-        {"list", [](std::stack<var> &s, int argc)
+        {"list", [](EvalStack &s, int argc)
          {
              if (argc == 0)
              {
@@ -559,7 +576,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(a);
          }},
 
-        {"set", [](std::stack<var> &s, int argc)
+        {"set", [](EvalStack &s, int argc)
          {
              if (argc == 0)
              {
@@ -571,7 +588,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(a);
          }},
 
-        {"dict", [](std::stack<var> &s, int argc)
+        {"dict", [](EvalStack &s, int argc)
          {
              if (argc == 0)
              {
@@ -584,7 +601,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
          }},
 
         // ── Graph Constructor ────────────────────────
-        {"graph", [](std::stack<var> &s, int argc)
+        {"graph", [](EvalStack &s, int argc)
          {
              if (argc == 0)
              {
@@ -606,7 +623,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              throw std::runtime_error("graph() takes 0 or 1 argument (node count)");
          }},
 
-        {"range_list", [](std::stack<var> &s, int argc)
+        {"range_list", [](EvalStack &s, int argc)
          {
              if (argc != 2)
                  throw std::runtime_error("range_list(start, end) takes exactly 2 arguments");
@@ -627,7 +644,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
 
         // ── Container free functions ─────────────────
 
-        {"append", [](std::stack<var> &s, int argc)
+        {"append", [](EvalStack &s, int argc)
          {
              if (argc != 2)
                  throw std::runtime_error("append(list, item) takes exactly 2 arguments");
@@ -641,7 +658,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(lst);
          }},
 
-        {"pop", [](std::stack<var> &s, int argc)
+        {"pop", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("pop() takes exactly 1 argument");
@@ -654,7 +671,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
 
         // ── Functional / Iteration ───────────────────
 
-        {"sum", [](std::stack<var> &s, int argc)
+        {"sum", [](EvalStack &s, int argc)
          {
              if (argc < 1 || argc > 2)
                  throw std::runtime_error("sum(iterable[, start]) takes 1-2 arguments");
@@ -674,7 +691,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(total);
          }},
 
-        {"sorted", [](std::stack<var> &s, int argc)
+        {"sorted", [](EvalStack &s, int argc)
          {
              if (argc < 1 || argc > 2)
                  throw std::runtime_error("sorted(iterable[, reverse]) takes 1-2 arguments");
@@ -697,7 +714,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(std::move(sorted_list)));
          }},
 
-        {"reversed", [](std::stack<var> &s, int argc)
+        {"reversed", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("reversed() takes exactly 1 argument");
@@ -706,7 +723,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(lst.reverse());
          }},
 
-        {"all", [](std::stack<var> &s, int argc)
+        {"all", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("all() takes exactly 1 argument");
@@ -723,7 +740,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(true));
          }},
 
-        {"any", [](std::stack<var> &s, int argc)
+        {"any", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("any() takes exactly 1 argument");
@@ -740,7 +757,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(false));
          }},
 
-        {"enumerate", [](std::stack<var> &s, int argc)
+        {"enumerate", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("enumerate() takes exactly 1 argument");
@@ -759,7 +776,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(std::move(result)));
          }},
 
-        {"zip", [](std::stack<var> &s, int argc)
+        {"zip", [](EvalStack &s, int argc)
          {
              if (argc != 2)
                  throw std::runtime_error("zip() takes exactly 2 arguments");
@@ -781,7 +798,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(var(std::move(result)));
          }},
 
-        {"map", [](std::stack<var> &s, int argc)
+        {"map", [](EvalStack &s, int argc)
          {
              // map(func_name, list) — limited: placeholder for now
              if (argc != 2)
@@ -795,7 +812,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
 
         // ── Math free functions ──────────────────────
 
-        {"abs", [](std::stack<var> &s, int argc)
+        {"abs", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("abs() takes exactly 1 argument");
@@ -806,7 +823,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
 
         // ── File I/O free functions ──────────────────
 
-        {"open", [](std::stack<var> &s, int argc)
+        {"open", [](EvalStack &s, int argc)
          {
              if (argc < 1 || argc > 2)
                  throw std::runtime_error("open(path[, mode]) takes 1-2 arguments");
@@ -824,7 +841,7 @@ inline const std::unordered_map<std::string, BuiltinFn> &get_builtins()
              s.push(make_file_var(id));
          }},
 
-        {"close", [](std::stack<var> &s, int argc)
+        {"close", [](EvalStack &s, int argc)
          {
              if (argc != 1)
                  throw std::runtime_error("close(file) takes exactly 1 argument");
@@ -19,6 +19,7 @@
 #include <cstdlib>
 #include <fstream>
 #include <sstream>
+#include <sys/resource.h> // getrlimit, for the native stack guard
 
 #include "../pythonicVars.hpp"
 #include "../pythonicMath.hpp"
@@ -196,12 +197,75 @@ struct Statement : ASTNode
     virtual void execute(Scope &scope) = 0;
 };
 
+// ─── Compiled Expressions ─────────────────────────────────
+// An Expression's RPN is lowered once, on first evaluation, into a flat list
+// of Instr: operator strings are resolved to function pointers and number
+// and string literals are decoded into a per-expression constant pool. A logicalOp node
+// inlines both operand trees and joins them with a conditional jump.
+
+using BinaryOpFn = var (*)(const var &, const var &);
+using MathFn = var (*)(const var &);
+using EvalStack = std::stack<var, std::vector<var>>; // vector-backed: no deque block per evaluation
+using BuiltinFn = std::function<void(EvalStack &, int)>;
+
+enum class OpCode : uint8_t
+{
+    Const,   // push consts[arg]
+    Literal, // number literal that failed to decode at compile time (re-decoded, and throws, at run time)
+    Name,    // push a variable (literals, True/False/None are Const)
+    Neg,     // unary ~
+    Not,     // unary !
+    Binary,  // fn(a, b)
+    List,    // arg = element count
+    Set,     // arg = element count
+    Dict,    // arg = key/value pair count
+    Method,  // arg = argc
+    Math,    // math function; mathFn(x), or dispatch_math() for min/max and unmapped names
+    Builtin, // (*builtin)(stack, arg)
+    Call,    // user-defined function, arg = argc
+    // Short-circuit && / || lowered from logicalOp trees
+    JumpIfFalse, // pop; if falsy push False and jump to arg
+    JumpIfTrue,  // pop; if truthy push True and jump to arg
+    ToBool,      // pop; push its truthiness
+};
+
+// Binary operators with an int × int fast path (Binary instructions only)
+enum class IntOp : uint8_t
+{
+    None,
+    Add,
+    Sub,
+    Mul,
+    Lt,
+    Gt,
+    Le,
+    Ge,
+    Eq,
+    Ne,
+};
+
+struct Instr
+{
+    OpCode op;
+    int arg = 0;             // constant index, element count or argc
+    const Token *tok = nullptr; // originating token (name, operator, line); owned by an rpn in this tree
+    BinaryOpFn fn = nullptr; // Binary only; nullptr = unknown operator
+    IntOp intOp = IntOp::None;
+    MathFn mathFn = nullptr;
+    const BuiltinFn *builtin = nullptr; // points into get_builtins()
+};
+
 struct Expression : ASTNode
 {
     std::vector<Token> rpn;
     std::string logicalOp;
     std::shared_ptr<Expression> lhs;
     std::shared_ptr<Expression> rhs;
+    std::vector<Instr> code; // lowered rpn, see compile()
+    std::vector<var> consts;
+    bool compiled = false;
+    void compile();
+    void lower(const Expression &e);
     virtual var evaluate(Scope &scope);
 };
 
@@ -308,6 +372,35 @@ struct ReturnException : public std::exception
     ReturnException(var v) : value(std::move(v)) {}
 };
 
+// ─── Native Stack Guard ───────────────────────────────────
+// User-function calls recurse on the C++ stack, and the cost of one level
+// depends on the function body, so no fixed depth limit is safe. Each call
+// instead checks how far the stack has grown since the first call and raises
+// a ScriptIt error while a quarter of RLIMIT_STACK is still free.
+
+inline size_t stack_budget()
+{
+    static const size_t budget = []
+    {
+        size_t limit = size_t(8) << 20;
+        struct rlimit rl;
+        if (getrlimit(RLIMIT_STACK, &rl) == 0 && rl.rlim_cur != RLIM_INFINITY)
+            limit = (size_t)rl.rlim_cur;
+        return limit - limit / 4;
+    }();
+    return budget;
+}
+
+// True once the stack has grown past stack_budget() below the first call site
+inline bool stack_exhausted()
+{
+    static const char *base = nullptr;
+    char marker;
+    if (!base)
+        base = &marker;
+    return base > &marker && (size_t)(base - &marker) > stack_budget();
+}
+
 struct FunctionDef
 {
     std::string name;
@@ -319,7 +412,7 @@ struct FunctionDef
 struct Scope
 {
     std::map<std::string, var> values;
-    std::map<std::string, FunctionDef> functions;      // key = "name/arity"
+    std::map<std::string, std::shared_ptr<const FunctionDef>> functions; // key = "name/arity"; shared so calls don't copy
     std::unordered_set<std::string> declaredFunctions; // forward-declared keys ("name/arity")
     Scope *parent;
     bool barrier;
@@ -333,7 +426,7 @@ struct Scope
     void defineFunction(const std::string &name, const FunctionDef &def)
     {
         std::string key = funcKey(name, (int)def.params.size());
-        functions[key] = def;
+        functions[key] = std::make_shared<const FunctionDef>(def);
         declaredFunctions.erase(key);
     }
 
@@ -348,67 +441,65 @@ struct Scope
         stub.name = name;
         stub.params = params;
         stub.body = nullptr; // no body yet
-        functions[key] = stub;
+        functions[key] = std::make_shared<const FunctionDef>(std::move(stub));
     }
 
     bool isFunctionDeclaredOnly(const std::string &name, int arity)
     {
         std::string key = funcKey(name, arity);
-        if (declaredFunctions.count(key))
-            return true;
-        if (parent)
-            return parent->isFunctionDeclaredOnly(name, arity);
+        for (Scope *s = this; s; s = s->parent)
+            if (s->declaredFunctions.count(key))
+                return true;
         return false;
     }
 
+    // Assign to the nearest enclosing definition; a barrier scope (function
+    // frame) stops the walk so callers' variables cannot be mutated.
     void set(const std::string &name, const var &val)
     {
-        if (values.count(name))
-        {
-            values[name] = val;
-            return;
-        }
-        if (parent && !barrier)
+        for (Scope *s = this; s; s = s->barrier ? nullptr : s->parent)
         {
-            try
+            auto it = s->values.find(name);
+            if (it != s->values.end())
             {
-                parent->set(name, val);
+                it->second = val;
                 return;
             }
-            catch (const std::runtime_error &)
-            {
-            }
         }
         throw std::runtime_error("Undefined variable '" + name + "' in current scope (cannot mutate outer scope).");
     }
 
     var get(const std::string &name)
     {
-        if (values.count(name))
-            return values[name];
-        if (parent)
-            return parent->get(name);
+        for (Scope *s = this; s; s = s->parent)
+        {
+            auto it = s->values.find(name);
+            if (it != s->values.end())
+                return it->second;
+        }
         // Undefined variables auto-create as None
         return var(NoneType{});
     }
 
-    FunctionDef getFunction(const std::string &name, int arity)
+    std::shared_ptr<const FunctionDef> getFunction(const std::string &name, int arity)
     {
+        // Iterative: the parent chain grows with the user's recursion depth
         std::string key = funcKey(name, arity);
-        if (functions.count(key))
-            return functions[key];
-        if (parent)
-            return parent->getFunction(name, arity);
+        for (Scope *s = this; s; s = s->parent)
+        {
+            auto it = s->functions.find(key);
+            if (it != s->functions.end())
+                return it->second;
+        }
         throw std::runtime_error("Unknown function: " + name + " with " + std::to_string(arity) + " arg(s)");
     }
 
     bool hasFunction(const std::string &name, int arity)
     {
         std::string key = funcKey(name, arity);
-        if (functions.count(key))
-            return true;
-        if (parent)
-            return parent->hasFunction(name, arity);
+        for (Scope *s = this; s; s = s->parent)
+            if (s->functions.count(key))
+                return true;
         return false;
     }
 
@@ -2,56 +2,357 @@
 ScriptIt Interpreter — Comprehensive Test Suite
 ================================================
 Tests every language feature, edge case, and error path.
-Binary: ./scriptit --script  (reads code from stdin)
+Binary: ./scriptit --serve  (a small pool of long-lived processes shared by
+        every test class; snippets are framed by a sentinel line, see _Server)
 
 Run:   python3 -m unittest test_interpreter -v
+Env:   SCRIPTIT_TEST_CWD=<dir>      run scripts there instead of a temp sandbox
+       SCRIPTIT_TEST_WORKERS=<n>    max --serve processes per pool (default: CPU count);
+                                    with n > 1 each class's CASES snippets run concurrently
+       SCRIPTIT_TEST_SHARD=<i>/<n>  run only shard i (0-based) of n, split by test class;
+                                    start n processes to use n cores, e.g.
+                                    for i in 0 1 2 3; do SCRIPTIT_TEST_SHARD=$i/4 python3 -m unittest test_interpreter & done; wait
 """
 
+import queue
+import re
+import selectors
 import subprocess
+import threading
+import time
 import unittest
 import tempfile
+import shutil
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Must match SERVE_SENTINEL / SERVE_CHECK_SENTINEL in ScriptIt.cpp
+SENTINEL = '---SCRIPTIT-END---'
+CHECK_SENTINEL = '---SCRIPTIT-CHECK---'
+# The wire protocol is bytes; each stream is decoded exactly once per snippet
+_SENTINEL_TAIL = ('\n' + SENTINEL + '\n').encode()
+_CHECK_TAIL = ('\n' + CHECK_SENTINEL + '\n').encode()
+
+# Resolved once at import: children get an absolute path, no per-spawn $PATH walk
+_SCRIPTIT = shutil.which('scriptit')
+_SERVE_ARGV = (_SCRIPTIT or 'scriptit', '--serve')
+
+# snippet -> (stdout, stderr), and snippet -> stdout for stdout-only runs.
+# Snippets are pure functions of their source for the fixed binary above, so
+# repeats across tests reuse the first run.
+_RUN_CACHE = {}
+_STDOUT_CACHE = {}
+
+# One stripped, non-blank output line per match, skipping Debug:/--- noise
+_CLEAN_RE = re.compile(r'^[^\S\n]*(?!Debug:|---)(\S.*?)[^\S\n]*$', re.MULTILINE)
+
+
+class _Server:
+    """One long-lived `scriptit --serve` process. Not thread-safe; see _ServerPool.
+
+    With capture_stderr=False the child's stderr goes to DEVNULL and only
+    stdout is drained, saving a pipe and its reads for stdout-only callers.
+    """
+
+    def __init__(self, argv, cwd, capture_stderr=True):
+        self.argv = argv
+        # cwd= forces the fork+exec path, but servers are long-lived
+        self.proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if capture_stderr else subprocess.DEVNULL,
+            cwd=cwd,
+            bufsize=0,
+            close_fds=False,
+        )
+        # Reused by every run(): one selector registration and one pair of
+        # receive buffers for the life of the process
+        self._buffers = {self.proc.stdout: bytearray()}
+        if self.proc.stderr is not None:
+            self._buffers[self.proc.stderr] = bytearray()
+        self._sel = selectors.DefaultSelector()
+        for f in self._buffers:
+            self._sel.register(f, selectors.EVENT_READ)
+
+    @property
+    def alive(self):
+        return self.proc.poll() is None
+
+    def run(self, formatted, timeout, check=False):
+        """Run one snippet, return (stdout, stderr, crashed).
+
+        Each snippet runs in a fresh scope, exactly like --script; with
+        check=True it is only parsed, like --check. Raises TimeoutExpired
+        (after killing the process) if it does not finish.
+        """
+        proc = self.proc
+        try:
+            proc.stdin.write(formatted.encode() + (_CHECK_TAIL if check else _SENTINEL_TAIL))
+        except BrokenPipeError:
+            pass
+
+        buffers = self._buffers
+        for buf in buffers.values():
+            del buf[:]
+        pending = set(buffers)
+        crashed = False
+        deadline = time.monotonic() + timeout
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.close(kill=True)
+                raise subprocess.TimeoutExpired(self.argv, timeout)
+            for key, _ in self._sel.select(remaining):
+                f = key.fileobj
+                if f not in pending:
+                    continue  # already framed; only EOF can make it ready again
+                chunk = os.read(key.fd, 65536)
+                buf = buffers[f]
+                if not chunk:
+                    crashed = True
+                    pending.discard(f)
+                    continue
+                buf += chunk
+                if buf.endswith(_SENTINEL_TAIL):
+                    del buf[-len(_SENTINEL_TAIL):]
+                    pending.discard(f)
+        if crashed:
+            self.close(kill=True)
+        out = buffers[proc.stdout]
+        err = buffers.get(proc.stderr, b'')
+        # stderr is empty for nearly every snippet: skip the codec call
+        return (out.decode() if out else '', err.decode() if err else '', crashed)
+
+    def close(self, kill=False):
+        proc = self.proc
+        if proc.stdin.closed:
+            return
+        self._sel.close()
+        if kill:
+            proc.kill()
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            proc.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        if proc.stderr is not None:
+            proc.stderr.close()
+
+
+class _ServerPool:
+    """Thread-safe pool of _Server processes, started on demand up to `size`.
+
+    A serial run only ever starts one server; concurrent callers each check
+    out their own, so a slow snippet never blocks the others.
+    """
+
+    def __init__(self, argv, cwd, size, capture_stderr=True):
+        self.argv = argv
+        self.cwd = cwd
+        self.capture_stderr = capture_stderr
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._all = []
+
+    def run(self, formatted, timeout, check=False):
+        with self._slots:
+            try:
+                server = self._idle.get_nowait()
+            except queue.Empty:
+                server = _Server(self.argv, self.cwd, self.capture_stderr)
+                with self._lock:
+                    self._all.append(server)
+            try:
+                return server.run(formatted, timeout, check)
+            finally:
+                # Dead servers (crash/timeout) are dropped and replaced lazily
+                if server.alive:
+                    self._idle.put(server)
+
+    def close(self):
+        with self._lock:
+            servers, self._all = self._all, []
+        for server in servers:
+            server.close()
+
+
+def _table_case(code, assertion, expected):
+    code = code.strip()  # once, at import, instead of on every run
+
+    def test(self):
+        out = self._stdout_of(code)
+        getattr(self, 'assert' + assertion)(out, expected)
+    return test
+
+
+def table_driven(cls):
+    """Class decorator: turn each CASES row (name, code, assertion, expected)
+    into a `test_<name>` method that runs `code` and calls `assert<assertion>`."""
+    for name, code, assertion, expected in cls.CASES:
+        test = _table_case(code, assertion, expected)
+        test.__name__ = 'test_' + name
+        test.__qualname__ = f'{cls.__qualname__}.{test.__name__}'
+        setattr(cls, test.__name__, test)
+    return cls
+
+
+def load_tests(loader, tests, pattern):
+    """unittest hook: honour SCRIPTIT_TEST_SHARD=i/n.
+
+    Whole classes are dealt out, largest first, each to the shard with the
+    fewest tests so far, so shards are balanced and every process still sets
+    up each class it runs exactly once.
+    """
+    shard = os.environ.get('SCRIPTIT_TEST_SHARD')
+    if not shard:
+        return tests
+    index, count = (int(x) for x in shard.split('/'))
+    if not 0 <= index < count:
+        raise ValueError(f"SCRIPTIT_TEST_SHARD={shard!r}: need 0 <= i < n")
+    classes = sorted(tests, key=lambda suite: -suite.countTestCases())
+    loads = [0] * count
+    selected = unittest.TestSuite()
+    for suite in classes:
+        target = loads.index(min(loads))
+        loads[target] += suite.countTestCases()
+        if target == index:
+            selected.addTest(suite)
+    return selected
+
+
+def setUpModule():
+    if _SCRIPTIT is None:
+        raise unittest.SkipTest("scriptit binary not found on $PATH")
+    # One working directory and one pair of server pools for the whole module:
+    # every snippet runs in a fresh scope, so classes need not pay for their
+    # own process startup. Scripts run in $SCRIPTIT_TEST_CWD, else a sandbox.
+    base = TestInterpreter
+    base._cwd = os.environ.get('SCRIPTIT_TEST_CWD')
+    base._own_cwd = not base._cwd
+    if base._own_cwd:
+        base._cwd = tempfile.mkdtemp(prefix='scriptit_')
+    base._workers = int(os.environ.get('SCRIPTIT_TEST_WORKERS') or os.cpu_count() or 1)
+    base._pool = _ServerPool(_SERVE_ARGV, base._cwd, base._workers)
+    base._out_pool = _ServerPool(_SERVE_ARGV, base._cwd, base._workers, capture_stderr=False)
+
+
+def tearDownModule():
+    base = TestInterpreter
+    if base._pool is None:
+        return
+    base._pool.close()
+    base._out_pool.close()
+    base._pool = base._out_pool = None
+    if base._own_cwd:
+        shutil.rmtree(base._cwd, ignore_errors=True)
 
 
 class TestInterpreter(unittest.TestCase):
     """Base test harness for the ScriptIt interpreter."""
 
-    BINARY = 'scriptit'
-    CWD = '/home/DATA/CODE/code/test'
+    TIMEOUT = 10
+
+    # Set by setUpModule, shared by every subclass
+    _pool = None
+    _out_pool = None
+    _cwd = None
+    _own_cwd = False
+    _workers = 1
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # CASES rows are independent, so run their snippets concurrently up
+        # front; the test methods (run serially by unittest) then hit the cache
+        snippets = {code.strip() for _, code, _, _ in getattr(cls, 'CASES', ())}
+        workers = cls._workers
+        if workers > 1 and len(snippets) > 1:
+            with ThreadPoolExecutor(min(workers, len(snippets))) as ex:
+                for _ in ex.map(cls._prefetch, snippets):
+                    pass
+
+    @classmethod
+    def _prefetch(cls, formatted):
+        """Fill _STDOUT_CACHE for one snippet; failures are left for the test to hit."""
+        if formatted in _RUN_CACHE or formatted in _STDOUT_CACHE:
+            return
+        try:
+            out, _, crashed = cls._out_pool.run(formatted, cls.TIMEOUT)
+        except subprocess.TimeoutExpired:
+            return
+        if not crashed:
+            _STDOUT_CACHE[formatted] = out
 
     def run_code(self, code):
-        """Run ScriptIt code via --script mode, return (stdout, stderr)."""
+        """Run ScriptIt code, return (stdout, stderr). Results are memoized per snippet."""
         formatted = code.strip()
-        proc = subprocess.Popen(
-            [self.BINARY, '--script'],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=self.CWD,
-            text=True,
-        )
-        stdout, stderr = proc.communicate(input=formatted, timeout=10)
-        return stdout, stderr
+        result = _RUN_CACHE.get(formatted)
+        if result is None:
+            out, err, crashed = self._pool.run(formatted, self.TIMEOUT)
+            result = (out, err)
+            if not crashed:
+                _RUN_CACHE[formatted] = result
+        return result
+
+    def run_code_stdout(self, code):
+        """Run ScriptIt code with stderr discarded, return stdout. Memoized like run_code."""
+        return self._stdout_of(code.strip())
+
+    def _stdout_of(self, formatted):
+        """run_code_stdout for an already-stripped snippet."""
+        full = _RUN_CACHE.get(formatted)
+        if full is not None:
+            return full[0]
+        out = _STDOUT_CACHE.get(formatted)
+        if out is None:
+            out, _, crashed = self._out_pool.run(formatted, self.TIMEOUT)
+            if not crashed:
+                _STDOUT_CACHE[formatted] = out
+        return out
 
     # ── Assertion helpers ──────────────────────────────
 
     def lines(self, stdout):
         """Clean output lines (strip, skip blanks/debug)."""
-        return [
-            l.strip() for l in stdout.splitlines()
-            if l.strip() and not l.strip().startswith("Debug:")
-            and not l.strip().startswith("---")
-        ]
+        return _CLEAN_RE.findall(stdout)
 
     def assertOutputSequence(self, stdout, expected):
         """Assert expected strings appear *in order* (substring match)."""
-        got = self.lines(stdout)
+        # Rolling str.find over the raw output: each hit is accepted only if it
+        # lies inside a cleaned line, and the next search resumes on the line
+        # after it, so each line still satisfies at most one expected item.
+        find = stdout.find
+        pos = 0
         si = 0
-        for li in range(len(got)):
-            if si < len(expected) and expected[si] in got[li]:
-                si += 1
+        for want in expected:
+            while True:
+                hit = find(want, pos)
+                if hit < 0:
+                    break
+                start = stdout.rfind('\n', 0, hit) + 1
+                end = find('\n', hit)
+                if end < 0:
+                    end = len(stdout)
+                m = _CLEAN_RE.match(stdout, start)
+                if m is not None and m.start(1) <= hit and hit + len(want) <= m.end(1):
+                    pos = end + 1
+                    break
+                # Hit in a skipped line or in stripped padding: keep looking
+                pos = end + 1 if m is None else hit + 1
+            if hit < 0:
+                break
+            si += 1
+        # Only build the cleaned line list when reporting a failure
         self.assertEqual(si, len(expected),
-                         f"Expected sequence {expected!r} but got lines: {got!r}")
+                         f"Expected sequence {expected!r} but got lines: {self.lines(stdout)!r}")
 
     def assertOutputExact(self, stdout, expected_lines):
         """Assert output lines match exactly."""
@@ -80,91 +381,53 @@ class TestInterpreter(unittest.TestCase):
 
     def assertFirstLine(self, stdout, expected):
         """Assert the first output line matches."""
-        got = self.lines(stdout)
-        self.assertTrue(len(got) > 0, "No output")
-        self.assertEqual(got[0], expected, f"First line: expected {expected!r}, got {got[0]!r}")
+        # search() stops at the first clean line; no need to split the rest
+        m = _CLEAN_RE.search(stdout)
+        self.assertTrue(m is not None, "No output")
+        got = m.group(1)
+        self.assertEqual(got, expected, f"First line: expected {expected!r}, got {got!r}")
 
 
 # ═════════════════════════════════════════════════════════════
 #  ARITHMETIC & NUMBERS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestArithmetic(TestInterpreter):
     """Basic arithmetic, number types, overflow promotion."""
 
-    def test_integer_addition(self):
-        out, _ = self.run_code('print(1 + 2).')
-        self.assertFirstLine(out, '3')
-
-    def test_integer_subtraction(self):
-        out, _ = self.run_code('print(10 - 3).')
-        self.assertFirstLine(out, '7')
-
-    def test_integer_multiplication(self):
-        out, _ = self.run_code('print(6 * 7).')
-        self.assertFirstLine(out, '42')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('integer_addition', 'print(1 + 2).', 'FirstLine', '3'),
+        ('integer_subtraction', 'print(10 - 3).', 'FirstLine', '7'),
+        ('integer_multiplication', 'print(6 * 7).', 'FirstLine', '42'),
+        ('integer_modulo', 'print(17 % 5).', 'FirstLine', '2'),
+        ('exponentiation', 'print(2 ^ 10).', 'FirstLine', '1024'),
+        ('negative_numbers', 'print(-5 + 3).', 'FirstLine', '-2'),
+        ('decimal_numbers', 'print(3.14 + 0.01).', 'FirstLine', '3.15'),
+        ('leading_dot_decimal', 'print(.5 + .5).', 'FirstLine', '1'),
+        ('division_by_zero', 'print(1 / 0).', 'OutputHasError', 'Division by zero'),
+        ('modulo_by_zero', 'print(5 % 0).', 'OutputHasError', 'Modulo by zero'),
+        ('operator_precedence', 'print(2 + 3 * 4).', 'FirstLine', '14'),
+        ('parentheses_override_precedence', 'print((2 + 3) * 4).', 'FirstLine', '20'),
+        ('nested_parentheses', 'print(((2 + 3) * (4 - 1))).', 'FirstLine', '15'),
+        ('unary_negation', 'print(-(-5)).', 'FirstLine', '5'),
+        ('complex_expression', 'print(2 ^ 3 + 4 * 2 - 1).', 'FirstLine', '15'),
+    ]
 
     def test_integer_division(self):
-        out, _ = self.run_code('print(10 / 3).')
+        out = self.run_code_stdout('print(10 / 3).')
         got = self.lines(out)
         self.assertTrue(got[0].startswith('3.333'))
 
-    def test_integer_modulo(self):
-        out, _ = self.run_code('print(17 % 5).')
-        self.assertFirstLine(out, '2')
-
-    def test_exponentiation(self):
-        out, _ = self.run_code('print(2 ^ 10).')
-        self.assertFirstLine(out, '1024')
-
-    def test_negative_numbers(self):
-        out, _ = self.run_code('print(-5 + 3).')
-        self.assertFirstLine(out, '-2')
-
-    def test_decimal_numbers(self):
-        out, _ = self.run_code('print(3.14 + 0.01).')
-        self.assertFirstLine(out, '3.15')
-
-    def test_leading_dot_decimal(self):
-        out, _ = self.run_code('print(.5 + .5).')
-        self.assertFirstLine(out, '1')
-
-    def test_division_by_zero(self):
-        out, _ = self.run_code('print(1 / 0).')
-        self.assertOutputHasError(out, 'Division by zero')
-
-    def test_modulo_by_zero(self):
-        out, _ = self.run_code('print(5 % 0).')
-        self.assertOutputHasError(out, 'Modulo by zero')
-
-    def test_operator_precedence(self):
-        out, _ = self.run_code('print(2 + 3 * 4).')
-        self.assertFirstLine(out, '14')
-
-    def test_parentheses_override_precedence(self):
-        out, _ = self.run_code('print((2 + 3) * 4).')
-        self.assertFirstLine(out, '20')
-
-    def test_nested_parentheses(self):
-        out, _ = self.run_code('print(((2 + 3) * (4 - 1))).')
-        self.assertFirstLine(out, '15')
-
-    def test_unary_negation(self):
-        out, _ = self.run_code('print(-(-5)).')
-        self.assertFirstLine(out, '5')
-
-    def test_complex_expression(self):
-        out, _ = self.run_code('print(2 ^ 3 + 4 * 2 - 1).')
-        self.assertFirstLine(out, '15')
-
     def test_large_integer(self):
-        out, _ = self.run_code('print(1000000 * 1000000).')
+        out = self.run_code_stdout('print(1000000 * 1000000).')
         got = self.lines(out)
         self.assertIn('1000000000000', got[0])
 
     def test_auto_print_expression(self):
         """Expression statements auto-print non-None results."""
-        out, _ = self.run_code('42.')
+        out = self.run_code_stdout('42.')
         self.assertFirstLine(out, '42')
 
 
@@ -172,171 +435,78 @@ class TestArithmetic(TestInterpreter):
 #  VARIABLES
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestVariables(TestInterpreter):
     """Variable declaration, assignment, multi-var, compound ops."""
 
-    def test_var_declaration(self):
-        out, _ = self.run_code('var x = 10.\nprint(x).')
-        self.assertFirstLine(out, '10')
-
-    def test_var_default_none(self):
-        out, _ = self.run_code('var x.\nprint(x).')
-        self.assertFirstLine(out, 'None')
-
-    def test_var_string(self):
-        out, _ = self.run_code('var s = "hello".\nprint(s).')
-        self.assertFirstLine(out, 'hello')
-
-    def test_var_reassignment(self):
-        out, _ = self.run_code('var x = 10.\nx = 20.\nprint(x).')
-        self.assertFirstLine(out, '20')
-
-    def test_multi_var(self):
-        out, _ = self.run_code('var a = 1 b = 2 c = 3.\nprint(a + b + c).')
-        self.assertFirstLine(out, '6')
-
-    def test_let_be(self):
-        out, _ = self.run_code('let x be 42.\nprint(x).')
-        self.assertFirstLine(out, '42')
-
-    def test_compound_plus_equals(self):
-        out, _ = self.run_code('var x = 10.\nx += 5.\nprint(x).')
-        self.assertFirstLine(out, '15')
-
-    def test_compound_minus_equals(self):
-        out, _ = self.run_code('var x = 10.\nx -= 3.\nprint(x).')
-        self.assertFirstLine(out, '7')
-
-    def test_compound_star_equals(self):
-        out, _ = self.run_code('var x = 4.\nx *= 3.\nprint(x).')
-        self.assertFirstLine(out, '12')
-
-    def test_compound_slash_equals(self):
-        out, _ = self.run_code('var x = 20.\nx /= 4.\nprint(x).')
-        self.assertFirstLine(out, '5')
-
-    def test_compound_percent_equals(self):
-        out, _ = self.run_code('var x = 17.\nx %= 5.\nprint(x).')
-        self.assertFirstLine(out, '2')
-
-    def test_post_increment(self):
-        out, _ = self.run_code('var x = 5.\nx++.\nprint(x).')
-        self.assertFirstLine(out, '6')
-
-    def test_post_decrement(self):
-        out, _ = self.run_code('var x = 5.\nx--.\nprint(x).')
-        self.assertFirstLine(out, '4')
-
-    def test_pre_increment(self):
-        out, _ = self.run_code('var x = 5.\n++x.\nprint(x).')
-        self.assertFirstLine(out, '6')
-
-    def test_pre_decrement(self):
-        out, _ = self.run_code('var x = 5.\n--x.\nprint(x).')
-        self.assertFirstLine(out, '4')
-
-    def test_pi_constant(self):
-        out, _ = self.run_code('print(PI).')
-        self.assertOutputContains(out, '3.14159')
-
-    def test_e_constant(self):
-        out, _ = self.run_code('print(e).')
-        self.assertOutputContains(out, '2.71828')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('var_declaration', 'var x = 10.\nprint(x).', 'FirstLine', '10'),
+        ('var_default_none', 'var x.\nprint(x).', 'FirstLine', 'None'),
+        ('var_string', 'var s = "hello".\nprint(s).', 'FirstLine', 'hello'),
+        ('var_reassignment', 'var x = 10.\nx = 20.\nprint(x).', 'FirstLine', '20'),
+        ('multi_var', 'var a = 1 b = 2 c = 3.\nprint(a + b + c).', 'FirstLine', '6'),
+        ('let_be', 'let x be 42.\nprint(x).', 'FirstLine', '42'),
+        ('compound_plus_equals', 'var x = 10.\nx += 5.\nprint(x).', 'FirstLine', '15'),
+        ('compound_minus_equals', 'var x = 10.\nx -= 3.\nprint(x).', 'FirstLine', '7'),
+        ('compound_star_equals', 'var x = 4.\nx *= 3.\nprint(x).', 'FirstLine', '12'),
+        ('compound_slash_equals', 'var x = 20.\nx /= 4.\nprint(x).', 'FirstLine', '5'),
+        ('compound_percent_equals', 'var x = 17.\nx %= 5.\nprint(x).', 'FirstLine', '2'),
+        ('post_increment', 'var x = 5.\nx++.\nprint(x).', 'FirstLine', '6'),
+        ('post_decrement', 'var x = 5.\nx--.\nprint(x).', 'FirstLine', '4'),
+        ('pre_increment', 'var x = 5.\n++x.\nprint(x).', 'FirstLine', '6'),
+        ('pre_decrement', 'var x = 5.\n--x.\nprint(x).', 'FirstLine', '4'),
+        ('pi_constant', 'print(PI).', 'OutputContains', '3.14159'),
+        ('e_constant', 'print(e).', 'OutputContains', '2.71828'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  BOOLEANS & COMPARISON
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestBooleans(TestInterpreter):
     """Boolean values, comparison operators, logical operators."""
 
-    def test_true_false(self):
-        out, _ = self.run_code('print(True).\nprint(False).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_equality(self):
-        out, _ = self.run_code('print(1 == 1).\nprint(1 == 2).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_inequality(self):
-        out, _ = self.run_code('print(1 != 2).\nprint(1 != 1).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_less_than(self):
-        out, _ = self.run_code('print(1 < 2).\nprint(2 < 1).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_greater_than(self):
-        out, _ = self.run_code('print(2 > 1).\nprint(1 > 2).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_less_equal(self):
-        out, _ = self.run_code('print(1 <= 1).\nprint(1 <= 2).\nprint(2 <= 1).')
-        self.assertOutputExact(out, ['True', 'True', 'False'])
-
-    def test_greater_equal(self):
-        out, _ = self.run_code('print(2 >= 2).\nprint(2 >= 1).\nprint(1 >= 2).')
-        self.assertOutputExact(out, ['True', 'True', 'False'])
-
-    def test_logical_and(self):
-        out, _ = self.run_code('print(True and True).\nprint(True and False).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_logical_or(self):
-        out, _ = self.run_code('print(False or True).\nprint(False or False).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_logical_not(self):
-        out, _ = self.run_code('print(not True).\nprint(not False).')
-        self.assertOutputExact(out, ['False', 'True'])
-
-    def test_and_or_symbols(self):
-        out, _ = self.run_code('print(True && False).\nprint(False || True).')
-        self.assertOutputExact(out, ['False', 'True'])
-
-    def test_is_operator(self):
-        out, _ = self.run_code('print(10 is 10).\nprint(10 is 20).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_is_not_operator(self):
-        out, _ = self.run_code('print(10 is not 20).\nprint(10 is not 10).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_points_operator(self):
-        out, _ = self.run_code('print(10 points 10).\nprint(10 points 20).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_not_points_operator(self):
-        out, _ = self.run_code('print(10 not points 20).\nprint(10 not points 10).')
-        self.assertOutputExact(out, ['True', 'False'])
+    CASES = [
+        # (name, code, assertion, expected)
+        ('true_false', 'print(True).\nprint(False).', 'OutputExact', ['True', 'False']),
+        ('equality', 'print(1 == 1).\nprint(1 == 2).', 'OutputExact', ['True', 'False']),
+        ('inequality', 'print(1 != 2).\nprint(1 != 1).', 'OutputExact', ['True', 'False']),
+        ('less_than', 'print(1 < 2).\nprint(2 < 1).', 'OutputExact', ['True', 'False']),
+        ('greater_than', 'print(2 > 1).\nprint(1 > 2).', 'OutputExact', ['True', 'False']),
+        ('less_equal', 'print(1 <= 1).\nprint(1 <= 2).\nprint(2 <= 1).', 'OutputExact', ['True', 'True', 'False']),
+        ('greater_equal', 'print(2 >= 2).\nprint(2 >= 1).\nprint(1 >= 2).', 'OutputExact', ['True', 'True', 'False']),
+        ('logical_and', 'print(True and True).\nprint(True and False).', 'OutputExact', ['True', 'False']),
+        ('logical_or', 'print(False or True).\nprint(False or False).', 'OutputExact', ['True', 'False']),
+        ('logical_not', 'print(not True).\nprint(not False).', 'OutputExact', ['False', 'True']),
+        ('and_or_symbols', 'print(True && False).\nprint(False || True).', 'OutputExact', ['False', 'True']),
+        ('is_operator', 'print(10 is 10).\nprint(10 is 20).', 'OutputExact', ['True', 'False']),
+        ('is_not_operator', 'print(10 is not 20).\nprint(10 is not 10).', 'OutputExact', ['True', 'False']),
+        ('points_operator', 'print(10 points 10).\nprint(10 points 20).', 'OutputExact', ['True', 'False']),
+        ('not_points_operator', 'print(10 not points 20).\nprint(10 not points 10).', 'OutputExact', ['True', 'False']),
+        ('string_equality', 'print("hello" == "hello").\nprint("hello" == "world").', 'OutputExact', ['True', 'False']),
+        ('none_comparison', 'var x.\nprint(x == None).\nprint(x is None).', 'OutputExact', ['True', 'True']),
+        ('none_literal_comparison', 'print(None == None).\nprint(None is None).', 'OutputExact', ['True', 'True']),
+        ('none_literal_list', 'var x = [None, None].\nprint(x).', 'FirstLine', '[None, None]'),
+        ('bool_type', 'print(type(True)).\nprint(type(False)).', 'OutputExact', ['bool', 'bool']),
+    ]
 
     def test_points_type_strict(self):
         """'points' requires same type — int vs double should differ."""
-        out, _ = self.run_code('print(10 points 10.0).')
+        out = self.run_code_stdout('print(10 points 10.0).')
         # int and double are different types, so 'points' should return False
         self.assertFirstLine(out, 'False')
 
-    def test_string_equality(self):
-        out, _ = self.run_code('print("hello" == "hello").\nprint("hello" == "world").')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_none_comparison(self):
-        out, _ = self.run_code('var x.\nprint(x == None).\nprint(x is None).')
-        self.assertOutputExact(out, ['True', 'True'])
-
-    def test_bool_type(self):
-        out, _ = self.run_code('print(type(True)).\nprint(type(False)).')
-        self.assertOutputExact(out, ['bool', 'bool'])
-
     def test_and_both_true(self):
         """Both true → True."""
-        out, _ = self.run_code('print(True and True).')
+        out = self.run_code_stdout('print(True and True).')
         self.assertFirstLine(out, 'True')
 
     def test_or_both_false(self):
         """Both false → False."""
-        out, _ = self.run_code('print(False or False).')
+        out = self.run_code_stdout('print(False or False).')
         self.assertFirstLine(out, 'False')
 
 
@@ -344,316 +514,163 @@ class TestBooleans(TestInterpreter):
 #  STRINGS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestStrings(TestInterpreter):
     """String literals, escape sequences, concatenation, methods."""
 
-    def test_double_quoted(self):
-        out, _ = self.run_code('print("hello").')
-        self.assertFirstLine(out, 'hello')
-
-    def test_single_quoted(self):
-        out, _ = self.run_code("print('world').")
-        self.assertFirstLine(out, 'world')
-
-    def test_escape_newline(self):
-        out, _ = self.run_code('print("a\\nb").')
-        self.assertOutputExact(out, ['a', 'b'])
-
-    def test_escape_tab(self):
-        out, _ = self.run_code('print("a\\tb").')
-        self.assertOutputContains(out, 'a\tb')
-
-    def test_escape_backslash(self):
-        out, _ = self.run_code('print("a\\\\b").')
-        self.assertOutputContains(out, 'a\\b')
-
-    def test_string_concatenation(self):
-        out, _ = self.run_code('print("hello" + " " + "world").')
-        self.assertFirstLine(out, 'hello world')
-
-    def test_string_repetition(self):
-        out, _ = self.run_code('print("ha" * 3).')
-        self.assertFirstLine(out, 'hahaha')
-
-    def test_string_upper(self):
-        out, _ = self.run_code('print("hello".upper()).')
-        self.assertFirstLine(out, 'HELLO')
-
-    def test_string_lower(self):
-        out, _ = self.run_code('print("HELLO".lower()).')
-        self.assertFirstLine(out, 'hello')
-
-    def test_string_strip(self):
-        out, _ = self.run_code('print("  hi  ".strip()).')
-        self.assertFirstLine(out, 'hi')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('double_quoted', 'print("hello").', 'FirstLine', 'hello'),
+        ('single_quoted', "print('world').", 'FirstLine', 'world'),
+        ('escape_newline', 'print("a\\nb").', 'OutputExact', ['a', 'b']),
+        ('escape_tab', 'print("a\\tb").', 'OutputContains', 'a\tb'),
+        ('escape_backslash', 'print("a\\\\b").', 'OutputContains', 'a\\b'),
+        ('string_concatenation', 'print("hello" + " " + "world").', 'FirstLine', 'hello world'),
+        ('string_repetition', 'print("ha" * 3).', 'FirstLine', 'hahaha'),
+        ('string_upper', 'print("hello".upper()).', 'FirstLine', 'HELLO'),
+        ('string_lower', 'print("HELLO".lower()).', 'FirstLine', 'hello'),
+        ('string_strip', 'print("  hi  ".strip()).', 'FirstLine', 'hi'),
+        ('string_find', 'print("hello world".find("world")).', 'FirstLine', '6'),
+        ('string_replace', 'print("hello world".replace("world", "earth")).', 'FirstLine', 'hello earth'),
+        ('string_contains', 'print("hello".contains("ell")).\nprint("hello".contains("xyz")).', 'OutputExact', ['True', 'False']),
+        ('string_startswith', 'print("hello".startswith("hel")).\nprint("hello".startswith("xyz")).', 'OutputExact', ['True', 'False']),
+        ('string_endswith', 'print("hello".endswith("llo")).\nprint("hello".endswith("xyz")).', 'OutputExact', ['True', 'False']),
+        ('string_count', 'print("banana".count("a")).', 'FirstLine', '3'),
+        ('string_reverse', 'print("hello".reverse()).', 'FirstLine', 'olleh'),
+        ('string_len', 'print(len("hello")).', 'FirstLine', '5'),
+        ('string_title', 'print("hello world".title()).', 'FirstLine', 'Hello World'),
+        ('string_capitalize', 'print("hello".capitalize()).', 'FirstLine', 'Hello'),
+        ('string_isdigit', 'print("123".isdigit()).\nprint("12a".isdigit()).', 'OutputExact', ['True', 'False']),
+        ('string_isalpha', 'print("abc".isalpha()).\nprint("ab1".isalpha()).', 'OutputExact', ['True', 'False']),
+        ('string_type', 'print(type("hello")).', 'FirstLine', 'str'),
+        ('string_number_concat', 'print("value: " + str(42)).', 'FirstLine', 'value: 42'),
+        ('empty_string', 'print(len("")).', 'FirstLine', '0'),
+        ('string_slice', 'print("hello world".slice(0, 5)).', 'FirstLine', 'hello'),
+    ]
 
     def test_string_split(self):
-        out, _ = self.run_code('print("a,b,c".split(",")).')
+        out = self.run_code_stdout('print("a,b,c".split(",")).')
         self.assertOutputContains(out, 'a')
         self.assertOutputContains(out, 'b')
         self.assertOutputContains(out, 'c')
 
-    def test_string_find(self):
-        out, _ = self.run_code('print("hello world".find("world")).')
-        self.assertFirstLine(out, '6')
-
-    def test_string_replace(self):
-        out, _ = self.run_code('print("hello world".replace("world", "earth")).')
-        self.assertFirstLine(out, 'hello earth')
-
-    def test_string_contains(self):
-        out, _ = self.run_code('print("hello".contains("ell")).\nprint("hello".contains("xyz")).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_string_startswith(self):
-        out, _ = self.run_code('print("hello".startswith("hel")).\nprint("hello".startswith("xyz")).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_string_endswith(self):
-        out, _ = self.run_code('print("hello".endswith("llo")).\nprint("hello".endswith("xyz")).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_string_count(self):
-        out, _ = self.run_code('print("banana".count("a")).')
-        self.assertFirstLine(out, '3')
-
-    def test_string_reverse(self):
-        out, _ = self.run_code('print("hello".reverse()).')
-        self.assertFirstLine(out, 'olleh')
-
-    def test_string_len(self):
-        out, _ = self.run_code('print(len("hello")).')
-        self.assertFirstLine(out, '5')
-
-    def test_string_title(self):
-        out, _ = self.run_code('print("hello world".title()).')
-        self.assertFirstLine(out, 'Hello World')
-
-    def test_string_capitalize(self):
-        out, _ = self.run_code('print("hello".capitalize()).')
-        self.assertFirstLine(out, 'Hello')
-
-    def test_string_isdigit(self):
-        out, _ = self.run_code('print("123".isdigit()).\nprint("12a".isdigit()).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_string_isalpha(self):
-        out, _ = self.run_code('print("abc".isalpha()).\nprint("ab1".isalpha()).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_string_type(self):
-        out, _ = self.run_code('print(type("hello")).')
-        self.assertFirstLine(out, 'str')
-
-    def test_string_number_concat(self):
-        out, _ = self.run_code('print("value: " + str(42)).')
-        self.assertFirstLine(out, 'value: 42')
-
-    def test_empty_string(self):
-        out, _ = self.run_code('print(len("")).')
-        self.assertFirstLine(out, '0')
-
-    def test_string_slice(self):
-        out, _ = self.run_code('print("hello world".slice(0, 5)).')
-        self.assertFirstLine(out, 'hello')
-
 
 # ═════════════════════════════════════════════════════════════
 #  LISTS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestLists(TestInterpreter):
     """List literals, methods, operations."""
 
+    CASES = [
+        # (name, code, assertion, expected)
+        ('empty_list', 'var l = [].\nprint(len(l)).', 'FirstLine', '0'),
+        ('list_append', 'var l = [1, 2].\nl.append(3).\nprint(l).', 'OutputContains', '3'),
+        ('list_pop', 'var l = [1, 2, 3].\nprint(l.pop()).', 'FirstLine', '3'),
+        ('list_len', 'print(len([10, 20, 30])).', 'FirstLine', '3'),
+        ('list_repetition', 'print([0] * 3).', 'OutputContains', '0'),
+        ('list_contains', 'print([1, 2, 3].contains(2)).\nprint([1, 2, 3].contains(5)).', 'OutputExact', ['True', 'False']),
+        ('list_index', 'print([10, 20, 30].index(20)).', 'FirstLine', '1'),
+        ('list_count', 'print([1, 2, 2, 3, 2].count(2)).', 'FirstLine', '3'),
+        ('list_mixed_types', 'var l = [1, "hello", True, 3.14].\nprint(len(l)).', 'FirstLine', '4'),
+        ('nested_list', 'var l = [[1, 2], [3, 4]].\nprint(len(l)).', 'FirstLine', '2'),
+        ('list_index_access', 'var a = [10, 20, 30].\nprint(a.index(20)).', 'FirstLine', '1'),
+        ('sum_builtin', 'print(sum([1, 2, 3, 4])).', 'FirstLine', '10'),
+    ]
+
     def test_list_literal(self):
-        out, _ = self.run_code('var l = [1, 2, 3].\nprint(l).')
+        out = self.run_code_stdout('var l = [1, 2, 3].\nprint(l).')
         self.assertOutputContains(out, '1')
         self.assertOutputContains(out, '2')
         self.assertOutputContains(out, '3')
 
-    def test_empty_list(self):
-        out, _ = self.run_code('var l = [].\nprint(len(l)).')
-        self.assertFirstLine(out, '0')
-
-    def test_list_append(self):
-        out, _ = self.run_code('var l = [1, 2].\nl.append(3).\nprint(l).')
-        self.assertOutputContains(out, '3')
-
-    def test_list_pop(self):
-        out, _ = self.run_code('var l = [1, 2, 3].\nprint(l.pop()).')
-        self.assertFirstLine(out, '3')
-
-    def test_list_len(self):
-        out, _ = self.run_code('print(len([10, 20, 30])).')
-        self.assertFirstLine(out, '3')
-
     def test_list_concat(self):
-        out, _ = self.run_code('print([1, 2] + [3, 4]).')
+        out = self.run_code_stdout('print([1, 2] + [3, 4]).')
         self.assertOutputContains(out, '1')
         self.assertOutputContains(out, '4')
 
-    def test_list_repetition(self):
-        out, _ = self.run_code('print([0] * 3).')
-        self.assertOutputContains(out, '0')
-
-    def test_list_contains(self):
-        out, _ = self.run_code('print([1, 2, 3].contains(2)).\nprint([1, 2, 3].contains(5)).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_list_index(self):
-        out, _ = self.run_code('print([10, 20, 30].index(20)).')
-        self.assertFirstLine(out, '1')
-
-    def test_list_count(self):
-        out, _ = self.run_code('print([1, 2, 2, 3, 2].count(2)).')
-        self.assertFirstLine(out, '3')
-
     def test_list_reverse(self):
-        out, _ = self.run_code('print([1, 2, 3].reverse()).')
+        out = self.run_code_stdout('print([1, 2, 3].reverse()).')
         got = self.lines(out)
         self.assertIn('3', got[0])
 
     def test_list_sort(self):
-        out, _ = self.run_code('print([3, 1, 2].sort()).')
+        out = self.run_code_stdout('print([3, 1, 2].sort()).')
         got = self.lines(out)
         self.assertIn('1', got[0])
 
-    def test_list_mixed_types(self):
-        out, _ = self.run_code('var l = [1, "hello", True, 3.14].\nprint(len(l)).')
-        self.assertFirstLine(out, '4')
-
-    def test_nested_list(self):
-        out, _ = self.run_code('var l = [[1, 2], [3, 4]].\nprint(len(l)).')
-        self.assertFirstLine(out, '2')
-
-    def test_list_index_access(self):
-        out, _ = self.run_code('var a = [10, 20, 30].\nprint(a.index(20)).')
-        self.assertFirstLine(out, '1')
-
     def test_sorted_builtin(self):
-        out, _ = self.run_code('print(sorted([3, 1, 2])).')
+        out = self.run_code_stdout('print(sorted([3, 1, 2])).')
         got = self.lines(out)
         self.assertIn('1', got[0])
 
     def test_reversed_builtin(self):
-        out, _ = self.run_code('print(reversed([1, 2, 3])).')
+        out = self.run_code_stdout('print(reversed([1, 2, 3])).')
         got = self.lines(out)
         self.assertIn('3', got[0])
 
-    def test_sum_builtin(self):
-        out, _ = self.run_code('print(sum([1, 2, 3, 4])).')
-        self.assertFirstLine(out, '10')
-
 
 # ═════════════════════════════════════════════════════════════
 #  SETS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestSets(TestInterpreter):
     """Set literals and methods."""
 
-    def test_set_literal(self):
-        out, _ = self.run_code('var s = {1, 2, 3}.\nprint(len(s)).')
-        self.assertFirstLine(out, '3')
-
-    def test_set_deduplication(self):
-        out, _ = self.run_code('var s = {1, 1, 2, 2, 3}.\nprint(len(s)).')
-        self.assertFirstLine(out, '3')
-
-    def test_set_add(self):
-        out, _ = self.run_code('var s = {1, 2}.\nvar s2 = s.add(3).\nprint(len(s2)).')
-        self.assertFirstLine(out, '3')
-
-    def test_set_contains(self):
-        out, _ = self.run_code('print({1, 2, 3}.contains(2)).\nprint({1, 2, 3}.contains(5)).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_set_remove(self):
-        out, _ = self.run_code('var s = {1, 2, 3}.\nvar s2 = s.remove(2).\nprint(len(s2)).')
-        self.assertFirstLine(out, '2')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('set_literal', 'var s = {1, 2, 3}.\nprint(len(s)).', 'FirstLine', '3'),
+        ('set_deduplication', 'var s = {1, 1, 2, 2, 3}.\nprint(len(s)).', 'FirstLine', '3'),
+        ('set_add', 'var s = {1, 2}.\nvar s2 = s.add(3).\nprint(len(s2)).', 'FirstLine', '3'),
+        ('set_contains', 'print({1, 2, 3}.contains(2)).\nprint({1, 2, 3}.contains(5)).', 'OutputExact', ['True', 'False']),
+        ('set_remove', 'var s = {1, 2, 3}.\nvar s2 = s.remove(2).\nprint(len(s2)).', 'FirstLine', '2'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  FUNCTIONS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestFunctions(TestInterpreter):
     """Function definition, calling, give, overloading, pass-by-ref."""
 
-    def test_basic_function(self):
-        out, _ = self.run_code('fn greet(): print("hi") ;\ngreet().')
-        self.assertFirstLine(out, 'hi')
-
-    def test_function_with_params(self):
-        out, _ = self.run_code('fn add(a, b): give a + b ;\nprint(add(3, 4)).')
-        self.assertFirstLine(out, '7')
-
-    def test_give_no_parens(self):
-        out, _ = self.run_code('fn dbl(x): give x * 2 ;\nprint(dbl(5)).')
-        self.assertFirstLine(out, '10')
-
-    def test_give_with_parens(self):
-        out, _ = self.run_code('fn dbl(x): give(x * 2) ;\nprint(dbl(5)).')
-        self.assertFirstLine(out, '10')
-
-    def test_give_complex_expression(self):
-        out, _ = self.run_code('fn calc(a, b): give a * 2 + b * 3 ;\nprint(calc(5, 10)).')
-        self.assertFirstLine(out, '40')
-
-    def test_function_returns_none(self):
-        out, _ = self.run_code('fn noop(): pass ;\nprint(noop()).')
-        self.assertFirstLine(out, 'None')
-
-    def test_function_no_give_returns_none(self):
-        out, _ = self.run_code('fn side_effect(): var x = 42 ;\nprint(side_effect()).')
-        self.assertFirstLine(out, 'None')
-
-    def test_overloading_by_arity(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('basic_function', 'fn greet(): print("hi") ;\ngreet().', 'FirstLine', 'hi'),
+        ('function_with_params', 'fn add(a, b): give a + b ;\nprint(add(3, 4)).', 'FirstLine', '7'),
+        ('give_no_parens', 'fn dbl(x): give x * 2 ;\nprint(dbl(5)).', 'FirstLine', '10'),
+        ('give_with_parens', 'fn dbl(x): give(x * 2) ;\nprint(dbl(5)).', 'FirstLine', '10'),
+        ('give_complex_expression', 'fn calc(a, b): give a * 2 + b * 3 ;\nprint(calc(5, 10)).', 'FirstLine', '40'),
+        ('function_returns_none', 'fn noop(): pass ;\nprint(noop()).', 'FirstLine', 'None'),
+        ('function_no_give_returns_none', 'fn side_effect(): var x = 42 ;\nprint(side_effect()).', 'FirstLine', 'None'),
+        ('overloading_by_arity', """
 fn add(a, b): give a + b ;
 fn add(a, b, c): give a + b + c ;
 print(add(1, 2)).
 print(add(1, 2, 3)).
-""")
-        self.assertOutputExact(out, ['3', '6'])
-
-    def test_forward_declaration(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['3', '6']),
+        ('forward_declaration', """
 fn myFunc(a, b).
 fn myFunc(a, b): give a + b ;
 print(myFunc(10, 20)).
-""")
-        self.assertFirstLine(out, '30')
-
-    def test_define_before_use(self):
-        """Functions must be defined before use in --script mode."""
-        out, _ = self.run_code("""
-fn myFunc(x): give x * 10 ;
-print(myFunc(5)).
-""")
-        self.assertFirstLine(out, '50')
-
-    def test_function_redefinition(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '30'),
+        ('function_redefinition', """
 fn f(a, b): give a ;
 fn f(a, b): give b ;
 print(f(1, 2)).
-""")
-        self.assertFirstLine(out, '2')
-
-    def test_pass_by_reference(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '2'),
+        ('pass_by_reference', """
 fn increment(@x):
     x = x + 1.
 ;
 var val = 10.
 increment(val).
 print(val).
-""")
-        self.assertFirstLine(out, '11')
-
-    def test_pass_by_reference_swap(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '11'),
+        ('pass_by_reference_swap', """
 fn swap(@a, @b):
     var temp = a.
     a = b.
@@ -664,23 +681,8 @@ var y = 20.
 swap(x, y).
 print(x).
 print(y).
-""")
-        self.assertOutputExact(out, ['20', '10'])
-
-    def test_pass_by_value_default(self):
-        """Without @, params are by value — caller's variable unchanged."""
-        out, _ = self.run_code("""
-fn tryChange(x):
-    x = 999.
-;
-var val = 10.
-tryChange(val).
-print(val).
-""")
-        self.assertFirstLine(out, '10')
-
-    def test_recursive_function(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['20', '10']),
+        ('recursive_function', """
 fn factorial(n):
     if n <= 1:
         give 1
@@ -688,27 +690,46 @@ fn factorial(n):
     give n * factorial(n - 1)
 ;
 print(factorial(5)).
-""")
-        self.assertFirstLine(out, '120')
-
-    def test_recursive_fibonacci(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '120'),
+        ('recursive_fibonacci', """
 fn fib(n):
     if n <= 0: give 0 ;
     if n == 1: give 1 ;
     give fib(n - 1) + fib(n - 2)
 ;
 print(fib(10)).
+""", 'FirstLine', '55'),
+        ('duplicate_param_error', 'fn f(a, a): give a ;', 'OutputHasError', 'Duplicate parameter'),
+        ('unknown_function_error', 'nonexistent().', 'OutputHasError', 'Unknown function'),
+        ('runaway_recursion_error', """
+fn f(n): give f(n + 1) ;
+print(f(0)).
+""", 'OutputHasError', 'Maximum recursion depth'),
+    ]
+
+    def test_define_before_use(self):
+        """Functions must be defined before use in --script mode."""
+        out = self.run_code_stdout("""
+fn myFunc(x): give x * 10 ;
+print(myFunc(5)).
 """)
-        self.assertFirstLine(out, '55')
+        self.assertFirstLine(out, '50')
 
-    def test_duplicate_param_error(self):
-        out, _ = self.run_code('fn f(a, a): give a ;')
-        self.assertOutputHasError(out, 'Duplicate parameter')
+    def test_pass_by_value_default(self):
+        """Without @, params are by value — caller's variable unchanged."""
+        out = self.run_code_stdout("""
+fn tryChange(x):
+    x = 999.
+;
+var val = 10.
+tryChange(val).
+print(val).
+""")
+        self.assertFirstLine(out, '10')
 
     def test_function_scope_isolation(self):
         """Variables inside functions don't leak to outer scope."""
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 fn f():
     var inner_var = 42.
 ;
@@ -720,54 +741,43 @@ print(inner_var).
 
     def test_function_accesses_outer_scope(self):
         """Functions can read variables from outer scope."""
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var outer = 100.
 fn getOuter(): give outer ;
 print(getOuter()).
 """)
         self.assertFirstLine(out, '100')
 
-    def test_unknown_function_error(self):
-        out, _ = self.run_code('nonexistent().')
-        self.assertOutputHasError(out, 'Unknown function')
-
 
 # ═════════════════════════════════════════════════════════════
 #  CONTROL FLOW — IF / ELIF / ELSE
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestConditionals(TestInterpreter):
     """If/elif/else statements."""
 
-    def test_simple_if(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('simple_if', """
 if True:
     print("yes")
 ;
-""")
-        self.assertFirstLine(out, 'yes')
-
-    def test_if_false(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'yes'),
+        ('if_false', """
 if False:
     print("no")
 ;
 print("after").
-""")
-        self.assertFirstLine(out, 'after')
-
-    def test_if_else(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'after'),
+        ('if_else', """
 if False:
     print("if")
 else:
     print("else")
 ;
-""")
-        self.assertFirstLine(out, 'else')
-
-    def test_if_elif_else(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'else'),
+        ('if_elif_else', """
 var x = 2.
 if x == 1:
     print("one")
@@ -776,11 +786,8 @@ elif x == 2:
 else:
     print("other")
 ;
-""")
-        self.assertFirstLine(out, 'two')
-
-    def test_multiple_elif(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'two'),
+        ('multiple_elif', """
 var x = 3.
 if x == 1:
     print("one")
@@ -791,11 +798,8 @@ elif x == 3:
 else:
     print("other")
 ;
-""")
-        self.assertFirstLine(out, 'three')
-
-    def test_nested_if(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'three'),
+        ('nested_if', """
 var x = 5.
 if x > 0:
     if x > 3:
@@ -804,11 +808,8 @@ if x > 0:
         print("small")
     ;
 ;
-""")
-        self.assertFirstLine(out, 'big')
-
-    def test_comparison_in_if(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'big'),
+        ('comparison_in_if', """
 var score = 85.
 if score >= 90:
     print("A")
@@ -819,42 +820,85 @@ elif score >= 70:
 else:
     print("F")
 ;
-""")
-        self.assertFirstLine(out, 'B')
+""", 'FirstLine', 'B'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  CONTROL FLOW — FOR LOOPS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestForLoops(TestInterpreter):
     """For loop: range(N), range(from..to), range(from..to step), for-in."""
 
-    def test_range_simple(self):
-        """range(N) → 0 to N (inclusive)."""
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('range_from_to', """
 var s = 0.
-for i in range(3):
+for i in range(from 1 to 5):
     s += i.
 ;
 print(s).
-""")
-        # 0 + 1 + 2 + 3 = 6
-        self.assertFirstLine(out, '6')
+""", 'FirstLine', '15'),
+        ('range_accumulate_negative_step', """
+var s = 1.
+for i in range(from 10 to 1 step -3):
+    s = i + s.
+;
+print(s).
+""", 'FirstLine', '23'),
+        ('range_accumulate_fractional_start', """
+var s = 0.5.
+for i in range(from 1 to 4):
+    s += i.
+;
+print(s).
+""", 'FirstLine', '10.5'),
+        ('for_in_list', """
+for x in [10, 20, 30]:
+    print(x).
+;
+""", 'OutputExact', ['10', '20', '30']),
+        ('for_in_string', """
+var s = "".
+for ch in "abc":
+    s = s + ch + "-".
+;
+print(s).
+""", 'OutputContains', 'a-b-c-'),
+        ('nested_loops', """
+var count = 0.
+for i in range(from 1 to 3):
+    for j in range(from 1 to 3):
+        count++.
+    ;
+;
+print(count).
+""", 'FirstLine', '9'),
+        ('loop_variable_accumulation', """
+var result = "".
+for i in range(from 1 to 5):
+    result = result + str(i).
+;
+print(result).
+""", 'FirstLine', '12345'),
+    ]
 
-    def test_range_from_to(self):
-        out, _ = self.run_code("""
+    def test_range_simple(self):
+        """range(N) → 0 to N (inclusive)."""
+        out = self.run_code_stdout("""
 var s = 0.
-for i in range(from 1 to 5):
+for i in range(3):
     s += i.
 ;
 print(s).
 """)
-        # 1 + 2 + 3 + 4 + 5 = 15
-        self.assertFirstLine(out, '15')
+        # 0 + 1 + 2 + 3 = 6
+        self.assertFirstLine(out, '6')
 
     def test_range_step(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var items = [].
 for i in range(from 0 to 10 step 2):
     items.append(i).
@@ -866,7 +910,7 @@ print(items).
         self.assertOutputContains(out, '10')
 
     def test_range_reverse(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var items = [].
 for i in range(from 5 to 1 step -1):
     items.append(i).
@@ -876,57 +920,18 @@ print(items).
         self.assertOutputContains(out, '5')
         self.assertOutputContains(out, '1')
 
-    def test_for_in_list(self):
-        out, _ = self.run_code("""
-for x in [10, 20, 30]:
-    print(x).
-;
-""")
-        self.assertOutputExact(out, ['10', '20', '30'])
-
-    def test_for_in_string(self):
-        out, _ = self.run_code("""
-var s = "".
-for ch in "abc":
-    s = s + ch + "-".
-;
-print(s).
-""")
-        self.assertOutputContains(out, 'a-b-c-')
-
-    def test_nested_loops(self):
-        out, _ = self.run_code("""
-var count = 0.
-for i in range(from 1 to 3):
-    for j in range(from 1 to 3):
-        count++.
-    ;
-;
-print(count).
-""")
-        # 3 * 3 = 9
-        self.assertFirstLine(out, '9')
-
-    def test_loop_variable_accumulation(self):
-        out, _ = self.run_code("""
-var result = "".
-for i in range(from 1 to 5):
-    result = result + str(i).
-;
-print(result).
-""")
-        self.assertFirstLine(out, '12345')
-
 
 # ═════════════════════════════════════════════════════════════
 #  CONTROL FLOW — WHILE LOOPS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestWhileLoops(TestInterpreter):
     """While loops."""
 
-    def test_basic_while(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('basic_while', """
 var i = 0.
 var s = 0.
 while i < 5:
@@ -934,32 +939,15 @@ while i < 5:
     i++.
 ;
 print(s).
-""")
-        # 0 + 1 + 2 + 3 + 4 = 10
-        self.assertFirstLine(out, '10')
-
-    def test_while_false(self):
-        """While with initially false condition doesn't execute."""
-        out, _ = self.run_code("""
-while False:
-    print("never").
-;
-print("done").
-""")
-        self.assertFirstLine(out, 'done')
-
-    def test_while_countdown(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '10'),
+        ('while_countdown', """
 var i = 5.
 while i > 0:
     print(i).
     i--.
 ;
-""")
-        self.assertOutputExact(out, ['5', '4', '3', '2', '1'])
-
-    def test_while_with_compound_condition(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['5', '4', '3', '2', '1']),
+        ('while_with_compound_condition', """
 var i = 0.
 var found = False.
 while i < 100 and not found:
@@ -969,104 +957,96 @@ while i < 100 and not found:
     i++.
 ;
 print(i).
+""", 'FirstLine', '43'),
+    ]
+
+    def test_while_false(self):
+        """While with initially false condition doesn't execute."""
+        out = self.run_code_stdout("""
+while False:
+    print("never").
+;
+print("done").
 """)
-        self.assertFirstLine(out, '43')
+        self.assertFirstLine(out, 'done')
 
 
 # ═════════════════════════════════════════════════════════════
 #  IMPLICIT MULTIPLICATION
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestImplicitMultiplication(TestInterpreter):
     """Implicit multiplication: 3x, 2(expr), etc."""
 
-    def test_number_times_variable(self):
-        out, _ = self.run_code('var x = 5.\nprint(2x).')
-        self.assertFirstLine(out, '10')
-
-    def test_number_times_paren(self):
-        out, _ = self.run_code('print(2(3 + 4)).')
-        self.assertFirstLine(out, '14')
-
-    def test_paren_times_paren(self):
-        out, _ = self.run_code('print((2 + 1)(3 + 1)).')
-        self.assertFirstLine(out, '12')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('number_times_variable', 'var x = 5.\nprint(2x).', 'FirstLine', '10'),
+        ('number_times_paren', 'print(2(3 + 4)).', 'FirstLine', '14'),
+        ('paren_times_paren', 'print((2 + 1)(3 + 1)).', 'FirstLine', '12'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  OF KEYWORD
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestOfKeyword(TestInterpreter):
     """The 'of' keyword for reversed method call syntax."""
 
-    def test_of_with_method(self):
-        out, _ = self.run_code('var name = "hello".\nprint(upper() of name).')
-        self.assertFirstLine(out, 'HELLO')
-
-    def test_of_with_method_args(self):
-        out, _ = self.run_code('var s = "hello world".\nprint(replace("world", "earth") of s).')
-        self.assertFirstLine(out, 'hello earth')
-
-    def test_of_with_string_literal(self):
-        out, _ = self.run_code('print(upper() of "hi").')
-        self.assertFirstLine(out, 'HI')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('of_with_method', 'var name = "hello".\nprint(upper() of name).', 'FirstLine', 'HELLO'),
+        ('of_with_method_args', 'var s = "hello world".\nprint(replace("world", "earth") of s).', 'FirstLine', 'hello earth'),
+        ('of_with_string_literal', 'print(upper() of "hi").', 'FirstLine', 'HI'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  COMMENTS & SYNTAX
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestSyntax(TestInterpreter):
     """Comments, line continuation, newlines, dot terminator."""
 
-    def test_comments(self):
-        out, _ = self.run_code('--> This is a comment <--\nprint("visible").')
-        self.assertFirstLine(out, 'visible')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('comments', '--> This is a comment <--\nprint("visible").', 'FirstLine', 'visible'),
+        ('multiline_comment', """--> This is a
+multiline
+comment <--
+print("after comment").
+""", 'FirstLine', 'after comment'),
+        ('line_continuation', 'print(1 + `\n2 + `\n3).', 'FirstLine', '6'),
+        ('dot_terminator', 'var x = 10. print(x).', 'FirstLine', '10'),
+        ('pass_statement', 'pass.\nprint("after pass").', 'FirstLine', 'after pass'),
+    ]
 
     def test_hash_comment(self):
         """Single-line # comment should be ignored."""
-        out, _ = self.run_code('# This is a comment\nprint("hello").')
+        out = self.run_code_stdout('# This is a comment\nprint("hello").')
         self.assertFirstLine(out, 'hello')
 
     def test_hash_comment_after_code(self):
         """# comment at end of line (after code) should be ignored."""
-        out, _ = self.run_code('var x = 42  # set x\nprint(x).')
+        out = self.run_code_stdout('var x = 42  # set x\nprint(x).')
         self.assertFirstLine(out, '42')
 
     def test_hash_comment_multiple_lines(self):
         """Multiple consecutive # comments."""
-        out, _ = self.run_code('# line 1\n# line 2\n# line 3\nprint("ok").')
+        out = self.run_code_stdout('# line 1\n# line 2\n# line 3\nprint("ok").')
         self.assertFirstLine(out, 'ok')
 
-    def test_multiline_comment(self):
-        out, _ = self.run_code("""--> This is a
-multiline
-comment <--
-print("after comment").
-""")
-        self.assertFirstLine(out, 'after comment')
-
-    def test_line_continuation(self):
-        out, _ = self.run_code('print(1 + `\n2 + `\n3).')
-        self.assertFirstLine(out, '6')
-
     def test_newline_as_terminator(self):
         """Newlines can act as statement terminators."""
-        out, _ = self.run_code('var x = 10\nprint(x)\n')
+        out = self.run_code_stdout('var x = 10\nprint(x)\n')
         self.assertFirstLine(out, '10')
 
-    def test_dot_terminator(self):
-        out, _ = self.run_code('var x = 10. print(x).')
-        self.assertFirstLine(out, '10')
-
-    def test_pass_statement(self):
-        out, _ = self.run_code('pass.\nprint("after pass").')
-        self.assertFirstLine(out, 'after pass')
-
     def test_empty_function_body_error(self):
         """Empty function bodies should require 'pass'."""
-        out, _ = self.run_code('fn f(): ;')
+        out = self.run_code_stdout('fn f(): ;')
         self.assertOutputHasError(out, 'Empty function body')
 
 
@@ -1074,130 +1054,85 @@ print("after comment").
 #  TYPE CONVERSIONS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestTypeConversions(TestInterpreter):
     """Builtin type conversion functions."""
 
-    def test_int_from_float(self):
-        out, _ = self.run_code('print(int(3.7)).')
-        self.assertFirstLine(out, '3')
-
-    def test_int_from_double(self):
-        out, _ = self.run_code('print(int(42.9)).')
-        self.assertFirstLine(out, '42')
-
-    def test_float_from_int(self):
-        out, _ = self.run_code('print(float(42)).')
-        self.assertOutputContains(out, '42')
-
-    def test_str_from_int(self):
-        out, _ = self.run_code('print(str(42)).')
-        self.assertFirstLine(out, '42')
-
-    def test_bool_from_int(self):
-        out, _ = self.run_code('print(bool(0)).\nprint(bool(1)).')
-        self.assertOutputExact(out, ['False', 'True'])
-
-    def test_type_function(self):
-        out, _ = self.run_code('print(type(42)).\nprint(type("hello")).\nprint(type([1, 2])).')
-        self.assertOutputExact(out, ['int', 'str', 'list'])
+    CASES = [
+        # (name, code, assertion, expected)
+        ('int_from_float', 'print(int(3.7)).', 'FirstLine', '3'),
+        ('int_from_double', 'print(int(42.9)).', 'FirstLine', '42'),
+        ('float_from_int', 'print(float(42)).', 'OutputContains', '42'),
+        ('str_from_int', 'print(str(42)).', 'FirstLine', '42'),
+        ('bool_from_int', 'print(bool(0)).\nprint(bool(1)).', 'OutputExact', ['False', 'True']),
+        ('type_function', 'print(type(42)).\nprint(type("hello")).\nprint(type([1, 2])).', 'OutputExact', ['int', 'str', 'list']),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  MATH FUNCTIONS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestMathFunctions(TestInterpreter):
     """Builtin math functions."""
 
-    def test_abs(self):
-        out, _ = self.run_code('print(abs(-5)).')
-        self.assertFirstLine(out, '5')
-
-    def test_sqrt(self):
-        out, _ = self.run_code('print(sqrt(16)).')
-        self.assertFirstLine(out, '4')
-
-    def test_min_max(self):
-        out, _ = self.run_code('print(min(3, 7)).\nprint(max(3, 7)).')
-        self.assertOutputExact(out, ['3', '7'])
-
-    def test_ceil_floor(self):
-        out, _ = self.run_code('print(ceil(3.2)).\nprint(floor(3.8)).')
-        self.assertOutputExact(out, ['4', '3'])
-
-    def test_round(self):
-        out, _ = self.run_code('print(round(3.7)).')
-        self.assertFirstLine(out, '4')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('abs', 'print(abs(-5)).', 'FirstLine', '5'),
+        ('sqrt', 'print(sqrt(16)).', 'FirstLine', '4'),
+        ('min_max', 'print(min(3, 7)).\nprint(max(3, 7)).', 'OutputExact', ['3', '7']),
+        ('ceil_floor', 'print(ceil(3.2)).\nprint(floor(3.8)).', 'OutputExact', ['4', '3']),
+        ('round', 'print(round(3.7)).', 'FirstLine', '4'),
+        ('log', 'print(log(1)).', 'FirstLine', '0'),
+    ]
 
     def test_sin_cos(self):
-        out, _ = self.run_code('print(sin(0)).\nprint(cos(0)).')
+        out = self.run_code_stdout('print(sin(0)).\nprint(cos(0)).')
         got = self.lines(out)
         self.assertIn('0', got[0])
         self.assertIn('1', got[1])
 
-    def test_log(self):
-        out, _ = self.run_code('print(log(1)).')
-        self.assertFirstLine(out, '0')
-
 
 # ═════════════════════════════════════════════════════════════
 #  BUILTIN FUNCTIONS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestBuiltins(TestInterpreter):
     """Various builtin functions."""
 
-    def test_print(self):
-        out, _ = self.run_code('print("hello world").')
-        self.assertFirstLine(out, 'hello world')
-
-    def test_len_list(self):
-        out, _ = self.run_code('print(len([1, 2, 3])).')
-        self.assertFirstLine(out, '3')
-
-    def test_len_string(self):
-        out, _ = self.run_code('print(len("hello")).')
-        self.assertFirstLine(out, '5')
-
-    def test_isinstance(self):
-        out, _ = self.run_code('print(isinstance(42, "int")).\nprint(isinstance("hi", "str")).')
-        self.assertOutputExact(out, ['True', 'True'])
+    CASES = [
+        # (name, code, assertion, expected)
+        ('print', 'print("hello world").', 'FirstLine', 'hello world'),
+        ('len_list', 'print(len([1, 2, 3])).', 'FirstLine', '3'),
+        ('len_string', 'print(len("hello")).', 'FirstLine', '5'),
+        ('isinstance', 'print(isinstance(42, "int")).\nprint(isinstance("hi", "str")).', 'OutputExact', ['True', 'True']),
+        ('all_any', 'print(all([True, True, True])).\nprint(any([False, False, True])).', 'OutputExact', ['True', 'True']),
+        ('all_false', 'print(all([True, False, True])).\nprint(any([False, False, False])).', 'OutputExact', ['False', 'False']),
+        ('sum', 'print(sum([1, 2, 3, 4, 5])).', 'FirstLine', '15'),
+        ('repr', 'print(repr("hello")).', 'OutputContains', 'hello'),
+    ]
 
     def test_range_list(self):
-        out, _ = self.run_code('print(range_list(0, 5)).')
+        out = self.run_code_stdout('print(range_list(0, 5)).')
         self.assertOutputContains(out, '0')
         self.assertOutputContains(out, '5')
 
-    def test_all_any(self):
-        out, _ = self.run_code('print(all([True, True, True])).\nprint(any([False, False, True])).')
-        self.assertOutputExact(out, ['True', 'True'])
-
-    def test_all_false(self):
-        out, _ = self.run_code('print(all([True, False, True])).\nprint(any([False, False, False])).')
-        self.assertOutputExact(out, ['False', 'False'])
-
-    def test_sum(self):
-        out, _ = self.run_code('print(sum([1, 2, 3, 4, 5])).')
-        self.assertFirstLine(out, '15')
-
     def test_sorted(self):
-        out, _ = self.run_code('print(sorted([5, 3, 1, 4, 2])).')
+        out = self.run_code_stdout('print(sorted([5, 3, 1, 4, 2])).')
         got = self.lines(out)
         self.assertTrue('1' in got[0] and '5' in got[0])
 
     def test_reversed(self):
-        out, _ = self.run_code('print(reversed([1, 2, 3])).')
+        out = self.run_code_stdout('print(reversed([1, 2, 3])).')
         got = self.lines(out)
         self.assertIn('3', got[0])
 
-    def test_repr(self):
-        out, _ = self.run_code('print(repr("hello")).')
-        self.assertOutputContains(out, 'hello')
-
     def test_input_function_not_crash(self):
         """input() should exist but we can't test interactively."""
         # Just verify it doesn't crash during parsing
-        out, _ = self.run_code('fn f(): var x = input("prompt: ") ;')
+        out = self.run_code_stdout('fn f(): var x = input("prompt: ") ;')
         # Should parse fine (no execution since we don't call f)
         self.assertEqual(self.lines(out), [])
 
@@ -1206,111 +1141,87 @@ class TestBuiltins(TestInterpreter):
 #  DOT METHODS ON TYPES
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestDotMethods(TestInterpreter):
     """Dot-method dispatch on various types."""
 
-    def test_type_method(self):
-        out, _ = self.run_code('var x = 42.\nprint(x.type()).')
-        self.assertFirstLine(out, 'int')
-
-    def test_str_method(self):
-        out, _ = self.run_code('var x = 42.\nprint(x.str()).')
-        self.assertFirstLine(out, '42')
-
-    def test_is_int_method(self):
-        out, _ = self.run_code('var x = 42.\nprint(x.is_int()).')
-        self.assertFirstLine(out, 'True')
-
-    def test_is_string_method(self):
-        out, _ = self.run_code('var x = "hi".\nprint(x.is_string()).')
-        self.assertFirstLine(out, 'True')
-
-    def test_is_none_method(self):
-        out, _ = self.run_code('var x.\nprint(x.is_none()).')
-        self.assertFirstLine(out, 'True')
-
-    def test_is_list_method(self):
-        out, _ = self.run_code('var x = [1, 2].\nprint(x.is_list()).')
-        self.assertFirstLine(out, 'True')
-
-    def test_to_double_method(self):
-        out, _ = self.run_code('var x = 42.\nprint(x.toDouble()).')
-        self.assertOutputContains(out, '42')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('type_method', 'var x = 42.\nprint(x.type()).', 'FirstLine', 'int'),
+        ('str_method', 'var x = 42.\nprint(x.str()).', 'FirstLine', '42'),
+        ('is_int_method', 'var x = 42.\nprint(x.is_int()).', 'FirstLine', 'True'),
+        ('is_string_method', 'var x = "hi".\nprint(x.is_string()).', 'FirstLine', 'True'),
+        ('is_none_method', 'var x.\nprint(x.is_none()).', 'FirstLine', 'True'),
+        ('is_list_method', 'var x = [1, 2].\nprint(x.is_list()).', 'FirstLine', 'True'),
+        ('to_double_method', 'var x = 42.\nprint(x.toDouble()).', 'OutputContains', '42'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  NONE TYPE
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestNoneType(TestInterpreter):
     """None type behavior."""
 
-    def test_none_literal(self):
-        out, _ = self.run_code('print(None).')
-        self.assertFirstLine(out, 'None')
-
-    def test_var_default_is_none(self):
-        out, _ = self.run_code('var x.\nprint(x).\nprint(x == None).')
-        self.assertOutputExact(out, ['None', 'True'])
-
-    def test_none_is_falsy(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('none_literal', 'print(None).', 'FirstLine', 'None'),
+        ('var_default_is_none', 'var x.\nprint(x).\nprint(x == None).', 'OutputExact', ['None', 'True']),
+        ('none_is_falsy', """
 var x.
 if x:
     print("truthy")
 else:
     print("falsy")
 ;
-""")
-        self.assertFirstLine(out, 'falsy')
-
-    def test_function_no_give_is_none(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'falsy'),
+        ('function_no_give_is_none', """
 fn noop():
     var x = 1.
 ;
 var result = noop().
 print(result).
 print(result == None).
-""")
-        self.assertOutputExact(out, ['None', 'True'])
+""", 'OutputExact', ['None', 'True']),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  EDGE CASES & STRESS TESTS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestEdgeCases(TestInterpreter):
     """Edge cases, weird syntax, and potential parser-breakers."""
 
+    CASES = [
+        # (name, code, assertion, expected)
+        ('chained_string_methods', 'print("  Hello World  ".strip().lower()).', 'FirstLine', 'hello world'),
+        ('empty_string_operations', 'print(len("")).', 'FirstLine', '0'),
+        ('string_with_numbers', 'print("abc" + str(123) + "def").', 'FirstLine', 'abc123def'),
+        ('boolean_in_arithmetic', 'print(True + True).\nprint(False + 1).', 'OutputExact', ['2', '1']),
+        ('mixed_quotes_in_string', "print(\"it's\").", 'FirstLine', "it's"),
+        ('single_quotes_with_double_inside', "print('he said \"hi\"').", 'FirstLine', 'he said "hi"'),
+        ('multiple_statements_one_line', 'var x = 1. var y = 2. print(x + y).', 'FirstLine', '3'),
+        ('operator_chaining', 'print(1 + 2 + 3 + 4 + 5).', 'FirstLine', '15'),
+        ('multiplication_chain', 'print(2 * 3 * 4).', 'FirstLine', '24'),
+        ('mixed_operators', 'print(10 + 5 * 2 - 3).', 'FirstLine', '17'),
+    ]
+
     def test_deeply_nested_expression(self):
-        out, _ = self.run_code('print(((((1 + 2) * 3) - 4) / 5) + 6).')
+        out = self.run_code_stdout('print(((((1 + 2) * 3) - 4) / 5) + 6).')
         got = self.lines(out)
         # ((((3)*3) - 4) / 5) + 6 = (9 - 4) / 5 + 6 = 1 + 6 = 7
         self.assertIn('7', got[0])
 
-    def test_chained_string_methods(self):
-        out, _ = self.run_code('print("  Hello World  ".strip().lower()).')
-        self.assertFirstLine(out, 'hello world')
-
     def test_chained_list_operations(self):
-        out, _ = self.run_code('print([3, 1, 2].sort().reverse()).')
+        out = self.run_code_stdout('print([3, 1, 2].sort().reverse()).')
         got = self.lines(out)
         # sort returns [1,2,3], reverse returns [3,2,1]
         self.assertIn('3', got[0])
 
-    def test_empty_string_operations(self):
-        out, _ = self.run_code('print(len("")).')
-        self.assertFirstLine(out, '0')
-
-    def test_string_with_numbers(self):
-        out, _ = self.run_code('print("abc" + str(123) + "def").')
-        self.assertFirstLine(out, 'abc123def')
-
-    def test_boolean_in_arithmetic(self):
-        out, _ = self.run_code('print(True + True).\nprint(False + 1).')
-        self.assertOutputExact(out, ['2', '1'])
-
     def test_many_variables(self):
         code = ''
         for i in range(50):
@@ -1319,38 +1230,26 @@ class TestEdgeCases(TestInterpreter):
         for i in range(50):
             code += f'total += v{i}.\n'
         code += 'print(total).\n'
-        out, _ = self.run_code(code)
+        out = self.run_code_stdout(code)
         # sum 0..49 = 1225
         self.assertFirstLine(out, '1225')
 
     def test_long_string(self):
-        out, _ = self.run_code('print("a" * 100).')
+        out = self.run_code_stdout('print("a" * 100).')
         got = self.lines(out)
         self.assertEqual(len(got[0]), 100)
 
-    def test_mixed_quotes_in_string(self):
-        out, _ = self.run_code("print(\"it's\").")
-        self.assertFirstLine(out, "it's")
-
-    def test_single_quotes_with_double_inside(self):
-        out, _ = self.run_code("print('he said \"hi\"').")
-        self.assertFirstLine(out, 'he said "hi"')
-
     def test_expression_auto_print_none_suppressed(self):
         """None results should NOT be auto-printed by ExprStmt."""
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 fn noop(): pass ;
 noop().
 print("done").
 """)
         self.assertOutputExact(out, ['done'])
 
-    def test_multiple_statements_one_line(self):
-        out, _ = self.run_code('var x = 1. var y = 2. print(x + y).')
-        self.assertFirstLine(out, '3')
-
     def test_print_multiple_types(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 print(42).
 print(3.14).
 print("hello").
@@ -1366,20 +1265,8 @@ print({3, 4}).
         self.assertEqual(got[3], 'True')
         self.assertEqual(got[4], 'None')
 
-    def test_operator_chaining(self):
-        out, _ = self.run_code('print(1 + 2 + 3 + 4 + 5).')
-        self.assertFirstLine(out, '15')
-
-    def test_multiplication_chain(self):
-        out, _ = self.run_code('print(2 * 3 * 4).')
-        self.assertFirstLine(out, '24')
-
-    def test_mixed_operators(self):
-        out, _ = self.run_code('print(10 + 5 * 2 - 3).')
-        self.assertFirstLine(out, '17')
-
     def test_negative_loop_range(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var items = [].
 for i in range(from 3 to 1 step -1):
     items.append(i).
@@ -1394,76 +1281,44 @@ print(items).
 #  ERROR HANDLING
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestErrors(TestInterpreter):
     """Error messages and error paths."""
 
-    def test_division_by_zero_error(self):
-        out, _ = self.run_code('print(1 / 0).')
-        self.assertOutputHasError(out, 'Division by zero')
-
-    def test_unknown_function_error(self):
-        out, _ = self.run_code('noSuchFunction().')
-        self.assertOutputHasError(out, 'Unknown function')
-
-    def test_wrong_arity_error(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('division_by_zero_error', 'print(1 / 0).', 'OutputHasError', 'Division by zero'),
+        ('unknown_function_error', 'noSuchFunction().', 'OutputHasError', 'Unknown function'),
+        ('wrong_arity_error', """
 fn f(a, b): give a + b ;
 f(1).
-""")
-        self.assertOutputHasError(out, 'Unknown function')
-
-    def test_unterminated_string_error(self):
-        out, _ = self.run_code('print("unterminated).')
-        self.assertOutputHasError(out, 'Unterminated string')
-
-    def test_duplicate_param(self):
-        out, _ = self.run_code('fn f(x, x): pass ;')
-        self.assertOutputHasError(out, 'Duplicate parameter')
-
-    def test_empty_function_body(self):
-        out, _ = self.run_code('fn f(): ;')
-        self.assertOutputHasError(out, 'Empty function body')
-
-    def test_zero_step_error(self):
-        out, _ = self.run_code("""
+""", 'OutputHasError', 'Unknown function'),
+        ('unterminated_string_error', 'print("unterminated).', 'OutputHasError', 'Unterminated string'),
+        ('string_repeat_too_long_error', """
+var s = "abcd" * 4611686018427387905.
+print(len(s)).
+""", 'OutputHasError', 'repeated string is too long'),
+        ('duplicate_param','fn f(x, x): pass ;', 'OutputHasError', 'Duplicate parameter'),
+        ('empty_function_body', 'fn f(): ;', 'OutputHasError', 'Empty function body'),
+        ('zero_step_error', """
 for i in range(from 1 to 10 step 0):
     print(i).
 ;
-""")
-        self.assertOutputHasError(out, 'Step cannot be zero')
+""", 'OutputHasError', 'Step cannot be zero'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  COMPLEX PROGRAMS
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestComplexPrograms(TestInterpreter):
     """Full programs combining multiple features."""
 
-    def test_fizzbuzz(self):
-        out, _ = self.run_code("""
-for i in range(from 1 to 15):
-    if i % 15 == 0:
-        print("FizzBuzz")
-    elif i % 3 == 0:
-        print("Fizz")
-    elif i % 5 == 0:
-        print("Buzz")
-    else:
-        print(i)
-    ;
-;
-""")
-        got = self.lines(out)
-        self.assertEqual(got[0], '1')
-        self.assertEqual(got[1], '2')
-        self.assertEqual(got[2], 'Fizz')
-        self.assertEqual(got[3], '4')
-        self.assertEqual(got[4], 'Buzz')
-        self.assertEqual(got[14], 'FizzBuzz')
-
-    def test_sum_of_squares(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('sum_of_squares', """
 fn sumOfSquares(n):
     var total = 0.
     for i in range(from 1 to n):
@@ -1472,44 +1327,30 @@ fn sumOfSquares(n):
     give total
 ;
 print(sumOfSquares(5)).
-""")
-        # 1 + 4 + 9 + 16 + 25 = 55
-        self.assertFirstLine(out, '55')
-
-    def test_string_processing(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '55'),
+        ('string_processing', """
 var words = "hello world foo bar".split(" ").
 for word in words:
     print(word.upper()).
 ;
-""")
-        self.assertOutputExact(out, ['HELLO', 'WORLD', 'FOO', 'BAR'])
-
-    def test_function_composition(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['HELLO', 'WORLD', 'FOO', 'BAR']),
+        ('function_composition', """
 fn dbl(x): give x * 2 ;
 fn inc(x): give x + 1 ;
 fn apply(x):
     give inc(dbl(x))
 ;
 print(apply(5)).
-""")
-        # dbl(5) = 10, inc(10) = 11
-        self.assertFirstLine(out, '11')
-
-    def test_accumulator_pattern(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '11'),
+        ('accumulator_pattern', """
 var total = 0.
 var items = [10, 20, 30, 40, 50].
 for item in items:
     total += item.
 ;
 print(total).
-""")
-        self.assertFirstLine(out, '150')
-
-    def test_grade_calculator(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '150'),
+        ('grade_calculator', """
 fn grade(score):
     if score >= 90: give "A" ;
     if score >= 80: give "B" ;
@@ -1522,11 +1363,8 @@ print(grade(85)).
 print(grade(75)).
 print(grade(65)).
 print(grade(50)).
-""")
-        self.assertOutputExact(out, ['A', 'B', 'C', 'D', 'F'])
-
-    def test_counter_with_while(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['A', 'B', 'C', 'D', 'F']),
+        ('counter_with_while', """
 var count = 0.
 var i = 1.
 while i <= 100:
@@ -1536,12 +1374,8 @@ while i <= 100:
     i++.
 ;
 print(count).
-""")
-        # Numbers 1-100 divisible by 7: 7, 14, 21, 28, 35, 42, 49, 56, 63, 70, 77, 84, 91, 98 = 14
-        self.assertFirstLine(out, '14')
-
-    def test_pass_by_ref_accumulate(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '14'),
+        ('pass_by_ref_accumulate', """
 fn addTo(@total, val):
     total = total + val.
 ;
@@ -1550,11 +1384,8 @@ addTo(sum, 10).
 addTo(sum, 20).
 addTo(sum, 30).
 print(sum).
-""")
-        self.assertFirstLine(out, '60')
-
-    def test_list_building_with_functions(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '60'),
+        ('list_building_with_functions', """
 fn sumRange(n):
     var total = 0.
     for i in range(from 1 to n):
@@ -1563,22 +1394,15 @@ fn sumRange(n):
     give total
 ;
 print(sumRange(5)).
-""")
-        # 1+2+3+4+5 = 15
-        self.assertFirstLine(out, '15')
-
-    def test_recursive_power(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '15'),
+        ('recursive_power', """
 fn power(base, exp):
     if exp == 0: give 1 ;
     give base * power(base, exp - 1)
 ;
 print(power(2, 10)).
-""")
-        self.assertFirstLine(out, '1024')
-
-    def test_overloaded_functions_program(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '1024'),
+        ('overloaded_functions_program', """
 fn describe(x):
     give "one arg: " + str(x)
 ;
@@ -1591,34 +1415,55 @@ fn describe(x, y, z):
 print(describe(1)).
 print(describe(1, 2)).
 print(describe(1, 2, 3)).
-""")
-        self.assertOutputExact(out, [
+""", 'OutputExact', [
             'one arg: 1',
             'two args: 1, 2',
             'three args: 1, 2, 3'
-        ])
+        ]),
+    ]
+
+    def test_fizzbuzz(self):
+        out = self.run_code_stdout("""
+for i in range(from 1 to 15):
+    if i % 15 == 0:
+        print("FizzBuzz")
+    elif i % 3 == 0:
+        print("Fizz")
+    elif i % 5 == 0:
+        print("Buzz")
+    else:
+        print(i)
+    ;
+;
+""")
+        got = self.lines(out)
+        self.assertEqual(got[0], '1')
+        self.assertEqual(got[1], '2')
+        self.assertEqual(got[2], 'Fizz')
+        self.assertEqual(got[3], '4')
+        self.assertEqual(got[4], 'Buzz')
+        self.assertEqual(got[14], 'FizzBuzz')
 
 
 # ═════════════════════════════════════════════════════════════
 #  MULTI-LINE & FORMATTING
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestMultiLine(TestInterpreter):
     """Multi-line code, indentation, block structure."""
 
-    def test_multiline_function(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('multiline_function', """
 fn calculate(a, b, c):
     var sum = a + b + c.
     var avg = sum / 3.
     give avg
 ;
 print(calculate(10, 20, 30)).
-""")
-        self.assertFirstLine(out, '20')
-
-    def test_deeply_nested_blocks(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '20'),
+        ('deeply_nested_blocks', """
 var result = 0.
 for i in range(from 1 to 3):
     for j in range(from 1 to 3):
@@ -1628,126 +1473,147 @@ for i in range(from 1 to 3):
     ;
 ;
 print(result).
-""")
-        # i==j: (1,1)=1, (2,2)=4, (3,3)=9 → 14
-        self.assertFirstLine(out, '14')
-
-    def test_function_calling_function(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '14'),
+        ('function_calling_function', """
 fn square(x): give x * x ;
 fn sumSquares(a, b): give square(a) + square(b) ;
 print(sumSquares(3, 4)).
-""")
-        # 9 + 16 = 25
-        self.assertFirstLine(out, '25')
+""", 'FirstLine', '25'),
+    ]
 
 
 # ═════════════════════════════════════════════════════════════
 #  DICT ARROW LITERALS  {"key" -> value}
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestDictArrowLiterals(TestInterpreter):
     """Test dict declaration with arrow syntax {key -> value}."""
 
-    def test_dict_basic_creation(self):
-        out, _ = self.run_code('var d = {"name" -> "Alice", "age" -> 30}\nprint(d.type()).')
-        self.assertFirstLine(out, 'dict')
-
-    def test_dict_get_string_value(self):
-        out, _ = self.run_code('var d = {"name" -> "Alice", "age" -> 30}\nprint(d.get("name")).')
-        self.assertFirstLine(out, 'Alice')
-
-    def test_dict_get_int_value(self):
-        out, _ = self.run_code('var d = {"name" -> "Alice", "age" -> 30}\nprint(d.get("age")).')
-        self.assertFirstLine(out, '30')
-
-    def test_dict_get_missing_returns_none(self):
-        out, _ = self.run_code('var d = {"a" -> 1}\nprint(d.get("missing")).')
-        self.assertFirstLine(out, 'None')
-
-    def test_dict_get_missing_with_default(self):
-        out, _ = self.run_code('var d = {"a" -> 1}\nprint(d.get("missing", "fallback")).')
-        self.assertFirstLine(out, 'fallback')
-
-    def test_dict_multiple_keys(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('dict_basic_creation', 'var d = {"name" -> "Alice", "age" -> 30}\nprint(d.type()).', 'FirstLine', 'dict'),
+        ('dict_get_string_value', 'var d = {"name" -> "Alice", "age" -> 30}\nprint(d.get("name")).', 'FirstLine', 'Alice'),
+        ('dict_get_int_value', 'var d = {"name" -> "Alice", "age" -> 30}\nprint(d.get("age")).', 'FirstLine', '30'),
+        ('dict_get_missing_returns_none', 'var d = {"a" -> 1}\nprint(d.get("missing")).', 'FirstLine', 'None'),
+        ('dict_get_missing_with_default', 'var d = {"a" -> 1}\nprint(d.get("missing", "fallback")).', 'FirstLine', 'fallback'),
+        ('dict_multiple_keys', """
 var d = {"x" -> 10, "y" -> 20, "z" -> 30}
 print(d.get("x"))
 print(d.get("y"))
 print(d.get("z")).
-""")
-        self.assertOutputExact(out, ['10', '20', '30'])
-
-    def test_dict_pprint(self):
-        out, _ = self.run_code('var d = {"key" -> "val"}\npprint(d).')
-        self.assertOutputContains(out, '"key"')
-        self.assertOutputContains(out, 'val')
-
-    def test_dict_let_be_syntax(self):
-        out, _ = self.run_code('let d be {"color" -> "red"}\nprint(d.get("color")).')
-        self.assertFirstLine(out, 'red')
-
-    def test_dict_size(self):
-        out, _ = self.run_code('var d = {"a" -> 1, "b" -> 2, "c" -> 3}\nprint(len(d)).')
-        self.assertFirstLine(out, '3')
-
-    def test_dict_contains(self):
-        out, _ = self.run_code('var d = {"fruit" -> "apple"}\nprint(d.contains("fruit"))\nprint(d.contains("veggie")).')
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_dict_keys(self):
-        out, _ = self.run_code('var d = {"a" -> 1}\nprint(d.keys()).')
-        self.assertOutputContains(out, 'a')
-
-    def test_dict_values(self):
-        out, _ = self.run_code('var d = {"a" -> 42}\nprint(d.values()).')
-        self.assertOutputContains(out, '42')
-
-    def test_dict_mixed_value_types(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['10', '20', '30']),
+        ('dict_let_be_syntax', 'let d be {"color" -> "red"}\nprint(d.get("color")).', 'FirstLine', 'red'),
+        ('dict_size', 'var d = {"a" -> 1, "b" -> 2, "c" -> 3}\nprint(len(d)).', 'FirstLine', '3'),
+        ('dict_contains', 'var d = {"fruit" -> "apple"}\nprint(d.contains("fruit"))\nprint(d.contains("veggie")).', 'OutputExact', ['True', 'False']),
+        ('dict_keys', 'var d = {"a" -> 1}\nprint(d.keys()).', 'OutputContains', 'a'),
+        ('dict_values', 'var d = {"a" -> 42}\nprint(d.values()).', 'OutputContains', '42'),
+        ('dict_mixed_value_types', """
 var d = {"s" -> "hello", "i" -> 42, "f" -> 3.14, "b" -> True}
 print(d.get("s"))
 print(d.get("i"))
 print(d.get("f"))
 print(d.get("b")).
-""")
-        self.assertOutputExact(out, ['hello', '42', '3.14', 'True'])
-
-    def test_dict_multiple_create_and_get(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['hello', '42', '3.14', 'True']),
+        ('dict_multiple_create_and_get', """
 var d = {"a" -> 1, "b" -> 2, "c" -> 3}
 print(d.get("a"))
 print(d.get("b"))
 print(d.get("c")).
-""")
-        self.assertOutputExact(out, ['1', '2', '3'])
-
-    def test_dict_clear(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['1', '2', '3']),
+        ('dict_clear', """
 var d = {"a" -> 1, "b" -> 2}
 d.clear()
 print(d.size()).
-""")
-        self.assertFirstLine(out, '0')
+""", 'FirstLine', '0'),
+    ]
+
+    def test_dict_pprint(self):
+        out = self.run_code_stdout('var d = {"key" -> "val"}\npprint(d).')
+        self.assertOutputContains(out, '"key"')
+        self.assertOutputContains(out, 'val')
 
 
 # ═════════════════════════════════════════════════════════════
 #  GRAPH API
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestGraphAPI(TestInterpreter):
     """Test graph() constructor and graph methods."""
 
-    def test_graph_create_empty(self):
-        out, _ = self.run_code('var g = graph()\nprint(g.type()).')
-        self.assertFirstLine(out, 'graph')
-
-    def test_graph_create_with_nodes(self):
-        out, _ = self.run_code('var g = graph(5)\nprint(g.node_count()).')
-        self.assertFirstLine(out, '5')
+    CASES = [
+        # (name, code, assertion, expected)
+        ('graph_create_empty', 'var g = graph()\nprint(g.type()).', 'FirstLine', 'graph'),
+        ('graph_create_with_nodes', 'var g = graph(5)\nprint(g.node_count()).', 'FirstLine', '5'),
+        ('graph_add_edge_positional', """
+var g = graph(3)
+g.add_edge(0, 1)
+g.add_edge(1, 2)
+print(g.edge_count()).
+""", 'FirstLine', '4'),
+        ('graph_has_cycle_false', """
+var g = graph(3)
+g.add_edge(0, 1)
+g.add_edge(1, 2)
+print(g.has_cycle()).
+""", 'FirstLine', 'False'),
+        ('graph_has_cycle_true', """
+var g = graph(3)
+g.add_edge(0, 1)
+g.add_edge(1, 2)
+g.add_edge(2, 0)
+print(g.has_cycle()).
+""", 'FirstLine', 'True'),
+        ('graph_is_connected', """
+var g = graph(3)
+g.add_edge(0, 1)
+g.add_edge(1, 2)
+print(g.is_connected()).
+""", 'FirstLine', 'True'),
+        ('graph_is_not_connected', """
+var g = graph(3)
+g.add_edge(0, 1)
+print(g.is_connected()).
+""", 'FirstLine', 'False'),
+        ('graph_weighted_edge', """
+var g = graph(2)
+g.add_edge(0, 1, 5.5)
+print(g.get_edge_weight(0, 1)).
+""", 'FirstLine', '5.5'),
+        ('graph_remove_node', """
+var g = graph(3)
+g.remove_node(2)
+print(g.node_count()).
+""", 'FirstLine', '2'),
+        ('graph_has_edge', """
+var g = graph(3)
+g.add_edge(0, 1)
+print(g.has_edge(0, 1))
+print(g.has_edge(0, 2)).
+""", 'OutputExact', ['True', 'False']),
+        ('graph_set_and_get_node_data', """
+var g = graph(3)
+g.set_node_data(0, "start")
+g.set_node_data(1, "middle")
+print(g.get_node_data(0))
+print(g.get_node_data(1)).
+""", 'OutputExact', ['start', 'middle']),
+        ('graph_out_degree', """
+var g = graph(3)
+g.add_edge(0, 1)
+g.add_edge(0, 2)
+print(g.out_degree(0)).
+""", 'FirstLine', '2'),
+        ('graph_size_same_as_node_count', """
+var g = graph(7)
+print(g.size())
+print(g.node_count()).
+""", 'OutputExact', ['7', '7']),
+    ]
 
     def test_graph_add_node(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph()
 g.add_node()
 g.add_node()
@@ -1757,24 +1623,14 @@ print(g.node_count()).
         got = self.lines(out)
         self.assertEqual(got[-1], '2')
 
-    def test_graph_add_edge_positional(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.add_edge(0, 1)
-g.add_edge(1, 2)
-print(g.edge_count()).
-""")
-        # positional add_edge(from, to) adds bidirectional edges: 2 per call = 4
-        self.assertFirstLine(out, '4')
-
     def test_graph_nodes_list(self):
-        out, _ = self.run_code('var g = graph(3)\nprint(g.nodes()).')
+        out = self.run_code_stdout('var g = graph(3)\nprint(g.nodes()).')
         self.assertOutputContains(out, '0')
         self.assertOutputContains(out, '1')
         self.assertOutputContains(out, '2')
 
     def test_graph_neighbors(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph(3)
 g.add_edge(0, 1)
 g.add_edge(0, 2)
@@ -1784,7 +1640,7 @@ print(g.neighbors(0)).
         self.assertOutputContains(out, '2')
 
     def test_graph_bfs(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph(4)
 g.add_edge(0, 1)
 g.add_edge(1, 2)
@@ -1795,7 +1651,7 @@ print(g.bfs(0)).
         self.assertOutputContains(out, '3')
 
     def test_graph_dfs(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph(4)
 g.add_edge(0, 1)
 g.add_edge(1, 2)
@@ -1805,79 +1661,8 @@ print(g.dfs(0)).
         self.assertOutputContains(out, '0')
         self.assertOutputContains(out, '3')
 
-    def test_graph_has_cycle_false(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.add_edge(0, 1)
-g.add_edge(1, 2)
-print(g.has_cycle()).
-""")
-        self.assertFirstLine(out, 'False')
-
-    def test_graph_has_cycle_true(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.add_edge(0, 1)
-g.add_edge(1, 2)
-g.add_edge(2, 0)
-print(g.has_cycle()).
-""")
-        self.assertFirstLine(out, 'True')
-
-    def test_graph_is_connected(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.add_edge(0, 1)
-g.add_edge(1, 2)
-print(g.is_connected()).
-""")
-        self.assertFirstLine(out, 'True')
-
-    def test_graph_is_not_connected(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.add_edge(0, 1)
-print(g.is_connected()).
-""")
-        self.assertFirstLine(out, 'False')
-
-    def test_graph_weighted_edge(self):
-        out, _ = self.run_code("""
-var g = graph(2)
-g.add_edge(0, 1, 5.5)
-print(g.get_edge_weight(0, 1)).
-""")
-        self.assertFirstLine(out, '5.5')
-
-    def test_graph_remove_node(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.remove_node(2)
-print(g.node_count()).
-""")
-        self.assertFirstLine(out, '2')
-
-    def test_graph_has_edge(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.add_edge(0, 1)
-print(g.has_edge(0, 1))
-print(g.has_edge(0, 2)).
-""")
-        self.assertOutputExact(out, ['True', 'False'])
-
-    def test_graph_set_and_get_node_data(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.set_node_data(0, "start")
-g.set_node_data(1, "middle")
-print(g.get_node_data(0))
-print(g.get_node_data(1)).
-""")
-        self.assertOutputExact(out, ['start', 'middle'])
-
     def test_graph_topological_sort(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph(4)
 g.add_edge(0, 1)
 g.add_edge(0, 2)
@@ -1890,7 +1675,7 @@ print(g.topological_sort()).
         self.assertOutputContains(out, '3')
 
     def test_graph_connected_components(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph(4)
 g.add_edge(0, 1)
 g.add_edge(2, 3)
@@ -1900,84 +1685,51 @@ print(g.connected_components()).
         self.assertOutputContains(out, '0')
         self.assertOutputContains(out, '2')
 
-    def test_graph_out_degree(self):
-        out, _ = self.run_code("""
-var g = graph(3)
-g.add_edge(0, 1)
-g.add_edge(0, 2)
-print(g.out_degree(0)).
-""")
-        self.assertFirstLine(out, '2')
-
-    def test_graph_size_same_as_node_count(self):
-        out, _ = self.run_code("""
-var g = graph(7)
-print(g.size())
-print(g.node_count()).
-""")
-        self.assertOutputExact(out, ['7', '7'])
-
 
 # ═════════════════════════════════════════════════════════════
 #  ARROW EDGE SYNTAX  (->  <->  ---)
 # ═════════════════════════════════════════════════════════════
 
+@table_driven
 class TestArrowEdgeSyntax(TestInterpreter):
     """Test directed (->), bidirectional (<->), and undirected (---) edges."""
 
-    def test_directed_edge_arrow(self):
-        out, _ = self.run_code("""
+    CASES = [
+        # (name, code, assertion, expected)
+        ('directed_edge_arrow', """
 var g = graph(3)
 g.add_edge(0 -> 1)
 print(g.has_edge(0, 1)).
-""")
-        self.assertFirstLine(out, 'True')
-
-    def test_directed_edge_with_weight(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'True'),
+        ('directed_edge_with_weight', """
 var g = graph(3)
 g.add_edge(0 -> 1, 2.5)
 print(g.get_edge_weight(0, 1)).
-""")
-        self.assertFirstLine(out, '2.5')
-
-    def test_bidirectional_edge(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '2.5'),
+        ('bidirectional_edge', """
 var g = graph(3)
 g.add_edge(0 <-> 1)
 print(g.has_edge(0, 1))
 print(g.has_edge(1, 0)).
-""")
-        self.assertOutputExact(out, ['True', 'True'])
-
-    def test_bidirectional_edge_with_weight(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['True', 'True']),
+        ('bidirectional_edge_with_weight', """
 var g = graph(3)
 g.add_edge(0 <-> 1, 3.0)
 print(g.get_edge_weight(0, 1))
 print(g.get_edge_weight(1, 0)).
-""")
-        self.assertOutputExact(out, ['3', '3'])
-
-    def test_undirected_edge_triple_dash(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['3', '3']),
+        ('undirected_edge_triple_dash', """
 var g = graph(3)
 g.add_edge(0 --- 1)
 print(g.has_edge(0, 1))
 print(g.has_edge(1, 0)).
-""")
-        self.assertOutputExact(out, ['True', 'True'])
-
-    def test_undirected_edge_with_weight(self):
-        out, _ = self.run_code("""
+""", 'OutputExact', ['True', 'True']),
+        ('undirected_edge_with_weight', """
 var g = graph(3)
 g.add_edge(0 --- 1, 4.0)
 print(g.get_edge_weight(0, 1)).
-""")
-        self.assertFirstLine(out, '4')
-
-    def test_arrow_with_variables(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '4'),
+        ('arrow_with_variables', """
 var g = graph(3)
 var A = 0
 var B = 1
@@ -1985,38 +1737,27 @@ var C = 2
 g.add_edge(A -> B, 1.0)
 g.add_edge(B <-> C, 2.0)
 print(g.edge_count()).
-""")
-        # A->B = 1 edge, B<->C = 2 edges
-        self.assertFirstLine(out, '3')
-
-    def test_mixed_edge_types(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '3'),
+        ('mixed_edge_types', """
 var g = graph(4)
 g.add_edge(0 -> 1)
 g.add_edge(1 <-> 2)
 g.add_edge(2 --- 3)
 print(g.edge_count()).
-""")
-        # directed: 1, bidirectional: 2, undirected: 2 = 5
-        self.assertFirstLine(out, '5')
-
-    def test_edge_spec_is_dict(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', '5'),
+        ('edge_spec_is_dict', """
 var e = 0 -> 1
 print(e.type()).
-""")
-        self.assertFirstLine(out, 'dict')
-
-    def test_edge_spec_from_to(self):
-        out, _ = self.run_code("""
+""", 'FirstLine', 'dict'),
+        ('edge_spec_from_to', """
 var e = 0 -> 1
 print(e.get("__from__"))
 print(e.get("__to__")).
-""")
-        self.assertOutputExact(out, ['0', '1'])
+""", 'OutputExact', ['0', '1']),
+    ]
 
     def test_graph_bfs_with_arrows(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph(4)
 g.add_edge(0 -> 1)
 g.add_edge(1 -> 2)
@@ -2027,7 +1768,7 @@ print(g.bfs(0)).
         self.assertEqual(got[0], '[0, 1, 2, 3]')
 
     def test_graph_shortest_path_with_arrows(self):
-        out, _ = self.run_code("""
+        out = self.run_code_stdout("""
 var g = graph(4)
 g.add_edge(0 -> 1, 1.0)
 g.add_edge(1 -> 2, 1.0)
@@ -2040,6 +1781,28 @@ print(g.get_shortest_path(0, 3)).
         self.assertOutputContains(out, '3')
 
 
+# ═════════════════════════════════════════════════════════════
+#  SERVE MODE (state isolation between snippets)
+# ═════════════════════════════════════════════════════════════
+
+class TestServeMode(TestInterpreter):
+    """Each --serve snippet must start from the state a fresh --script process has."""
+
+    def test_open_files_do_not_leak_between_snippets(self):
+        names = ['_serve_leak_a.txt', '_serve_leak_b.txt']
+        try:
+            # The first snippet leaves its handle open; the second must still get id 1
+            for name in names:
+                out = self.run_code_stdout(f'var f = open("{name}", "w")\nprint(f).')
+                self.assertOutputContains(out, '"__id__": 1')
+        finally:
+            for name in names:
+                try:
+                    os.remove(os.path.join(self._cwd, name))
+                except OSError:
+                    pass
+
+
 # ═════════════════════════════════════════════════════════════
 #  CHECK MODE (--check parse-only diagnostics)
 # ═════════════════════════════════════════════════════════════
@@ -2048,16 +1811,9 @@ class TestCheckMode(TestInterpreter):
     """Test --check flag for parse-only diagnostics."""
 
     def run_check(self, code):
-        """Run ScriptIt code via --check mode."""
-        proc = subprocess.Popen(
-            [self.BINARY, '--check'],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-        stdout, stderr = proc.communicate(input=code.strip(), timeout=10)
-        return stdout, stderr, proc.returncode
+        """Parse ScriptIt code with --check semantics on the server pool, return (stdout, stderr, rc)."""
+        out, err, crashed = self._pool.run(code.strip(), self.TIMEOUT, check=True)
+        return out, err, 1 if crashed else 0
 
     def test_check_valid_code(self):
         out, err, rc = self.run_check('print("hello").')
@@ -17,5874 +17,11 @@ namespace pythonic {
 namespace dispatch {
 using pythonic::vars::var;
 
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for add
-var add__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var add__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for sub
-var sub__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var sub__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for mul
-var mul__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mul__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for div
-var div__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var div__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for mod
-var mod__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var mod__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for eq
-var eq__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var eq__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for ne
-var ne__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ne__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for gt
-var gt__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var gt__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for ge
-var ge__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var ge__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for lt
-var lt__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lt__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for le
-var le__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var le__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for band
-var band__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var band__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for bor
-var bor__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bor__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for bxor
-var bxor__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var bxor__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for shl
-var shl__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shl__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for shr
-var shr__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var shr__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for land
-var land__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var land__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-
-// Forward declarations for all (TypeTag, TypeTag) combinations for lor
-var lor__none__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__none__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__int__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__float__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__string__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__bool__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__long_double__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__uint__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ulong_long__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__list__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__set__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__dict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__orderedset__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__ordereddict__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__none(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__int(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__float(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__string(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__bool(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__long_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__long_double(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__uint(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__ulong(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__ulong_long(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__list(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__set(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__dict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__orderedset(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__ordereddict(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
-var lor__graph__graph(const var&, const var&, pythonic::overflow::Overflow policy = pythonic::overflow::Overflow::Throw, bool smallest_fit = false);
+// The per-(op, TypeTag, TypeTag) stubs have internal linkage in whichever
+// generated source defines them (src/pythonicDispatchStubs.cpp, or one
+// dispatch_<op>.cpp per operator with --out-dir / PYTHONIC_SPLIT_DISPATCH)
+// and are only reachable through OpTable (see pythonicDispatch.hpp), so they
+// are not declared here.
 
 } // namespace dispatch
 } // namespace pythonic
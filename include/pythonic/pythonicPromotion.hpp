@@ -191,5 +191,88 @@ namespace pythonic
             }
         }
 
+        // Compile-time variant of smart_promote for callers whose promotion type,
+        // rank floor and signedness are fixed (the generated dispatch kernels):
+        // the container search is picked by `if constexpr` instead of at runtime.
+        template <Type type, int min_rank, bool force_signed = false>
+        inline var smart_promote(long double result, bool smallest_fit = true)
+        {
+            const int effective_min_rank = smallest_fit ? 1 : min_rank; // never promote anything to bool
+
+            if constexpr (type == Has_float)
+            {
+                return fit_floating_result(result, std::max(effective_min_rank, RANK_FLOAT));
+            }
+            else if constexpr (type == Both_unsigned)
+            {
+                if (result >= 0 && result == std::floor(result))
+                {
+                    return fit_unsigned_result(result, effective_min_rank);
+                }
+                return fit_floating_result(result, effective_min_rank);
+            }
+            else // Signed
+            {
+                if (force_signed || result < 0 || result == std::floor(result))
+                {
+                    return fit_signed_result(result, effective_min_rank);
+                }
+                return fit_floating_result(result, effective_min_rank);
+            }
+        }
+
+#ifdef __SIZEOF_INT128__
+        // True if the exact integer v is representable in T
+        // (W is __int128 or unsigned __int128, which std::numeric_limits may not cover)
+        template <typename T, typename W>
+        constexpr bool fits_in(W v)
+        {
+            if constexpr (W(-1) < W(0))
+            {
+                return v >= static_cast<W>(std::numeric_limits<T>::min()) && v <= static_cast<W>(std::numeric_limits<T>::max());
+            }
+            else
+            {
+                return v <= static_cast<W>(std::numeric_limits<T>::max());
+            }
+        }
+
+        // smart_promote for an exact integer result widened to 128 bits (integer add/sub/mul).
+        // Picks the same container as smart_promote<type, min_rank> would for the same value
+        // (force_signed makes no difference for integral results), but range-checks in integer
+        // registers instead of x87 long double; only results that fit no integer container
+        // are rounded to long double.
+        template <Type type, int min_rank, typename W>
+        inline var smart_promote_i128(W result, bool smallest_fit = true)
+        {
+            static_assert(type != Has_float, "integer promotion only");
+            const int effective_min_rank = smallest_fit ? 1 : min_rank; // never promote anything to bool
+
+            if constexpr (type == Both_unsigned)
+            {
+                // Negative results fall back to floating, as in fit_integer_result
+                if (!(result < W(0)))
+                {
+                    if (effective_min_rank <= RANK_UINT && fits_in<unsigned int>(result))
+                        return var(static_cast<unsigned int>(result));
+                    if (effective_min_rank <= RANK_ULONG && fits_in<unsigned long>(result))
+                        return var(static_cast<unsigned long>(result));
+                    if (effective_min_rank <= RANK_ULONG_LONG && fits_in<unsigned long long>(result))
+                        return var(static_cast<unsigned long long>(result));
+                }
+            }
+            else // Signed
+            {
+                if (effective_min_rank <= RANK_INT && fits_in<int>(result))
+                    return var(static_cast<int>(result));
+                if (effective_min_rank <= RANK_LONG && fits_in<long>(result))
+                    return var(static_cast<long>(result));
+                if (effective_min_rank <= RANK_LONG_LONG && fits_in<long long>(result))
+                    return var(static_cast<long long>(result));
+            }
+            return fit_floating_result(static_cast<long double>(result), effective_min_rank);
+        }
+#endif
+
     } // namespace promotion
 } // namespace pythonic
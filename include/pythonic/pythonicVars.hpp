@@ -2230,10 +2230,18 @@ namespace pythonic
             }
 
             // Arithmetic operators
-            // OPTIMIZED: Uses TypeTag for fast same-type dispatch, falls back to type promotion
-            // Arithmetic operators
+            // OPTIMIZED: int/int and double/double are computed inline (same result as
+            // the generated stubs under the default Throw policy); every other pair
+            // goes through the dispatch table
             inline var operator+(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(pythonic::overflow::add_throw(data_.i, other.data_.i));
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(pythonic::overflow::add_throw(data_.d, other.data_.d));
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Add>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::Throw, false);
             }
@@ -2279,12 +2287,26 @@ namespace pythonic
             }
             inline var operator-(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(pythonic::overflow::sub_throw(data_.i, other.data_.i));
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(pythonic::overflow::sub_throw(data_.d, other.data_.d));
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Sub>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::Throw, false);
             }
 
             inline var operator*(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(pythonic::overflow::mul_throw(data_.i, other.data_.i));
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(pythonic::overflow::mul_throw(data_.d, other.data_.d));
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Mul>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::Throw, false);
             }
@@ -2697,39 +2719,81 @@ namespace pythonic
             }
 
             // Comparison operators (return var(bool) for Pythonic style)
-            // OPTIMIZED: Uses TypeTag for fast same-type dispatch
+            // OPTIMIZED: int/int and double/double compare inline, the rest via the dispatch table
             var operator==(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(data_.i == other.data_.i);
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(data_.d == other.data_.d);
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Eq>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::None_of_them, false);
             }
 
             var operator!=(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(data_.i != other.data_.i);
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(data_.d != other.data_.d);
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Ne>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::None_of_them, false);
             }
 
             var operator<(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(data_.i < other.data_.i);
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(data_.d < other.data_.d);
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Lt>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::None_of_them, false);
             }
 
             var operator>(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(data_.i > other.data_.i);
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(data_.d > other.data_.d);
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Gt>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::None_of_them, false);
             }
 
             var operator>=(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(data_.i >= other.data_.i);
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(data_.d >= other.data_.d);
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Ge>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::None_of_them, false);
             }
 
             var operator<=(const var &other) const
             {
+                if (tag_ == other.tag_)
+                {
+                    if (tag_ == TypeTag::INT)
+                        return var(data_.i <= other.data_.i);
+                    if (tag_ == TypeTag::DOUBLE)
+                        return var(data_.d <= other.data_.d);
+                }
                 auto func = pythonic::dispatch::get_op_func<pythonic::dispatch::Le>(tag_, other.tag_);
                 return func(*this, other, pythonic::overflow::Overflow::None_of_them, false);
             }
@@ -3,184 +3,384 @@
 Extract function signatures defined in C/C++ header files.
 
 Usage:
-  ./extract_functions.py <header-or-dir>... -o output.md
+  ./extract_functions.py <header-or-dir>... -o output.md [-j JOBS]
 
 Writes numbered list of function signatures found in the provided header files.
 Skips functions found inside `private:` sections of `class` definitions.
+Uses google-re2 (`pip install google-re2`) for the whole-file scans when it is
+installed, falling back to the standard `re` module.
 """
 import argparse
+import bisect
+import hashlib
+import mmap
 import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-
-def read_file(path: Path) -> str:
-    return path.read_text(encoding="utf-8", errors="ignore")
-
-
-def remove_comments(src: str) -> str:
+try:
+    # google-re2: linear-time DFA matching for the patterns that scan whole
+    # files. Same syntax and match semantics for the patterns below (no
+    # backreferences or lookaround), so results do not depend on which is used.
+    import re2 as _file_re
+except ImportError:
+    _file_re = re
+
+# Patterns are compiled once at import; every header reuses them. Flags are
+# inline because re2.compile takes no flags argument.
+# Whole-file scans:
+# Both comment forms in one pass; the leftmost wins, so a '/*' inside a '//'
+# comment does not open a block (as in C/C++)
+_COMMENTS = _file_re.compile(rb'(?s)/\*.*?\*/|//[^\n]*')
+_CLASS_BLOCK = _file_re.compile(rb'\b(class|struct)\s+\w+[^{]*\{')
+_ACCESS_SPEC = _file_re.compile(rb'\b(public|private|protected)\s*:')
+# A brace, or a whole single-line string or character literal
+_BRACE_TOKEN = _file_re.compile(rb'[{}]|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'')
+# Signature lines followed by '{' (function with body); multi-line signatures
+# match as one because newlines are allowed before '('
+_FUNC_SIG = _file_re.compile(rb'(?m)(^[^;{}\n][^{;]*?\([^;{}]*?\)\s*(?:[^\{;]*?)\{)')
+# Per-signature cleanup on short strings, where re's startup cost is lower:
+_CONTROL_STMT = re.compile(rb'^(?:if|else|for|while|switch|case|return|goto|break|continue|do|catch|sizeof)\b')
+_FUNC_NAME = re.compile(rb'([A-Za-z_]\w*(?:::\w+)*)\s*\(')
+
+_MMAP_MIN_SIZE = 1 << 20
+
+_HEADER_EXTS = ('.h', '.hpp', '.hh', '.hxx', '.inl', '.ipp', '.inc')
+
+# Qualifiers dropped after a ')' ('const' also covers the front of 'constexpr')
+_QUALIFIER_WORDS = (b'const', b'noexcept', b'volatile', b'mutable')
+_WS = b' \t\n\r\f\v'
+_LEADING_JUNK = b'}' + _WS
+
+# C/C++ keywords and control tokens used in code (not function names)
+_CPP_KEYWORDS = frozenset({
+    b'if', b'else', b'for', b'while', b'switch', b'case', b'return', b'goto', b'break', b'continue',
+    b'do', b'catch', b'sizeof', b'constexpr', b'template', b'throw', b'public', b'private', b'protected'
+})
+
+
+def read_file(path: Path):
+    # Scanning stays in bytes: every pattern is ASCII, so the per-file UTF-8
+    # decode is skipped and only the extracted signatures are decoded.
+    # Headers of _MMAP_MIN_SIZE or more are mapped read-only instead of copied
+    # onto the heap (the caller closes the mapping); for smaller files the
+    # mmap/munmap calls cost more than the copy they save.
+    with open(path, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size < _MMAP_MIN_SIZE:
+            return fh.read()
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def remove_comments(src) -> bytes:
     # Remove /* */ and // comments
-    src = re.sub(r'/\*.*?\*/', '', src, flags=re.S)
-    src = re.sub(r'//.*?$', '', src, flags=re.M)
-    return src
-
-
-def find_class_blocks(src: str):
+    if isinstance(src, bytes):
+        return _COMMENTS.sub(b'', src)
+    # A mapped file: splice the text between comments straight out of the
+    # mapping (re2's sub() only accepts bytes, which would mean a full copy)
+    pieces = []
+    last = 0
+    for m in _COMMENTS.finditer(src):
+        pieces.append(src[last:m.start()])
+        last = m.end()
+    pieces.append(src[last:])
+    return b''.join(pieces)
+
+
+def match_brace(src: bytes, open_idx: int) -> int:
+    # Index just past the '}' closing the '{' at open_idx, or len(src) if unbalanced.
+    # A '{' or '}' inside a "..." or '.' literal does not count toward the depth.
+    #
+    # Fast path: hop between braces with bytes.find (a C memchr scan) instead of
+    # visiting every character. If no quote appears before the brace it finds,
+    # no literal can have hidden a brace and that answer is exact.
+    find = src.find
+    depth = 1
+    end = len(src)
+    next_open = find(b'{', open_idx + 1)
+    next_close = find(b'}', open_idx + 1)
+    while next_close != -1:
+        if next_open != -1 and next_open < next_close:
+            depth += 1
+            next_open = find(b'{', next_open + 1)
+        else:
+            depth -= 1
+            if depth == 0:
+                end = next_close + 1
+                break
+            next_close = find(b'}', next_close + 1)
+    if find(b'"', open_idx, end) == -1 and find(b"'", open_idx, end) == -1:
+        return end
+    # Literals present: walk braces and whole literals in one regex pass
+    depth = 1
+    for m in _BRACE_TOKEN.finditer(src, open_idx + 1):
+        tok = m.group()
+        if tok == b'{':
+            depth += 1
+        elif tok == b'}':
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return len(src)
+
+
+def find_class_blocks(src: bytes):
     # Find class/struct blocks and return list of (start_idx, end_idx, kind)
     blocks = []
-    for m in re.finditer(r'\b(class|struct)\s+\w+[^{]*\{', src):
-        kind = m.group(1)
-        start = m.start()
-        # find matching brace
-        i = m.end() - 1
-        depth = 1
-        N = len(src)
-        while i < N - 1 and depth > 0:
-            i += 1
-            if src[i] == '{':
-                depth += 1
-            elif src[i] == '}':
-                depth -= 1
-        end = i + 1
-        blocks.append((start, end, kind))
+    for m in _CLASS_BLOCK.finditer(src):
+        blocks.append((m.start(), match_brace(src, m.end() - 1), m.group(1)))
     return blocks
 
 
-def private_ranges_in_block(block_src: str, block_offset: int):
+def private_ranges_in_block(block_src: bytes, block_offset: int):
     # Find private: ranges inside a class/struct block
     ranges = []
     # default access: class -> private, struct -> public. We only care about explicit private:
     # find all access specifiers
-    spec_iter = list(re.finditer(r'\b(public|private|protected)\s*:', block_src))
+    spec_iter = list(_ACCESS_SPEC.finditer(block_src))
     for idx, m in enumerate(spec_iter):
         name = m.group(1)
         start = m.end()
         end = len(block_src)
         if idx + 1 < len(spec_iter):
             end = spec_iter[idx + 1].start()
-        if name == 'private':
+        if name == b'private':
             ranges.append((block_offset + start, block_offset + end))
     return ranges
 
 
-def in_any_range(pos: int, ranges) -> bool:
-    for a, b in ranges:
-        if a <= pos < b:
-            return True
-    return False
-
-
-def extract_function_signatures(src: str, filepath: Path):
+def merge_ranges(ranges):
+    # Union of half-open (a, b) ranges as sorted, disjoint (starts, ends) lists.
+    # Ranges from nested classes overlap, so they are merged rather than just sorted.
+    starts, ends = [], []
+    for a, b in sorted(ranges):
+        if a >= b:
+            continue
+        if ends and a <= ends[-1]:
+            if b > ends[-1]:
+                ends[-1] = b
+        else:
+            starts.append(a)
+            ends.append(b)
+    return starts, ends
+
+
+def in_any_range(pos: int, merged) -> bool:
+    # merged is a merge_ranges() result: one bisect instead of a scan of every range
+    starts, ends = merged
+    i = bisect.bisect_right(starts, pos) - 1
+    return i >= 0 and pos < ends[i]
+
+
+def strip_qualifiers(sig: bytes) -> bytes:
+    # Drop const/noexcept/volatile/mutable/throw(...) wherever one follows a
+    # ')' (optionally after whitespace), keeping the ')'. Same edits, in the
+    # same left-to-right non-overlapping order, as a single regex substitution.
+    parts = []
+    start = 0
+    i = sig.find(b')')
+    while i != -1:
+        j = i + 1
+        while j < len(sig) and sig[j] in _WS:
+            j += 1
+        end = -1
+        for word in _QUALIFIER_WORDS:
+            if sig.startswith(word, j):
+                end = j + len(word)
+                break
+        else:
+            if sig.startswith(b'throw(', j):
+                end = sig.find(b')', j + 6)
+                if end != -1:
+                    end += 1
+        if end == -1:
+            i = sig.find(b')', i + 1)
+            continue
+        parts.append(sig[start:i + 1])
+        start = end
+        i = sig.find(b')', end)
+    if not parts:
+        return sig
+    parts.append(sig[start:])
+    return b''.join(parts)
+
+
+def extract_function_signatures(src, filepath: Path):
+    # Declaration-only headers: a definition needs both '(' and '{', and
+    # stripping comments only removes characters. The `in` checks are memchr
+    # scans, far cheaper than the comment and signature regexes.
+    if b'{' not in src or b'(' not in src:
+        return []
     cleaned = remove_comments(src)
+    first = _FUNC_SIG.search(cleaned)
+    if first is None:
+        return []
     blocks = find_class_blocks(cleaned)
     # build list of private ranges across all class blocks
     private_ranges = []
     for start, end, kind in blocks:
         block_src = cleaned[start:end]
         private_ranges.extend(private_ranges_in_block(block_src, start))
+    private_ranges = merge_ranges(private_ranges)
 
-    # Regex: capture signature lines that are followed by '{' (function with body)
-    # Use multiline to capture multi-line signatures as one by allowing newlines before '('
-    pattern = re.compile(r'(^[^;{}\n][^{;]*?\([^;{}]*?\)\s*(?:[^\{;]*?)\{)', re.M)
-
+    # One shared path string for every signature in the file, and one object per
+    # distinct signature (headers that include each other repeat them)
+    file_key = sys.intern(filepath.as_posix())
     results = []
-    for m in pattern.finditer(cleaned):
-        sig = m.group(1).strip()
+    # Resume from the first hit; it starts a line, so '^' still matches there
+    for m in _FUNC_SIG.finditer(cleaned, first.start()):
         pos = m.start(1)
         # Skip functions inside private ranges
         if in_any_range(pos, private_ranges):
             continue
 
-        # remove opening brace
-        sig = re.sub(r'\s*\{\s*$', '', sig).strip()
+        # the match ends with the opening brace: slice it off
+        sig = cleaned[pos:m.end(1) - 1].strip()
 
         # skip control statements (if/for/while/switch/else etc.)
-        if re.match(r'^(?:if|else|for|while|switch|case|return|goto|break|continue|do|catch|sizeof)\b', sig):
+        if _CONTROL_STMT.match(sig):
             continue
 
         # remove leading closing braces or stray tokens
-        sig = re.sub(r'^[}\s]+', '', sig)
+        sig = sig.lstrip(_LEADING_JUNK)
 
         # remove initializer lists that appear between ')' and '{' (e.g., ": member(a)" )
-        last_paren = sig.rfind(')')
+        last_paren = sig.rfind(b')')
         if last_paren != -1:
             after = sig[last_paren+1:]
-            colon_idx = after.find(':')
+            colon_idx = after.find(b':')
             if colon_idx != -1:
                 # keep only up to the ')' (and any allowed qualifiers before colon)
                 sig = sig[: last_paren + 1 ]
 
         # strip common qualifiers that might follow the parameter list
-        sig = re.sub(r'\)\s*(?:const|noexcept|constexpr|volatile|mutable|\bthrow\([^)]*\))', ')', sig)
+        sig = strip_qualifiers(sig)
 
         # collapse whitespace
-        sig = re.sub(r'\s+', ' ', sig).strip()
+        sig = b' '.join(sig.split())
 
         # ensure it looks like a function: find the token immediately before '('
-        mname = re.search(r'([A-Za-z_]\w*(?:::\w+)*)\s*\(', sig)
+        mname = _FUNC_NAME.search(sig)
         if not mname:
             continue
         name = mname.group(1)
 
         # skip common C/C++ keywords and control tokens used in code (not function names)
-        cpp_keywords = {
-            'if', 'else', 'for', 'while', 'switch', 'case', 'return', 'goto', 'break', 'continue',
-            'do', 'catch', 'sizeof', 'constexpr', 'template', 'throw', 'public', 'private', 'protected'
-        }
-        if name in cpp_keywords:
+        if name in _CPP_KEYWORDS:
             continue
 
         # skip lines that include access labels, initializer lists, or stray colons
-        if ':' in sig and not sig.strip().startswith('template'):
+        if b':' in sig and not sig.strip().startswith(b'template'):
             # likely an initializer list or access label (e.g., 'VarData() : ll(0)' or 'public:')
             continue
 
         # balanced parentheses check
-        if sig.count('(') != sig.count(')'):
+        if sig.count(b'(') != sig.count(b')'):
             continue
 
-        results.append((filepath.as_posix(), sig))
+        results.append((file_key, sys.intern(sig.decode('utf-8', 'ignore'))))
     return results
 
 
+def walk_headers(root: Path):
+    # One os.scandir walk instead of an rglob per extension. Files come back
+    # grouped by extension in _HEADER_EXTS order, each group in pre-order
+    # directory order, which is the order the per-extension rglob calls gave.
+    # Like rglob, symlinked directories are not descended into.
+    by_ext = {ext: [] for ext in _HEADER_EXTS}
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    # O(1) suffix lookup; names without a dot never build a slice
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot < 0:
+                        continue
+                    bucket = by_ext.get(name[dot:])
+                    if bucket is not None:
+                        bucket.append(Path(entry.path))
+        except PermissionError:
+            continue
+        stack.extend(reversed(subdirs))
+    return [f for ext in _HEADER_EXTS for f in by_ext[ext]]
+
+
 def collect_paths(inputs):
     paths = []
     for p in inputs:
         p = Path(p)
         if p.is_dir():
-            for ext in ('*.h', '*.hpp', '*.hh', '*.hxx', '*.inl', '*.ipp', '*.inc'):
-                for f in p.rglob(ext):
-                    paths.append(f)
+            paths.extend(walk_headers(p))
         elif p.is_file():
             paths.append(p)
     return paths
 
 
+# blake2b digest of a header's bytes -> its signatures. Vendored copies of the
+# same header under different paths are scanned once per process.
+_SIG_CACHE = {}
+
+
+def _scan_one(path: Path):
+    """Read and scan one header; returns (signatures, read error or None)."""
+    try:
+        src = read_file(path)
+    except Exception as e:
+        return [], e
+    try:
+        digest = hashlib.blake2b(src, digest_size=16).digest()
+        sigs = _SIG_CACHE.get(digest)
+        if sigs is None:
+            sigs = _SIG_CACHE[digest] = [sig for _, sig in extract_function_signatures(src, path)]
+    finally:
+        if isinstance(src, mmap.mmap):
+            src.close()
+    file_key = sys.intern(path.as_posix())
+    return [(file_key, sig) for sig in sigs], None
+
+
 def main():
     ap = argparse.ArgumentParser(description='Extract function signatures from C/C++ header files')
     ap.add_argument('paths', nargs='+', help='Header file or directory to scan')
     ap.add_argument('-o', '--output', required=True, help='Output markdown or txt file')
+    ap.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                    help='Worker processes for scanning (default: CPU count; 1 scans in-process)')
     args = ap.parse_args()
 
     paths = collect_paths(args.paths)
     all_sigs = []
-    for p in paths:
-        try:
-            src = read_file(p)
-        except Exception as e:
-            print(f'warning: could not read {p}: {e}')
+    # Files are independent; map() keeps results in input order so the
+    # numbering does not depend on the worker count
+    if args.jobs > 1 and len(paths) > 1:
+        workers = min(args.jobs, len(paths))
+        # A few chunks per worker: amortizes IPC for small headers, still balances load
+        chunksize = max(1, min(32, len(paths) // (workers * 4)))
+        with ProcessPoolExecutor(workers) as ex:
+            scanned = list(ex.map(_scan_one, paths, chunksize=chunksize))
+    else:
+        scanned = map(_scan_one, paths)
+    for p, (sigs, err) in zip(paths, scanned):
+        if err is not None:
+            print(f'warning: could not read {p}: {err}')
             continue
-        sigs = extract_function_signatures(src, p)
         all_sigs.extend(sigs)
 
-    # write output
+    # write output: streamed through a large buffer rather than joined into one
+    # string first; lines are newline-separated with no trailing newline
     out = Path(args.output)
-    lines = []
-    for i, (file, sig) in enumerate(all_sigs, start=1):
-        lines.append(f'{i}. {sig}  // {file}')
-
-    out.write_text('\n'.join(lines), encoding='utf-8')
-    print(f'Wrote {len(lines)} signatures to {out}')
+    with open(out, 'wb', buffering=1 << 20) as fh:
+        sep = ''
+        for i, (file, sig) in enumerate(all_sigs, start=1):
+            fh.write(f'{sep}{i}. {sig}  // {file}'.encode('utf-8'))
+            sep = '\n'
+    print(f'Wrote {len(all_sigs)} signatures to {out}')
 
 
 if __name__ == '__main__':
@@ -1,4 +1,5 @@
 # gen_dispatch_stubs.py
+import functools
 import os
 import sys
 
@@ -24,12 +25,12 @@ for k, v in cpp_types.items():
         qualified[k] = v
 
 # TODO: For now I am keeping land and lor in the var class and simple. if someday i feel like adding complex and fun features with those operators overloads that will need type context then i will add logics for them.
-ops = {
-    "add": "add", "sub": "sub", "mul": "mul", "div": "div", "mod": "mod",
-    "eq": "eq", "ne": "ne", "gt": "gt", "ge": "ge", "lt": "lt", "le": "le",
-    "band": "band", "bor": "bor", "bxor": "bxor", "shl": "shl", "shr": "shr",
-    "land": "land", "lor": "lor"
-}
+ops = (
+    "add", "sub", "mul", "div", "mod",
+    "eq", "ne", "gt", "ge", "lt", "le",
+    "band", "bor", "bxor", "shl", "shr",
+    "land", "lor",
+)
 
 op_symbols = {
     "add": "+", "sub": "-", "mul": "*", "div": "/", "mod": "%",
@@ -47,31 +48,126 @@ op_struct_map = {
     "land": "LogicalAnd", "lor": "LogicalOr"
 }
 
+# Output is collected here and written with a single join at the end; one
+# print() per line was most of the generator's runtime.
+out = []
+
 if len(sys.argv) > 1 and sys.argv[1] == 'declarations':
-    print("#pragma once")
-    print("// Generated declarations for OpTable specializations")
+    out.append("#pragma once")
+    out.append("// Generated declarations for OpTable specializations")
     for opname, opstruct_name in op_struct_map.items():
-        print(f"template<> const std::array<std::array<BinaryOpFunc, TypeTagCount>, TypeTagCount> OpTable<{opstruct_name}>::table;")
+        out.append(f"template<> const std::array<std::array<BinaryOpFunc, TypeTagCount>, TypeTagCount> OpTable<{opstruct_name}>::table;")
+    sys.stdout.write("\n".join(out) + "\n")
     sys.exit(0)
 
-print("#include \"pythonic/pythonicDispatchForwardDecls.hpp\"")
-print("#include \"pythonic/pythonicVars.hpp\"")
-print("#include \"pythonic/pythonicError.hpp\"")
-print("#include \"pythonic/pythonicOverflow.hpp\"")
-print("#include \"pythonic/pythonicPromotion.hpp\"")
-print("#include <stdexcept>")
-print("#include <algorithm>")
-print("#include <iterator>  // For std::equal, std::lexicographical_compare on MSVC\n")
-print("namespace pythonic {")
-print("namespace dispatch {")
-print("// generated stubs live in pythonic::dispatch")
+# pythonicDispatchForwardDecls.hpp: the stubs themselves have internal linkage,
+# so only the types the dispatch headers need are forward-declared
+if len(sys.argv) > 1 and sys.argv[1] == 'forward-decls':
+    sys.stdout.write("""#pragma once
+
+#include <cstdint>
 
-def is_numeric(t):
-    return t in ["int", "float", "double", "long", "long_long", "long_double", "uint", "ulong", "ulong_long", "bool"]
+#include "pythonicOverflow.hpp"
 
-def is_integral(t):
-    return t in ["int", "long", "long_long", "uint", "ulong", "ulong_long", "bool"]
+// Minimal forward-declarations to avoid heavy includes
+
+namespace pythonic {
+  namespace vars {
+    enum class TypeTag : uint8_t;
+    class var;
+  }
+}
+
+namespace pythonic {
+namespace dispatch {
+using pythonic::vars::var;
+
+// The per-(op, TypeTag, TypeTag) stubs have internal linkage in whichever
+// generated source defines them (src/pythonicDispatchStubs.cpp, or one
+// dispatch_<op>.cpp per operator with --out-dir / PYTHONIC_SPLIT_DISPATCH)
+// and are only reachable through OpTable (see pythonicDispatch.hpp), so they
+// are not declared here.
+
+} // namespace dispatch
+} // namespace pythonic
+""")
+    sys.exit(0)
 
+# With --out-dir DIR each operator's stubs and OpTable go to DIR/dispatch_<op>.cpp
+# so they compile as separate translation units; otherwise everything is one
+# file on stdout (src/pythonicDispatchStubs.cpp).
+out_dir = None
+if '--out-dir' in sys.argv:
+    out_dir = sys.argv[sys.argv.index('--out-dir') + 1]
+
+preamble = [
+    "#include \"pythonic/pythonicDispatchForwardDecls.hpp\"",
+    "#include \"pythonic/pythonicVars.hpp\"",
+    "#include \"pythonic/pythonicError.hpp\"",
+    "#include \"pythonic/pythonicOverflow.hpp\"",
+    "#include \"pythonic/pythonicPromotion.hpp\"",
+    "#include <stdexcept>",
+    "#include <algorithm>",
+    "#include <iterator>  // For std::equal, std::lexicographical_compare on MSVC\n",
+    "namespace pythonic {",
+    "namespace dispatch {",
+    "// generated stubs live in pythonic::dispatch",
+    "",
+    "// Tag names used in the shared fallback messages (TypeTag order)",
+    "static const char *const stub_tag_names[] = {" + ", ".join(f'"{t}"' for t in type_tags) + "};",
+    "",
+    "static const char *stub_tag_name(const var& v) {",
+    "    return stub_tag_names[static_cast<int>(v.type_tag())];",
+    "}",
+    "",
+    "// Element equality for container ==/!=: same-tag int and double elements are",
+    "// compared in place instead of building a var result per element",
+    "static inline bool element_equal(const var& x, const var& y) {",
+    "    if (x.type_tag() == y.type_tag()) {",
+    "        if (x.type_tag() == pythonic::vars::TypeTag::INT) return x.var_get<int>() == y.var_get<int>();",
+    "        if (x.type_tag() == pythonic::vars::TypeTag::DOUBLE) return x.var_get<double>() == y.var_get<double>();",
+    "    }",
+    "    return static_cast<bool>(x == y);",
+    "}",
+    "",
+    "static inline bool entry_equal(const std::pair<const std::string, var>& x, const std::pair<const std::string, var>& y) {",
+    "    return x.first == y.first && element_equal(x.second, y.second);",
+    "}",
+    "",
+    "// list &, ^ and - scan short lists (at most short_list_max elements) for members",
+    "// (same VarHasher value and VarEqual, as a Set lookup) instead of building Sets",
+    "static constexpr size_t short_list_max = 32;",
+    "",
+    "static inline void short_list_hashes(const pythonic::vars::List& lst, size_t* hashes) {",
+    "    for (size_t i = 0; i < lst.size(); ++i) hashes[i] = pythonic::vars::VarHasher{}(lst[i]);",
+    "}",
+    "",
+    "static inline bool short_list_contains(const pythonic::vars::List& lst, const size_t* hashes, const var& item, size_t item_hash) {",
+    "    for (size_t i = 0; i < lst.size(); ++i) {",
+    "        if (hashes[i] == item_hash && pythonic::vars::VarEqual{}(item, lst[i])) return true;",
+    "    }",
+    "    return false;",
+    "}",
+    "",
+    "// Commutative cells whose tags are in descending order reuse the mirrored",
+    "// cell's kernel instantiation with the operands swapped",
+    "template <BinaryOpFunc F>",
+    "static var swap_operands(const var& a, const var& b, pythonic::overflow::Overflow policy, bool smallest_fit) {",
+    "    return F(b, a, policy, smallest_fit);",
+    "}",
+]
+closing = ["\n} // namespace dispatch", "} // namespace pythonic"]
+
+# Type categories, built once; the emitters test membership for every stub
+signed_types = frozenset(["int", "long", "long_long"])
+unsigned_types = frozenset(["uint", "ulong", "ulong_long"])
+floating_types = frozenset(["float", "double", "long_double"])
+integral_types = signed_types | unsigned_types | {"bool"}
+numeric_types = integral_types | floating_types
+
+# The promotion helpers are pure in (t1, t2) and every op asks for the same
+# pairs, so each pair is resolved once.
+@functools.lru_cache(maxsize=None)
 def get_common_type(t1, t2):
     # Treat bool as integer (0/1) for promotion purposes
     if t1 == 'bool' and t2 == 'bool':
@@ -113,14 +209,12 @@ def get_common_integral(t1, t2):
     if t1 == "uint" or t2 == "uint": return "int"
     return "long long" # Default
 
+@functools.lru_cache(maxsize=None)
 def get_common_integral_bitwise(t1, t2):
     # Treat bool as int
     if t1 == 'bool': t1 = 'int'
     if t2 == 'bool': t2 = 'int'
 
-    unsigned_types = ['uint', 'ulong', 'ulong_long']
-    signed_types   = ['int', 'long', 'long_long']
-
     # If either operand is unsigned → use widest unsigned type
     if t1 in unsigned_types or t2 in unsigned_types:
         if 'ulong_long' in (t1, t2): return 'unsigned long long'
@@ -136,712 +230,779 @@ def get_common_integral_bitwise(t1, t2):
     return 'long long'
 
 
-# Rank map for promotion min_rank calculation
+# Rank map for promotion min_rank calculation (types not listed, e.g. bool,
+# fall back to '0', which is RANK_BOOL)
 rank_map = {
     'int':'pythonic::promotion::RANK_INT', 'uint':'pythonic::promotion::RANK_UINT',
     'long':'pythonic::promotion::RANK_LONG', 'ulong':'pythonic::promotion::RANK_ULONG',
     'long_long':'pythonic::promotion::RANK_LONG_LONG', 'ulong_long':'pythonic::promotion::RANK_ULONG_LONG',
-    'float':'pythonic::promotion::RANK_FLOAT', 'double':'pythonic::promotion::RANK_DOUBLE', 'long_double':'pythonic::promotion::RANK_LONG_DOUBLE',
-    'bool':'pythonic::promotion::RANK_INT'
+    'float':'pythonic::promotion::RANK_FLOAT', 'double':'pythonic::promotion::RANK_DOUBLE', 'long_double':'pythonic::promotion::RANK_LONG_DOUBLE'
 }
 
-# Helper to emit cast/load lines for generated stubs. When a source type is `bool`
-# generate a `var_get<bool>()` load so the bool becomes 0/1 when cast to integral types.
-def print_cast(operand, varname, t, ctype):
-    if t == 'bool':
-        print(f"    {ctype} {varname} = static_cast<{ctype}>({operand}.var_get<bool>());")
+# Unsupported pairs do not get a stub of their own: their OpTable slots point
+# at one shared type_error__<op> / not_implemented__<op> function per operator,
+# which builds the same message from the operands' tags at runtime. Emitters
+# still append these lines so the main loop can recognise such pairs.
+def type_error_line(opname, left, right):
+    return f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '{left}' and '{right}'\");"
+
+def not_implemented_line(opname, left, right):
+    return f"    throw std::runtime_error(\"Not implemented: {opname} for {left} and {right}\");"
+
+def promotion_type(left, right):
+    if left in floating_types or right in floating_types:
+        return "Has_float"
+    if left in unsigned_types and right in unsigned_types:
+        return "Both_unsigned"
+    return "Signed"
+
+# Numeric bodies of the overflow-policy aware operators. They differ between
+# type pairs only in the operand/compute types, promotion type and ranks, so
+# each operator gets one C++ function template (emitted once per op block)
+# whose instantiations go straight into the OpTable, with no per-pair stub.
+POLICY_ARITH_TPL = """// Numeric {op} with policy-aware handling; C is the common compute type
+template <typename C, typename A, typename B, pythonic::promotion::Type P, int MinRank>
+static var numeric_{op}(const var& a, const var& b, pythonic::overflow::Overflow policy, bool smallest_fit) {{
+    C la = static_cast<C>(a.var_get<A>());
+    C lb = static_cast<C>(b.var_get<B>());
+{guard}    if (policy == pythonic::overflow::Overflow::None_of_them) {{
+        return var(la {sym} lb);
+    }} else if (policy == pythonic::overflow::Overflow::Throw) {{
+        auto res = pythonic::overflow::{op}_throw(la, lb);
+        return var(res);
+    }} else if (policy == pythonic::overflow::Overflow::Wrap) {{
+        auto res = pythonic::overflow::{op}_wrap(la, lb);
+        return var(res);
+    }} else {{
+{exact}{note}        long double result = {result};
+        return pythonic::promotion::smart_promote<P, MinRank, {force_signed}>(result, smallest_fit);
+    }}
+}}"""
+
+# Integer add/sub/mul promote from the exact 128-bit result instead of a long
+# double one; W must hold any result of two C operands (unsigned products of
+# 64-bit operands need the unsigned type)
+EXACT_PROMOTE_TPL = """#ifdef __SIZEOF_INT128__
+        if constexpr (std::is_integral_v<C>) {{
+            using W = {wide};
+            return pythonic::promotion::smart_promote_i128<P, MinRank>(static_cast<W>(la) {sym} static_cast<W>(lb), smallest_fit);
+        }}
+#endif
+"""
+
+def _policy_op(op, sym, guard="", note="", result=None, force_signed="false", wide=None):
+    exact = EXACT_PROMOTE_TPL.format(wide=wide, sym=sym) if wide else ""
+    return POLICY_ARITH_TPL.format(
+        op=op, sym=sym, guard=guard, note=note, force_signed=force_signed, exact=exact,
+        result=result or f"static_cast<long double>(la) {sym} static_cast<long double>(lb)")
+
+# Rendered helper templates, keyed by operator
+op_helpers = {
+    "add": _policy_op("add", "+", note="        // Promote: compute in long double then smart-promote\n", wide="__int128"),
+    "sub": _policy_op("sub", "-", force_signed="true", wide="__int128"),
+    "mul": _policy_op("mul", "*", wide="std::conditional_t<std::is_unsigned_v<C>, unsigned __int128, __int128>"),
+    "div": _policy_op("div", "/", guard="    if (static_cast<long double>(lb) == 0.0L) throw pythonic::PythonicZeroDivisionError(\"float division by zero\");\n"),
+    "mod": _policy_op("mod", "%",
+                      guard="    if (lb == 0) throw pythonic::PythonicZeroDivisionError(\"integer division or modulo by zero\");\n",
+                      result="std::fmod(static_cast<long double>(la), static_cast<long double>(lb))"),
+}
+
+# Floating modulo ignores the overflow policies except Promote
+op_helpers["mod"] += """
+
+// Floating modulo; C is the floating compute type
+template <typename C, typename A, typename B, int MinRank>
+static var numeric_fmod(const var& a, const var& b, pythonic::overflow::Overflow policy, bool smallest_fit) {
+    C la = static_cast<C>(a.var_get<A>());
+    C lb = static_cast<C>(b.var_get<B>());
+    if (static_cast<long double>(lb) == 0.0L) throw pythonic::PythonicZeroDivisionError("float division by zero");
+    if (policy == pythonic::overflow::Overflow::None_of_them || policy == pythonic::overflow::Overflow::Throw || policy == pythonic::overflow::Overflow::Wrap) {
+        C res = std::fmod(la, lb);
+        return var(res);
+    } else {
+        long double result = std::fmod(static_cast<long double>(la), static_cast<long double>(lb));
+        return pythonic::promotion::smart_promote<pythonic::promotion::Has_float, MinRank>(result, smallest_fit);
+    }
+}"""
+
+# Numeric comparisons, bitwise ops and shifts only convert both operands to
+# the common type C and apply the operator, so they share one template too
+SIMPLE_NUMERIC_TPL = """// Numeric {op}; C is the common compute type
+template <typename C, typename A, typename B>
+static var numeric_{op}(const var& a, const var& b, pythonic::overflow::Overflow, bool) {{
+    C la = static_cast<C>(a.var_get<A>());
+    C lb = static_cast<C>(b.var_get<B>());
+    return var(la {sym} {rhs});
+}}"""
+
+for _op in ("eq", "ne", "gt", "ge", "lt", "le", "band", "bor", "bxor"):
+    op_helpers[_op] = SIMPLE_NUMERIC_TPL.format(op=_op, sym=op_symbols[_op], rhs="lb")
+
+# Shift counts are masked to the width of C (as x86 does in hardware), so
+# counts >= the width or negative are defined instead of UB
+for _op in ("shl", "shr"):
+    op_helpers[_op] = SIMPLE_NUMERIC_TPL.format(op=_op, sym=op_symbols[_op], rhs="(lb & (sizeof(C) * 8 - 1))")
+
+# String repetition doubles the filled prefix in place, so large counts cost
+# O(log n) appends instead of n
+op_helpers["mul"] += """
+
+// str * n (Python repetition); n <= 0 or an empty string gives ""
+static var repeat_string(const std::string& s, long long n) {
+    if (n <= 0 || s.empty()) return var(std::string(""));
+    if (static_cast<unsigned long long>(n) > std::string().max_size() / s.size())
+        throw pythonic::PythonicOverflowError("repeated string is too long");
+    const size_t total = s.size() * static_cast<size_t>(n);
+    std::string res;
+    res.reserve(total);
+    res.append(s);
+    while (res.size() <= total - res.size()) res.append(res);
+    res.append(res, 0, total - res.size());
+    return var(std::move(res));
+}
+
+// list * n; elements are vars with their own copy constructors, so each
+// repetition is one range insert into the preallocated result
+static var repeat_list(const pythonic::vars::List& lst, long long n) {
+    if (n <= 0 || lst.empty()) return var(pythonic::vars::List{});
+    pythonic::vars::List res;
+    res.reserve(lst.size() * static_cast<size_t>(n));
+    for (long long i = 0; i < n; ++i) res.insert(res.end(), lst.begin(), lst.end());
+    return var(std::move(res));
+}"""
+
+# Operand load type; bools are read as bool so they become 0/1 in the cast
+def operand_type(t):
+    return 'bool' if t == 'bool' else cpp_types[t]
+
+def min_rank_expr(left, right):
+    return f"std::max({rank_map.get(left, '0')}, {rank_map.get(right, '0')})"
+
+# A body that only forwards to a kernel instantiation; the main loop puts the
+# kernel itself into the OpTable instead of wrapping it in a stub
+def forward_line(kernel):
+    return f"    return {kernel}(a, b, policy, smallest_fit);"
+
+def forwarded_kernel(lines):
+    prefix, suffix = "    return ", "(a, b, policy, smallest_fit);"
+    if len(lines) == 1 and lines[0].startswith(prefix) and lines[0].endswith(suffix):
+        return lines[0][len(prefix):-len(suffix)]
+    return None
+
+def kernel_args(kernel):
+    """Split `name<arg, ...>` into its name and top-level template arguments."""
+    name, _, rest = kernel.partition("<")
+    args, depth, cur = [], 0, ""
+    for ch in rest[:-1]:
+        if ch == "," and depth == 0:
+            args.append(cur.strip())
+            cur = ""
+            continue
+        depth += (ch == "(") - (ch == ")")
+        cur += ch
+    args.append(cur.strip())
+    return name, args
+
+# Operators whose numeric kernels give the same result for swapped operands
+COMMUTATIVE = ("eq", "ne", "add", "mul", "band", "bor", "bxor")
+
+def is_mirrored_kernel(kernel, mirror, left, right):
+    """True if `mirror` (the right-left cell) is `kernel` with the operand types swapped."""
+    if not (kernel.startswith("numeric_") and mirror.startswith("numeric_")):
+        return False
+    name, args = kernel_args(kernel)
+    rank = min_rank_expr(left, right)
+    swapped = [args[0], args[2], args[1]] + [a.replace(rank, min_rank_expr(right, left)) for a in args[3:]]
+    return (name, swapped) == kernel_args(mirror)
+
+def emit_policy_arith(lines, opname, left, right, ptype=None):
+    ctype = get_common_type(left, right)
+    ptype = ptype or promotion_type(left, right)
+    lines.append(forward_line(f"numeric_{opname}<{ctype}, {operand_type(left)}, {operand_type(right)}, "
+                              f"pythonic::promotion::{ptype}, {min_rank_expr(left, right)}>"))
+
+def emit_simple_numeric(lines, opname, left, right, ctype):
+    lines.append(forward_line(f"numeric_{opname}<{ctype}, {operand_type(left)}, {operand_type(right)}>"))
+
+# Stub body emitters, one per operator family. Each appends the body lines for
+# `left op right` (everything between the signature and the closing brace).
+def _emit_compare(lines, opname, left, right):
+    # string compare
+    if left == "string" and right == "string":
+        if opname == "eq":
+            lines.append(f"    return var(a.var_get<std::string>() == b.var_get<std::string>());")
+        elif opname == "ne":
+            lines.append(f"    return var(a.var_get<std::string>() != b.var_get<std::string>());")
+        elif opname == "gt":
+            lines.append(f"    return var(a.var_get<std::string>() > b.var_get<std::string>());")
+        elif opname == "ge":
+            lines.append(f"    return var(a.var_get<std::string>() >= b.var_get<std::string>());")
+        elif opname == "lt":
+            lines.append(f"    return var(a.var_get<std::string>() < b.var_get<std::string>());")
+        elif opname == "le":
+            lines.append(f"    return var(a.var_get<std::string>() <= b.var_get<std::string>());")
+    # container compare (lists, sets, orderedset, dicts, ordereddict)
+    elif left == "list" and right == "list":
+        lines.append(f"    const auto &lst1 = a.var_get<{qualified['list']}>();")
+        lines.append(f"    const auto &lst2 = b.var_get<{qualified['list']}>();")
+        if opname == "eq":
+            lines.append(f"    if (lst1.size() != lst2.size()) return var(false);")
+            lines.append(f"    return var(std::equal(lst1.begin(), lst1.end(), lst2.begin(), lst2.end(), element_equal));")
+        elif opname == "ne":
+            lines.append(f"    if (lst1.size() != lst2.size()) return var(true);")
+            lines.append(f"    return var(!std::equal(lst1.begin(), lst1.end(), lst2.begin(), lst2.end(), element_equal));")
+        elif opname == "lt":
+            lines.append(f"    return var(std::lexicographical_compare(lst1.begin(), lst1.end(), lst2.begin(), lst2.end()));")
+        elif opname == "le":
+            lines.append(f"    return var(!std::lexicographical_compare(lst2.begin(), lst2.end(), lst1.begin(), lst1.end()));")
+        elif opname == "gt":
+            lines.append(f"    return var(std::lexicographical_compare(lst2.begin(), lst2.end(), lst1.begin(), lst1.end()));")
+        elif opname == "ge":
+            lines.append(f"    return var(!std::lexicographical_compare(lst1.begin(), lst1.end(), lst2.begin(), lst2.end()));")
+    elif left == "set" and right == "set":
+        lines.append(f"    const auto &set1 = a.var_get<{qualified['set']}>();")
+        lines.append(f"    const auto &set2 = b.var_get<{qualified['set']}>();")
+        if opname == "eq":
+            lines.append(f"    if (set1.size() != set2.size()) return var(false);")
+            lines.append("    for (const auto &elem : set1) {")
+            lines.append("        if (set2.find(elem) == set2.end()) return var(false);")
+            lines.append("    }")
+            lines.append(f"    return var(true);")
+        elif opname == "ne":
+            lines.append(f"    if (set1.size() != set2.size()) return var(true);")
+            lines.append("    for (const auto &elem : set1) {")
+            lines.append("        if (set2.find(elem) == set2.end()) return var(true);")
+            lines.append("    }")
+            lines.append(f"    return var(false);")
+        elif opname == "lt":
+            lines.append(f"    if (set1.size() >= set2.size()) return var(false);")
+            lines.append("    for (const auto &elem : set1) {")
+            lines.append("        if (set2.find(elem) == set2.end()) return var(false);")
+            lines.append("    }")
+            lines.append(f"    return var(true);")
+        elif opname == "le":
+            lines.append("    for (const auto &elem : set1) {")
+            lines.append("        if (set2.find(elem) == set2.end()) return var(false);")
+            lines.append("    }")
+            lines.append(f"    return var(true);")
+        elif opname == "gt":
+            lines.append(f"    if (set2.size() >= set1.size()) return var(false);")
+            lines.append("    for (const auto &elem : set2) {")
+            lines.append("        if (set1.find(elem) == set1.end()) return var(false);")
+            lines.append("    }")
+            lines.append(f"    return var(true);")
+        elif opname == "ge":
+            lines.append("    for (const auto &elem : set2) {")
+            lines.append("        if (set1.find(elem) == set1.end()) return var(false);")
+            lines.append("    }")
+            lines.append(f"    return var(true);")
+    elif left == "orderedset" and right == "orderedset":
+        lines.append(f"    const auto &set1 = a.var_get<{qualified['orderedset']}>();")
+        lines.append(f"    const auto &set2 = b.var_get<{qualified['orderedset']}>();")
+        if opname == "eq":
+            lines.append(f"    return var(std::equal(set1.begin(), set1.end(), set2.begin(), set2.end(), element_equal));")
+        elif opname == "ne":
+            lines.append(f"    return var(!std::equal(set1.begin(), set1.end(), set2.begin(), set2.end(), element_equal));")
+        elif opname == "lt":
+            lines.append(f"    return var(std::lexicographical_compare(set1.begin(), set1.end(), set2.begin(), set2.end()));")
+        elif opname == "le":
+            lines.append(f"    return var(!std::lexicographical_compare(set2.begin(), set2.end(), set1.begin(), set1.end()));")
+        elif opname == "gt":
+            lines.append(f"    return var(std::lexicographical_compare(set2.begin(), set2.end(), set1.begin(), set1.end()));")
+        elif opname == "ge":
+            lines.append(f"    return var(!std::lexicographical_compare(set1.begin(), set1.end(), set2.begin(), set2.end()));")
+    elif left == "dict" and right == "dict":
+        if opname in ("eq", "ne"):
+            lines.append(f"    const auto &dict1 = a.var_get<{qualified['dict']}>();")
+            lines.append(f"    const auto &dict2 = b.var_get<{qualified['dict']}>();")
+            if opname == "eq":
+                lines.append(f"    if (dict1.size() != dict2.size()) return var(false);")
+                lines.append("    for (const auto &kv : dict1) {")
+                lines.append("        const auto &key = kv.first; const auto &val = kv.second;")
+                lines.append("        auto it = dict2.find(key);")
+                lines.append("        if (it == dict2.end() || !element_equal(val, it->second)) return var(false);")
+                lines.append("    }")
+                lines.append(f"    return var(true);")
+            else:
+                lines.append(f"    if (dict1.size() != dict2.size()) return var(true);")
+                lines.append("    for (const auto &kv : dict1) {")
+                lines.append("        const auto &key = kv.first; const auto &val = kv.second;")
+                lines.append("        auto it = dict2.find(key);")
+                lines.append("        if (it == dict2.end() || !element_equal(val, it->second)) return var(true);")
+                lines.append("    }")
+                lines.append(f"    return var(false);")
+        else:
+            lines.append(type_error_line(opname, left, right))
+    elif left == "ordereddict" and right == "ordereddict":
+        lines.append(f"    const auto &dict1 = a.var_get<{qualified['ordereddict']}>();")
+        lines.append(f"    const auto &dict2 = b.var_get<{qualified['ordereddict']}>();")
+        if opname == "eq":
+            lines.append(f"    return var(std::equal(dict1.begin(), dict1.end(), dict2.begin(), dict2.end(), entry_equal));")
+        elif opname == "ne":
+            lines.append(f"    return var(!std::equal(dict1.begin(), dict1.end(), dict2.begin(), dict2.end(), entry_equal));")
+        elif opname == "lt":
+            lines.append(f"    return var(std::lexicographical_compare(dict1.begin(), dict1.end(), dict2.begin(), dict2.end()));")
+        elif opname == "le":
+            lines.append(f"    return var(!std::lexicographical_compare(dict2.begin(), dict2.end(), dict1.begin(), dict1.end()));")
+        elif opname == "gt":
+            lines.append(f"    return var(std::lexicographical_compare(dict2.begin(), dict2.end(), dict1.begin(), dict1.end()));")
+        elif opname == "ge":
+            lines.append(f"    return var(!std::lexicographical_compare(dict1.begin(), dict1.end(), dict2.begin(), dict2.end()));")
+    # numeric compare
+    elif left in numeric_types and right in numeric_types:
+        emit_simple_numeric(lines, opname, left, right, get_common_type(left, right))
+    else:
+        lines.append(type_error_line(opname, left, right))
+
+def _emit_bitwise(lines, opname, left, right):
+    if left == 'bool' and right == 'bool':
+        if opname == "band":
+            lines.append(f"    return var(static_cast<bool>(a.var_get<bool>() & b.var_get<bool>()));")
+        elif opname == "bor":
+            lines.append(f"    return var(static_cast<bool>(a.var_get<bool>() | b.var_get<bool>()));")
+        elif opname == "bxor":
+            lines.append(f"    return var(static_cast<bool>(a.var_get<bool>() ^ b.var_get<bool>()));")
+    elif left in integral_types and right in integral_types:
+        emit_simple_numeric(lines, opname, left, right, get_common_integral_bitwise(left, right))
+    elif left == right:
+        if left == "set":
+            lines.append(f"    const auto &lhs = a.var_get<{qualified['set']}>();")
+            lines.append(f"    const auto &rhs = b.var_get<{qualified['set']}>();")
+            if opname == "band":
+                # Probe the larger set from the smaller one; lhs elements are kept
+                lines.append(f"    {qualified['set']} result;")
+                lines.append("    if (rhs.size() < lhs.size()) {")
+                lines.append("        for (const auto &item : rhs) {")
+                lines.append("            auto it = lhs.find(item);")
+                lines.append("            if (it != lhs.end()) {")
+                lines.append("                result.insert(*it);")
+                lines.append("            }")
+                lines.append("        }")
+                lines.append("        return var(std::move(result));")
+                lines.append("    }")
+                lines.append("    for (const auto &item : lhs) {")
+                lines.append("        if (rhs.find(item) != rhs.end()) {")
+                lines.append("            result.insert(item);")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    return var(std::move(result));")
+            elif opname == "bor":
+                lines.append(f"    {qualified['set']} result = lhs;")
+                lines.append("    result.insert(rhs.begin(), rhs.end());")
+                lines.append("    return var(std::move(result));")
+            elif opname == "bxor":
+                lines.append(f"    {qualified['set']} result;")
+                lines.append("    for (const auto &item : lhs) {")
+                lines.append("        if (rhs.find(item) == rhs.end()) {")
+                lines.append("            result.insert(item);")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    for (const auto &item : rhs) {")
+                lines.append("        if (lhs.find(item) == lhs.end()) {")
+                lines.append("            result.insert(item);")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    return var(std::move(result));")
+        elif left == "orderedset":
+            lines.append(f"    const auto &lhs = a.var_get<{qualified['orderedset']}>();")
+            lines.append(f"    const auto &rhs = b.var_get<{qualified['orderedset']}>();")
+            if opname == "band":
+                lines.append(f"    {qualified['orderedset']} result;")
+                lines.append("    auto it_lhs = lhs.begin();")
+                lines.append("    auto it_rhs = rhs.begin();")
+                lines.append("    while (it_lhs != lhs.end() && it_rhs != rhs.end()) {")
+                lines.append("        if (*it_lhs < *it_rhs) {")
+                lines.append("            ++it_lhs;")
+                lines.append("        } else if (*it_rhs < *it_lhs) {")
+                lines.append("            ++it_rhs;")
+                lines.append("        } else {")
+                lines.append("            result.insert(result.end(), *it_lhs);")
+                lines.append("            ++it_lhs;")
+                lines.append("            ++it_rhs;")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    return var(std::move(result));")
+            elif opname == "bor":
+                lines.append(f"    {qualified['orderedset']} result;")
+                lines.append("    auto it_lhs = lhs.begin();")
+                lines.append("    auto it_rhs = rhs.begin();")
+                lines.append("    while (it_lhs != lhs.end() && it_rhs != rhs.end()) {")
+                lines.append("        if (*it_lhs < *it_rhs) {")
+                lines.append("            result.insert(result.end(), *it_lhs);")
+                lines.append("            ++it_lhs;")
+                lines.append("        } else if (*it_rhs < *it_lhs) {")
+                lines.append("            result.insert(result.end(), *it_rhs);")
+                lines.append("            ++it_rhs;")
+                lines.append("        } else {")
+                lines.append("            result.insert(result.end(), *it_lhs);")
+                lines.append("            ++it_lhs;")
+                lines.append("            ++it_rhs;")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    while (it_lhs != lhs.end()) {")
+                lines.append("        result.insert(result.end(), *it_lhs);")
+                lines.append("        ++it_lhs;")
+                lines.append("    }")
+                lines.append("    while (it_rhs != rhs.end()) {")
+                lines.append("        result.insert(result.end(), *it_rhs);")
+                lines.append("        ++it_rhs;")
+                lines.append("    }")
+                lines.append("    return var(std::move(result));")
+            elif opname == "bxor":
+                lines.append(f"    {qualified['orderedset']} result;")
+                lines.append("    auto it_lhs = lhs.begin();")
+                lines.append("    auto it_rhs = rhs.begin();")
+                lines.append("    while (it_lhs != lhs.end() && it_rhs != rhs.end()) {")
+                lines.append("        if (*it_lhs < *it_rhs) {")
+                lines.append("            result.insert(result.end(), *it_lhs);")
+                lines.append("            ++it_lhs;")
+                lines.append("        } else if (*it_rhs < *it_lhs) {")
+                lines.append("            result.insert(result.end(), *it_rhs);")
+                lines.append("            ++it_rhs;")
+                lines.append("        } else {")
+                lines.append("            ++it_lhs;")
+                lines.append("            ++it_rhs;")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    while (it_lhs != lhs.end()) {")
+                lines.append("        result.insert(result.end(), *it_lhs);")
+                lines.append("        ++it_lhs;")
+                lines.append("    }")
+                lines.append("    while (it_rhs != rhs.end()) {")
+                lines.append("        result.insert(result.end(), *it_rhs);")
+                lines.append("        ++it_rhs;")
+                lines.append("    }")
+                lines.append("    return var(std::move(result));")
+        elif left == "list":
+            lines.append(f"    const auto &lhs = a.var_get<{qualified['list']}>();")
+            lines.append(f"    const auto &rhs = b.var_get<{qualified['list']}>();")
+            if opname == "band":
+                lines.append(f"    {qualified['list']} result;")
+                lines.append("    if (lhs.size() <= short_list_max && rhs.size() <= short_list_max) {")
+                lines.append("        size_t lhs_hash[short_list_max], rhs_hash[short_list_max];")
+                lines.append("        short_list_hashes(lhs, lhs_hash);")
+                lines.append("        short_list_hashes(rhs, rhs_hash);")
+                lines.append("        for (size_t i = 0; i < lhs.size(); ++i) {")
+                lines.append("            if (short_list_contains(rhs, rhs_hash, lhs[i], lhs_hash[i])) result.push_back(lhs[i]);")
+                lines.append("        }")
+                lines.append("        return var(std::move(result));")
+                lines.append("    }")
+                lines.append(f"    {qualified['set']} rhs_set(rhs.begin(), rhs.end());")
+                lines.append("    for (const auto &item : lhs) {")
+                lines.append("        if (rhs_set.find(item) != rhs_set.end()) {")
+                lines.append("            result.push_back(item);")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    return var(std::move(result));")
+            elif opname == "bor":
+                lines.append(f"    {qualified['list']} result;")
+                lines.append("    result.reserve(lhs.size() + rhs.size());")
+                lines.append("    result.insert(result.end(), lhs.begin(), lhs.end());")
+                lines.append("    result.insert(result.end(), rhs.begin(), rhs.end());")
+                lines.append("    return var(std::move(result));")
+            elif opname == "bxor":
+                lines.append(f"    {qualified['list']} result;")
+                lines.append("    if (lhs.size() <= short_list_max && rhs.size() <= short_list_max) {")
+                lines.append("        size_t lhs_hash[short_list_max], rhs_hash[short_list_max];")
+                lines.append("        short_list_hashes(lhs, lhs_hash);")
+                lines.append("        short_list_hashes(rhs, rhs_hash);")
+                lines.append("        for (size_t i = 0; i < lhs.size(); ++i) {")
+                lines.append("            if (!short_list_contains(rhs, rhs_hash, lhs[i], lhs_hash[i])) result.push_back(lhs[i]);")
+                lines.append("        }")
+                lines.append("        for (size_t i = 0; i < rhs.size(); ++i) {")
+                lines.append("            if (!short_list_contains(lhs, lhs_hash, rhs[i], rhs_hash[i])) result.push_back(rhs[i]);")
+                lines.append("        }")
+                lines.append("        return var(std::move(result));")
+                lines.append("    }")
+                lines.append(f"    {qualified['set']} lhs_set(lhs.begin(), lhs.end());")
+                lines.append(f"    {qualified['set']} rhs_set(rhs.begin(), rhs.end());")
+                lines.append("    for (const auto &item : lhs) {")
+                lines.append("        if (rhs_set.find(item) == rhs_set.end()) {")
+                lines.append("            result.push_back(item);")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    for (const auto &item : rhs) {")
+                lines.append("        if (lhs_set.find(item) == lhs_set.end()) {")
+                lines.append("            result.push_back(item);")
+                lines.append("        }")
+                lines.append("    }")
+                lines.append("    return var(std::move(result));")
+        elif left == "dict":
+            if opname in ("band", "bor"):
+                lines.append(f"    const auto &lhs = a.var_get<{qualified['dict']}>();")
+                lines.append(f"    const auto &rhs = b.var_get<{qualified['dict']}>();")
+                if opname == "band":
+                    lines.append(f"    {qualified['dict']} result;")
+                    lines.append("    for (const auto &[key, val] : lhs) {")
+                    lines.append("        if (rhs.find(key) != rhs.end()) {")
+                    lines.append("            result[key] = val;")
+                    lines.append("        }")
+                    lines.append("    }")
+                    lines.append("    return var(std::move(result));")
+                elif opname == "bor":
+                    lines.append(f"    {qualified['dict']} result = lhs;")
+                    lines.append("    for (const auto &[key, val] : rhs) {")
+                    lines.append("        result[key] = val;")
+                    lines.append("    }")
+                    lines.append("    return var(std::move(result));")
+            else:
+                lines.append(type_error_line(opname, left, right))
+        elif left == "ordereddict":
+            if opname in ("band", "bor"):
+                lines.append(f"    const auto &lhs = a.var_get<{qualified['ordereddict']}>();")
+                lines.append(f"    const auto &rhs = b.var_get<{qualified['ordereddict']}>();")
+                if opname == "band":
+                    lines.append(f"    {qualified['ordereddict']} result;")
+                    lines.append("    for (const auto &[key, val] : lhs) {")
+                    lines.append("        if (rhs.find(key) != rhs.end()) {")
+                    lines.append("            result[key] = val;")
+                    lines.append("        }")
+                    lines.append("    }")
+                    lines.append("    return var(std::move(result));")
+                elif opname == "bor":
+                    lines.append(f"    {qualified['ordereddict']} result = lhs;")
+                    lines.append("    for (const auto &[key, val] : rhs) {")
+                    lines.append("        result[key] = val;")
+                    lines.append("    }")
+                    lines.append("    return var(std::move(result));")
+            else:
+                lines.append(type_error_line(opname, left, right))
+        else:
+            lines.append(type_error_line(opname, left, right))
+    else:
+        lines.append(type_error_line(opname, left, right))
+
+def _emit_shift(lines, opname, left, right):
+    if left in integral_types and right in integral_types:
+        emit_simple_numeric(lines, opname, left, right, get_common_integral_bitwise(left, right))
+    else:
+        lines.append(type_error_line(opname, left, right))
+
+def _emit_add(lines, opname, left, right):
+    if left == "string" and right == "string":
+        lines.append(f"    return var(a.var_get<std::string>() + b.var_get<std::string>());")
+    elif left == "string" and right == "bool":
+        lines.append(f"    return var(a.var_get<std::string>() + (b.var_get<bool>() ? std::string(\"true\") : std::string(\"false\")));")
+    elif left == "bool" and right == "string":
+        lines.append(f"    return var((a.var_get<bool>() ? std::string(\"true\") : std::string(\"false\")) + b.var_get<std::string>());")
+    elif left == "list" and right == "list":
+        lines.append(f"    const auto& al = a.var_get<{qualified['list']}>();")
+        lines.append(f"    const auto& bl = b.var_get<{qualified['list']}>();")
+        lines.append(f"    {qualified['list']} res; res.reserve(al.size() + bl.size());")
+        lines.append("    res.insert(res.end(), al.begin(), al.end());")
+        lines.append("    res.insert(res.end(), bl.begin(), bl.end());")
+        lines.append("    return var(std::move(res));")
+    elif left in numeric_types and right in numeric_types:
+        emit_policy_arith(lines, opname, left, right)
+    else:
+        lines.append(type_error_line(opname, left, right))
+
+def _emit_sub(lines, opname, left, right):
+    if left in numeric_types and right in numeric_types:
+        emit_policy_arith(lines, opname, left, right)
+    elif left == "set" and right == "set":
+        lines.append(f"    const auto& as = a.var_get<{qualified['set']}>();")
+        lines.append(f"    const auto& bs = b.var_get<{qualified['set']}>();")
+        lines.append(f"    {qualified['set']} res;")
+        lines.append("    for(const auto& item : as) {")
+        lines.append("        if(bs.find(item) == bs.end()) res.insert(item);")
+        lines.append("    }")
+        lines.append("    return var(std::move(res));")
+    elif left == "dict" and right == "dict":
+        lines.append(f"    const auto& ad = a.var_get<{qualified['dict']}>();")
+        lines.append(f"    const auto& bd = b.var_get<{qualified['dict']}>();")
+        lines.append(f"    {qualified['dict']} res;")
+        lines.append("    for(const auto& [k, v] : ad) {")
+        lines.append("        if(bd.find(k) == bd.end()) res.emplace(k, v);")
+        lines.append("    }")
+        lines.append("    return var(std::move(res));")
+    elif left == "orderedset" and right == "orderedset":
+        lines.append(f"    const auto& a_cont = a.var_get<{qualified['orderedset']}>();")
+        lines.append(f"    const auto& b_cont = b.var_get<{qualified['orderedset']}>();")
+        lines.append(f"    {qualified['orderedset']} res;")
+        lines.append("    // Merge-like difference preserving order")
+        lines.append("    auto it_a = a_cont.begin();")
+        lines.append("    auto it_b = b_cont.begin();")
+        lines.append("    while (it_a != a_cont.end() && it_b != b_cont.end()) {")
+        lines.append("        if (*it_a < *it_b) {")
+        lines.append("            res.insert(res.end(), *it_a);")
+        lines.append("            ++it_a;")
+        lines.append("        } else if (*it_b < *it_a) {")
+        lines.append("            ++it_b;")
+        lines.append("        } else {")
+        lines.append("            // Equal, skip")
+        lines.append("            ++it_a; ++it_b;")
+        lines.append("        }")
+        lines.append("    }")
+        lines.append("    while (it_a != a_cont.end()) {")
+        lines.append("        res.insert(res.end(), *it_a);")
+        lines.append("        ++it_a;")
+        lines.append("    }")
+        lines.append("    return var(std::move(res));")
+    elif left == "ordereddict" and right == "ordereddict":
+        lines.append(f"    const auto& ad = a.var_get<{qualified['ordereddict']}>();")
+        lines.append(f"    const auto& bd = b.var_get<{qualified['ordereddict']}>();")
+        lines.append(f"    {qualified['ordereddict']} res;")
+        lines.append("    // Both maps are sorted by key: one merge pass instead of a lookup per key")
+        lines.append("    std::set_difference(ad.begin(), ad.end(), bd.begin(), bd.end(), std::inserter(res, res.end()),")
+        lines.append("                        [](const auto& x, const auto& y) { return x.first < y.first; });")
+        lines.append("    return var(std::move(res));")
+    elif left == "list" and right == "list":
+        # List difference (remove items in A that are in B)
+        lines.append(f"    const auto& al = a.var_get<{qualified['list']}>();")
+        lines.append(f"    const auto& bl = b.var_get<{qualified['list']}>();")
+        lines.append(f"    {qualified['list']} res;")
+        lines.append("    if (bl.size() <= short_list_max) {")
+        lines.append("        size_t bl_hash[short_list_max];")
+        lines.append("        short_list_hashes(bl, bl_hash);")
+        lines.append("        for (const auto& item : al) {")
+        lines.append("            if (!short_list_contains(bl, bl_hash, item, pythonic::vars::VarHasher{}(item))) res.push_back(item);")
+        lines.append("        }")
+        lines.append("        return var(std::move(res));")
+        lines.append("    }")
+        lines.append(f"    {qualified['set']} bs(bl.begin(), bl.end());")
+        lines.append("    for(const auto& item : al) {")
+        lines.append("        if(bs.find(item) == bs.end()) res.push_back(item);")
+        lines.append("    }")
+        lines.append("    return var(std::move(res));")
+    else:
+        lines.append(type_error_line(opname, left, right))
+
+def _emit_mul(lines, opname, left, right):
+    if left == "string" and right in signed_types:
+         lines.append(f"    return repeat_string(a.var_get<std::string>(), (long long)b.var_get<{cpp_types[right]}>());")
+    elif right == "string" and left in signed_types:
+         lines.append(f"    return repeat_string(b.var_get<std::string>(), (long long)a.var_get<{cpp_types[left]}>());")
+    elif left == "list" and right in signed_types:
+         lines.append(f"    return repeat_list(a.var_get<{qualified['list']}>(), (long long)b.var_get<{cpp_types[right]}>());")
+    elif right == "list" and left in signed_types:
+         lines.append(f"    return repeat_list(b.var_get<{qualified['list']}>(), (long long)a.var_get<{cpp_types[left]}>());")
+    elif left in numeric_types and right in numeric_types:
+        emit_policy_arith(lines, opname, left, right)
+    else:
+         lines.append(type_error_line(opname, left, right))
+
+def _emit_div(lines, opname, left, right):
+    if left in numeric_types and right in numeric_types:
+        # True division always promotes through the floating containers
+        emit_policy_arith(lines, opname, left, right, ptype="Has_float")
+    else:
+        lines.append(type_error_line(opname, left, right))
+
+def _emit_mod(lines, opname, left, right):
+    if left in numeric_types and right in numeric_types:
+        # If both are integer-like, use integral modulo helpers
+        if left in integral_types and right in integral_types:
+            emit_policy_arith(lines, opname, left, right)
+        # If either operand is floating, perform floating modulo (fmod)
+        elif left in floating_types or right in floating_types:
+            # choose compute type based on presence of long_double/double/float
+            compute = None
+            if left == 'long_double' or right == 'long_double':
+                compute = 'long double'
+            elif left == 'double' or right == 'double':
+                compute = 'double'
+            else:
+                compute = 'float'
+            lines.append(forward_line(f"numeric_fmod<{compute}, {operand_type(left)}, {operand_type(right)}, {min_rank_expr(left, right)}>"))
+        else:
+            lines.append(type_error_line(opname, left, right))
     else:
-        print(f"    {ctype} {varname} = static_cast<{ctype}>({operand}.var_get<{cpp_types[t]}>());")
+        lines.append(type_error_line(opname, left, right))
+
+def _emit_not_implemented(lines, opname, left, right):
+    lines.append(not_implemented_line(opname, left, right))
+
+EMITTERS = {
+    "eq": _emit_compare, "ne": _emit_compare, "gt": _emit_compare,
+    "ge": _emit_compare, "lt": _emit_compare, "le": _emit_compare,
+    "band": _emit_bitwise, "bor": _emit_bitwise, "bxor": _emit_bitwise,
+    "shl": _emit_shift, "shr": _emit_shift,
+    "add": _emit_add, "sub": _emit_sub, "mul": _emit_mul,
+    "div": _emit_div, "mod": _emit_mod,
+}
 
-for opname in ops.values():
-    print(f"\n// Stub definitions for {opname}")
+stub_blocks = {}
+# OpTable entry for every (op, left, right): a kernel instantiation for numeric
+# pairs, a shared fallback for unsupported pairs, otherwise the pair's own stub.
+# Stubs are only reachable through their OpTable, so they all have internal
+# linkage and stay out of the symbol table and the headers.
+slot_funcs = {}
+for opname in ops:
+    block = stub_blocks[opname] = [f"\n// Stub definitions for {opname}"]
+    emit = EMITTERS.get(opname, _emit_not_implemented)
+    fallbacks = set()
     for left in type_tags:
         for right in type_tags:
-            # Use double underscore to avoid ambiguity
-            print(f"var {opname}__{left}__{right}(const var& a, const var& b, pythonic::overflow::Overflow policy, bool smallest_fit) {{")
-            
-            # Implementation Logic
-            # Simple comparison operators: direct cast to common type for numeric and string
-            if opname in ("eq", "ne", "gt", "ge", "lt", "le"):
-                # string compare
-                if left == "string" and right == "string":
-                    if opname == "eq":
-                        print(f"    return var(a.var_get<std::string>() == b.var_get<std::string>());")
-                    elif opname == "ne":
-                        print(f"    return var(a.var_get<std::string>() != b.var_get<std::string>());")
-                    elif opname == "gt":
-                        print(f"    return var(a.var_get<std::string>() > b.var_get<std::string>());")
-                    elif opname == "ge":
-                        print(f"    return var(a.var_get<std::string>() >= b.var_get<std::string>());")
-                    elif opname == "lt":
-                        print(f"    return var(a.var_get<std::string>() < b.var_get<std::string>());")
-                    elif opname == "le":
-                        print(f"    return var(a.var_get<std::string>() <= b.var_get<std::string>());")
-                # container compare (lists, sets, orderedset, dicts, ordereddict)
-                elif left == "list" and right == "list":
-                    print(f"    const auto &lst1 = a.var_get<{qualified['list']}>();")
-                    print(f"    const auto &lst2 = b.var_get<{qualified['list']}>();")
-                    if opname == "eq":
-                        print(f"    if (lst1.size() != lst2.size()) return var(false);")
-                        print(f"    return var(std::equal(lst1.begin(), lst1.end(), lst2.begin(), lst2.end()));")
-                    elif opname == "ne":
-                        print(f"    if (lst1.size() != lst2.size()) return var(true);")
-                        print(f"    return var(!std::equal(lst1.begin(), lst1.end(), lst2.begin(), lst2.end()));")
-                    elif opname == "lt":
-                        print(f"    return var(std::lexicographical_compare(lst1.begin(), lst1.end(), lst2.begin(), lst2.end()));")
-                    elif opname == "le":
-                        print(f"    return var(!std::lexicographical_compare(lst2.begin(), lst2.end(), lst1.begin(), lst1.end()));")
-                    elif opname == "gt":
-                        print(f"    return var(std::lexicographical_compare(lst2.begin(), lst2.end(), lst1.begin(), lst1.end()));")
-                    elif opname == "ge":
-                        print(f"    return var(!std::lexicographical_compare(lst1.begin(), lst1.end(), lst2.begin(), lst2.end()));")
-                elif left == "set" and right == "set":
-                    print(f"    const auto &set1 = a.var_get<{qualified['set']}>();")
-                    print(f"    const auto &set2 = b.var_get<{qualified['set']}>();")
-                    if opname == "eq":
-                        print(f"    if (set1.size() != set2.size()) return var(false);")
-                        print("    for (const auto &elem : set1) {")
-                        print("        if (set2.find(elem) == set2.end()) return var(false);")
-                        print("    }")
-                        print(f"    return var(true);")
-                    elif opname == "ne":
-                        print(f"    if (set1.size() != set2.size()) return var(true);")
-                        print("    for (const auto &elem : set1) {")
-                        print("        if (set2.find(elem) == set2.end()) return var(true);")
-                        print("    }")
-                        print(f"    return var(false);")
-                    elif opname == "lt":
-                        print(f"    if (set1.size() >= set2.size()) return var(false);")
-                        print("    for (const auto &elem : set1) {")
-                        print("        if (set2.find(elem) == set2.end()) return var(false);")
-                        print("    }")
-                        print(f"    return var(true);")
-                    elif opname == "le":
-                        print("    for (const auto &elem : set1) {")
-                        print("        if (set2.find(elem) == set2.end()) return var(false);")
-                        print("    }")
-                        print(f"    return var(true);")
-                    elif opname == "gt":
-                        print(f"    if (set2.size() >= set1.size()) return var(false);")
-                        print("    for (const auto &elem : set2) {")
-                        print("        if (set1.find(elem) == set1.end()) return var(false);")
-                        print("    }")
-                        print(f"    return var(true);")
-                    elif opname == "ge":
-                        print("    for (const auto &elem : set2) {")
-                        print("        if (set1.find(elem) == set1.end()) return var(false);")
-                        print("    }")
-                        print(f"    return var(true);")
-                elif left == "orderedset" and right == "orderedset":
-                    print(f"    const auto &set1 = a.var_get<{qualified['orderedset']}>();")
-                    print(f"    const auto &set2 = b.var_get<{qualified['orderedset']}>();")
-                    if opname == "eq":
-                        print(f"    return var(std::equal(set1.begin(), set1.end(), set2.begin(), set2.end()));")
-                    elif opname == "ne":
-                        print(f"    return var(!std::equal(set1.begin(), set1.end(), set2.begin(), set2.end()));")
-                    elif opname == "lt":
-                        print(f"    return var(std::lexicographical_compare(set1.begin(), set1.end(), set2.begin(), set2.end()));")
-                    elif opname == "le":
-                        print(f"    return var(!std::lexicographical_compare(set2.begin(), set2.end(), set1.begin(), set1.end()));")
-                    elif opname == "gt":
-                        print(f"    return var(std::lexicographical_compare(set2.begin(), set2.end(), set1.begin(), set1.end()));")
-                    elif opname == "ge":
-                        print(f"    return var(!std::lexicographical_compare(set1.begin(), set1.end(), set2.begin(), set2.end()));")
-                elif left == "dict" and right == "dict":
-                    if opname in ("eq", "ne"):
-                        print(f"    const auto &dict1 = a.var_get<{qualified['dict']}>();")
-                        print(f"    const auto &dict2 = b.var_get<{qualified['dict']}>();")
-                        if opname == "eq":
-                            print(f"    if (dict1.size() != dict2.size()) return var(false);")
-                            print("    for (const auto &kv : dict1) {")
-                            print("        const auto &key = kv.first; const auto &val = kv.second;")
-                            print("        auto it = dict2.find(key);")
-                            print("        if (it == dict2.end() || !static_cast<bool>(val == it->second)) return var(false);")
-                            print("    }")
-                            print(f"    return var(true);")
-                        else:
-                            print(f"    if (dict1.size() != dict2.size()) return var(true);")
-                            print("    for (const auto &kv : dict1) {")
-                            print("        const auto &key = kv.first; const auto &val = kv.second;")
-                            print("        auto it = dict2.find(key);")
-                            print("        if (it == dict2.end() || static_cast<bool>(val != it->second)) return var(true);")
-                            print("    }")
-                            print(f"    return var(false);")
-                    else:
-                        print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: 'dict' and 'dict'\");")
-                elif left == "ordereddict" and right == "ordereddict":
-                    print(f"    const auto &dict1 = a.var_get<{qualified['ordereddict']}>();")
-                    print(f"    const auto &dict2 = b.var_get<{qualified['ordereddict']}>();")
-                    if opname == "eq":
-                        print(f"    return var(std::equal(dict1.begin(), dict1.end(), dict2.begin(), dict2.end()));")
-                    elif opname == "ne":
-                        print(f"    return var(!std::equal(dict1.begin(), dict1.end(), dict2.begin(), dict2.end()));")
-                    elif opname == "lt":
-                        print(f"    return var(std::lexicographical_compare(dict1.begin(), dict1.end(), dict2.begin(), dict2.end()));")
-                    elif opname == "le":
-                        print(f"    return var(!std::lexicographical_compare(dict2.begin(), dict2.end(), dict1.begin(), dict1.end()));")
-                    elif opname == "gt":
-                        print(f"    return var(std::lexicographical_compare(dict2.begin(), dict2.end(), dict1.begin(), dict1.end()));")
-                    elif opname == "ge":
-                        print(f"    return var(!std::lexicographical_compare(dict1.begin(), dict1.end(), dict2.begin(), dict2.end()));")
-                # numeric compare
-                elif is_numeric(left) and is_numeric(right):
-                    ctype = get_common_type(left, right)
-                    print_cast('a', 'la', left, ctype)
-                    print_cast('b', 'lb', right, ctype)
-                    if opname == "eq":
-                        print(f"    return var(la == lb);")
-                    elif opname == "ne":
-                        print(f"    return var(la != lb);")
-                    elif opname == "gt":
-                        print(f"    return var(la > lb);")
-                    elif opname == "ge":
-                        print(f"    return var(la >= lb);")
-                    elif opname == "lt":
-                        print(f"    return var(la < lb);")
-                    elif opname == "le":
-                        print(f"    return var(la <= lb);")
-                else:
-                    print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '{left}' and '{right}'\");")
-                print("}")
+            lines = []
+            emit(lines, opname, left, right)
+            if lines == [type_error_line(opname, left, right)]:
+                fallbacks.add("type_error")
+                slot_funcs[opname, left, right] = f"type_error__{opname}"
                 continue
-
-            elif opname in ("band", "bor", "bxor"):
-                if left == 'bool' and right == 'bool':
-                    if opname == "band":
-                        print(f"    return var(static_cast<bool>(a.var_get<bool>() & b.var_get<bool>()));")
-                    elif opname == "bor":
-                        print(f"    return var(static_cast<bool>(a.var_get<bool>() | b.var_get<bool>()));")
-                    elif opname == "bxor":
-                        print(f"    return var(static_cast<bool>(a.var_get<bool>() ^ b.var_get<bool>()));")
-                elif is_integral(left) and is_integral(right):
-                    ctype = get_common_integral_bitwise(left, right)
-                    print_cast('a', 'la', left, ctype)
-                    print_cast('b', 'lb', right, ctype)
-                    if opname == "band":
-                        print(f"    return var(la & lb);")
-                    elif opname == "bor":
-                        print(f"    return var(la | lb);")
-                    elif opname == "bxor":
-                        print(f"    return var(la ^ lb);")
-                elif left == right:
-                    if left == "set":
-                        print(f"    const auto &lhs = a.var_get<{qualified['set']}>();")
-                        print(f"    const auto &rhs = b.var_get<{qualified['set']}>();")
-                        if opname == "band":
-                            print(f"    {qualified['set']} result;")
-                            print("    for (const auto &item : lhs) {")
-                            print("        if (rhs.find(item) != rhs.end()) {")
-                            print("            result.insert(item);")
-                            print("        }")
-                            print("    }")
-                            print("    return var(std::move(result));")
-                        elif opname == "bor":
-                            print(f"    {qualified['set']} result = lhs;")
-                            print("    result.insert(rhs.begin(), rhs.end());")
-                            print("    return var(std::move(result));")
-                        elif opname == "bxor":
-                            print(f"    {qualified['set']} result;")
-                            print("    for (const auto &item : lhs) {")
-                            print("        if (rhs.find(item) == rhs.end()) {")
-                            print("            result.insert(item);")
-                            print("        }")
-                            print("    }")
-                            print("    for (const auto &item : rhs) {")
-                            print("        if (lhs.find(item) == lhs.end()) {")
-                            print("            result.insert(item);")
-                            print("        }")
-                            print("    }")
-                            print("    return var(std::move(result));")
-                    elif left == "orderedset":
-                        print(f"    const auto &lhs = a.var_get<{qualified['orderedset']}>();")
-                        print(f"    const auto &rhs = b.var_get<{qualified['orderedset']}>();")
-                        if opname == "band":
-                            print(f"    {qualified['orderedset']} result;")
-                            print("    auto it_lhs = lhs.begin();")
-                            print("    auto it_rhs = rhs.begin();")
-                            print("    while (it_lhs != lhs.end() && it_rhs != rhs.end()) {")
-                            print("        if (*it_lhs < *it_rhs) {")
-                            print("            ++it_lhs;")
-                            print("        } else if (*it_rhs < *it_lhs) {")
-                            print("            ++it_rhs;")
-                            print("        } else {")
-                            print("            result.insert(*it_lhs);")
-                            print("            ++it_lhs;")
-                            print("            ++it_rhs;")
-                            print("        }")
-                            print("    }")
-                            print("    return var(std::move(result));")
-                        elif opname == "bor":
-                            print(f"    {qualified['orderedset']} result;")
-                            print("    auto it_lhs = lhs.begin();")
-                            print("    auto it_rhs = rhs.begin();")
-                            print("    while (it_lhs != lhs.end() && it_rhs != rhs.end()) {")
-                            print("        if (*it_lhs < *it_rhs) {")
-                            print("            result.insert(*it_lhs);")
-                            print("            ++it_lhs;")
-                            print("        } else if (*it_rhs < *it_lhs) {")
-                            print("            result.insert(*it_rhs);")
-                            print("            ++it_rhs;")
-                            print("        } else {")
-                            print("            result.insert(*it_lhs);")
-                            print("            ++it_lhs;")
-                            print("            ++it_rhs;")
-                            print("        }")
-                            print("    }")
-                            print("    while (it_lhs != lhs.end()) {")
-                            print("        result.insert(*it_lhs);")
-                            print("        ++it_lhs;")
-                            print("    }")
-                            print("    while (it_rhs != rhs.end()) {")
-                            print("        result.insert(*it_rhs);")
-                            print("        ++it_rhs;")
-                            print("    }")
-                            print("    return var(std::move(result));")
-                        elif opname == "bxor":
-                            print(f"    {qualified['orderedset']} result;")
-                            print("    auto it_lhs = lhs.begin();")
-                            print("    auto it_rhs = rhs.begin();")
-                            print("    while (it_lhs != lhs.end() && it_rhs != rhs.end()) {")
-                            print("        if (*it_lhs < *it_rhs) {")
-                            print("            result.insert(*it_lhs);")
-                            print("            ++it_lhs;")
-                            print("        } else if (*it_rhs < *it_lhs) {")
-                            print("            result.insert(*it_rhs);")
-                            print("            ++it_rhs;")
-                            print("        } else {")
-                            print("            ++it_lhs;")
-                            print("            ++it_rhs;")
-                            print("        }")
-                            print("    }")
-                            print("    while (it_lhs != lhs.end()) {")
-                            print("        result.insert(*it_lhs);")
-                            print("        ++it_lhs;")
-                            print("    }")
-                            print("    while (it_rhs != rhs.end()) {")
-                            print("        result.insert(*it_rhs);")
-                            print("        ++it_rhs;")
-                            print("    }")
-                            print("    return var(std::move(result));")
-                    elif left == "list":
-                        print(f"    const auto &lhs = a.var_get<{qualified['list']}>();")
-                        print(f"    const auto &rhs = b.var_get<{qualified['list']}>();")
-                        if opname == "band":
-                            print(f"    {qualified['list']} result;")
-                            print(f"    {qualified['set']} rhs_set(rhs.begin(), rhs.end());")
-                            print("    for (const auto &item : lhs) {")
-                            print("        if (rhs_set.find(item) != rhs_set.end()) {")
-                            print("            result.push_back(item);")
-                            print("        }")
-                            print("    }")
-                            print("    return var(std::move(result));")
-                        elif opname == "bor":
-                            print(f"    {qualified['list']} result;")
-                            print("    result.reserve(lhs.size() + rhs.size());")
-                            print("    result.insert(result.end(), lhs.begin(), lhs.end());")
-                            print("    result.insert(result.end(), rhs.begin(), rhs.end());")
-                            print("    return var(std::move(result));")
-                        elif opname == "bxor":
-                            print(f"    {qualified['list']} result;")
-                            print(f"    {qualified['set']} lhs_set(lhs.begin(), lhs.end());")
-                            print(f"    {qualified['set']} rhs_set(rhs.begin(), rhs.end());")
-                            print("    for (const auto &item : lhs) {")
-                            print("        if (rhs_set.find(item) == rhs_set.end()) {")
-                            print("            result.push_back(item);")
-                            print("        }")
-                            print("    }")
-                            print("    for (const auto &item : rhs) {")
-                            print("        if (lhs_set.find(item) == lhs_set.end()) {")
-                            print("            result.push_back(item);")
-                            print("        }")
-                            print("    }")
-                            print("    return var(std::move(result));")
-                    elif left == "dict":
-                        if opname in ("band", "bor"):
-                            print(f"    const auto &lhs = a.var_get<{qualified['dict']}>();")
-                            print(f"    const auto &rhs = b.var_get<{qualified['dict']}>();")
-                            if opname == "band":
-                                print(f"    {qualified['dict']} result;")
-                                print("    for (const auto &[key, val] : lhs) {")
-                                print("        if (rhs.find(key) != rhs.end()) {")
-                                print("            result[key] = val;")
-                                print("        }")
-                                print("    }")
-                                print("    return var(std::move(result));")
-                            elif opname == "bor":
-                                print(f"    {qualified['dict']} result = lhs;")
-                                print("    for (const auto &[key, val] : rhs) {")
-                                print("        result[key] = val;")
-                                print("    }")
-                                print("    return var(std::move(result));")
-                        else:
-                            print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '{left}' and '{right}'\");")
-                    elif left == "ordereddict":
-                        if opname in ("band", "bor"):
-                            print(f"    const auto &lhs = a.var_get<{qualified['ordereddict']}>();")
-                            print(f"    const auto &rhs = b.var_get<{qualified['ordereddict']}>();")
-                            if opname == "band":
-                                print(f"    {qualified['ordereddict']} result;")
-                                print("    for (const auto &[key, val] : lhs) {")
-                                print("        if (rhs.find(key) != rhs.end()) {")
-                                print("            result[key] = val;")
-                                print("        }")
-                                print("    }")
-                                print("    return var(std::move(result));")
-                            elif opname == "bor":
-                                print(f"    {qualified['ordereddict']} result = lhs;")
-                                print("    for (const auto &[key, val] : rhs) {")
-                                print("        result[key] = val;")
-                                print("    }")
-                                print("    return var(std::move(result));")
-                        else:
-                            print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '{left}' and '{right}'\");")
-                    else:
-                        print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '{left}' and '{right}'\");")
-                else:
-                    print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '{left}' and '{right}'\");")
-                print("}")
+            if lines == [not_implemented_line(opname, left, right)]:
+                fallbacks.add("not_implemented")
+                slot_funcs[opname, left, right] = f"not_implemented__{opname}"
                 continue
-
-            elif opname in ("shl", "shr"):
-                if is_integral(left) and is_integral(right):
-                    ctype = get_common_integral_bitwise(left, right)
-                    print_cast('a', 'la', left, ctype)
-                    print_cast('b', 'lb', right, ctype)
-                    if opname == "shl":
-                        print(f"    return var(la << lb);")
-                    elif opname == "shr":
-                        print(f"    return var(la >> lb);")
-                else:
-                    print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '{left}' and '{right}'\");")
-                print("}")
+            kernel = forwarded_kernel(lines)
+            if kernel is not None:
+                mirror = slot_funcs.get((opname, right, left))
+                if opname in COMMUTATIVE and mirror and is_mirrored_kernel(kernel, mirror, left, right):
+                    kernel = f"swap_operands<{mirror}>"
+                slot_funcs[opname, left, right] = kernel
                 continue
-
-            if opname == "add":
-                if left == "string" and right == "string":
-                    print(f"    return var(a.var_get<std::string>() + b.var_get<std::string>());")
-                elif left == "string" and right == "bool":
-                    print(f"    return var(a.var_get<std::string>() + (b.var_get<bool>() ? std::string(\"true\") : std::string(\"false\")));")
-                elif left == "bool" and right == "string":
-                    print(f"    return var((a.var_get<bool>() ? std::string(\"true\") : std::string(\"false\")) + b.var_get<std::string>());")
-                elif left == "list" and right == "list":
-                    print(f"    const auto& al = a.var_get<{qualified['list']}>();")
-                    print(f"    const auto& bl = b.var_get<{qualified['list']}>();")
-                    print(f"    {qualified['list']} res; res.reserve(al.size() + bl.size());")
-                    print("    res.insert(res.end(), al.begin(), al.end());")
-                    print("    res.insert(res.end(), bl.begin(), bl.end());")
-                    print("    return var(std::move(res));")
-                elif is_numeric(left) and is_numeric(right):
-                    ctype = get_common_type(left, right)
-                    # Numeric: handle by policy
-                    print(f"    // Numeric add with policy-aware handling")
-                    print_cast('a', 'la', left, ctype)
-                    print_cast('b', 'lb', right, ctype)
-                    print(f"    if (policy == pythonic::overflow::Overflow::None_of_them) {{")
-                    print(f"        return var(la + lb);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Throw) {{")
-                    print(f"        auto res = pythonic::overflow::add_throw(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Wrap) {{")
-                    print(f"        auto res = pythonic::overflow::add_wrap(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else {{")
-                    print(f"        // Promote: compute in long double then smart-promote")
-                    print(f"        long double result = static_cast<long double>(la) + static_cast<long double>(lb);")
-                    # determine type enum
-                    is_float = left in ["float", "double", "long_double"] or right in ["float", "double", "long_double"]
-                    both_unsigned = left in ["uint","ulong","ulong_long"] and right in ["uint","ulong","ulong_long"]
-                    if is_float:
-                        print(f"        auto ptype = pythonic::promotion::Has_float;")
-                    elif both_unsigned:
-                        print(f"        auto ptype = pythonic::promotion::Both_unsigned;")
-                    else:
-                        print(f"        auto ptype = pythonic::promotion::Signed;")
-                    # min_rank as max of input ranks
-                    rank_map = {
-                        'int':'pythonic::promotion::RANK_INT', 'uint':'pythonic::promotion::RANK_UINT',
-                        'long':'pythonic::promotion::RANK_LONG', 'ulong':'pythonic::promotion::RANK_ULONG',
-                        'long_long':'pythonic::promotion::RANK_LONG_LONG', 'ulong_long':'pythonic::promotion::RANK_ULONG_LONG',
-                        'float':'pythonic::promotion::RANK_FLOAT', 'double':'pythonic::promotion::RANK_DOUBLE', 'long_double':'pythonic::promotion::RANK_LONG_DOUBLE'
-                    }
-                    left_rank = rank_map.get(left, '0')
-                    right_rank = rank_map.get(right, '0')
-                    print(f"        int min_rank = std::max({left_rank}, {right_rank});")
-                    print(f"        return pythonic::promotion::smart_promote(result, ptype, smallest_fit, min_rank, false);")
-                    print("    }")
-                else:
-                    print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for +: '{left}' and '{right}'\");")
-            
-            elif opname == "sub":
-                if is_numeric(left) and is_numeric(right):
-                    ctype = get_common_type(left, right)
-                    print(f"    // Numeric sub with policy-aware handling")
-                    print_cast('a', 'la', left, ctype)
-                    print_cast('b', 'lb', right, ctype)
-                    print(f"    if (policy == pythonic::overflow::Overflow::None_of_them) {{")
-                    print(f"        return var(la - lb);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Throw) {{")
-                    print(f"        auto res = pythonic::overflow::sub_throw(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Wrap) {{")
-                    print(f"        auto res = pythonic::overflow::sub_wrap(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else {{")
-                    print(f"        long double result = static_cast<long double>(la) - static_cast<long double>(lb);")
-                    is_float = left in ["float", "double", "long_double"] or right in ["float", "double", "long_double"]
-                    both_unsigned = left in ["uint","ulong","ulong_long"] and right in ["uint","ulong","ulong_long"]
-                    if is_float:
-                        print(f"        auto ptype = pythonic::promotion::Has_float;")
-                    elif both_unsigned:
-                        print(f"        auto ptype = pythonic::promotion::Both_unsigned;")
-                    else:
-                        print(f"        auto ptype = pythonic::promotion::Signed;")
-                    left_rank = rank_map.get(left, '0')
-                    right_rank = rank_map.get(right, '0')
-                    print(f"        int min_rank = std::max({left_rank}, {right_rank});")
-                    print(f"        return pythonic::promotion::smart_promote(result, ptype, smallest_fit, min_rank, true);")
-                    print("    }")
-                elif left == "set" and right == "set":
-                    print(f"    const auto& as = a.var_get<{qualified['set']}>();")
-                    print(f"    const auto& bs = b.var_get<{qualified['set']}>();")
-                    print(f"    {qualified['set']} res;")
-                    print("    for(const auto& item : as) {")
-                    print("        if(bs.find(item) == bs.end()) res.insert(item);")
-                    print("    }")
-                    print("    return var(std::move(res));")
-                elif left == "dict" and right == "dict":
-                    print(f"    const auto& ad = a.var_get<{qualified['dict']}>();")
-                    print(f"    const auto& bd = b.var_get<{qualified['dict']}>();")
-                    print(f"    {qualified['dict']} res;")
-                    print("    for(const auto& [k, v] : ad) {")
-                    print("        if(bd.find(k) == bd.end()) res[k] = v;")
-                    print("    }")
-                    print("    return var(std::move(res));")
-                elif left == "orderedset" and right == "orderedset":
-                    print(f"    const auto& a_cont = a.var_get<{qualified['orderedset']}>();")
-                    print(f"    const auto& b_cont = b.var_get<{qualified['orderedset']}>();")
-                    print(f"    {qualified['orderedset']} res;")
-                    print("    // Merge-like difference preserving order")
-                    print("    auto it_a = a_cont.begin();")
-                    print("    auto it_b = b_cont.begin();")
-                    print("    while (it_a != a_cont.end() && it_b != b_cont.end()) {")
-                    print("        if (*it_a < *it_b) {")
-                    print("            res.insert(*it_a);")
-                    print("            ++it_a;")
-                    print("        } else if (*it_b < *it_a) {")
-                    print("            ++it_b;")
-                    print("        } else {")
-                    print("            // Equal, skip")
-                    print("            ++it_a; ++it_b;")
-                    print("        }")
-                    print("    }")
-                    print("    while (it_a != a_cont.end()) {")
-                    print("        res.insert(*it_a);")
-                    print("        ++it_a;")
-                    print("    }")
-                    print("    return var(std::move(res));")
-                elif left == "ordereddict" and right == "ordereddict":
-                    print(f"    const auto& ad = a.var_get<{qualified['ordereddict']}>();")
-                    print(f"    const auto& bd = b.var_get<{qualified['ordereddict']}>();")
-                    print(f"    {qualified['ordereddict']} res;")
-                    print("    for(const auto& val : ad) {")
-                    print("        if(bd.find(val.first) == bd.end()) res.insert(val);")
-                    print("    }")
-                    print("    return var(std::move(res));")
-                elif left == "list" and right == "list":
-                    # List difference (remove items in A that are in B)
-                    print(f"    const auto& al = a.var_get<{qualified['list']}>();")
-                    print(f"    const auto& bl = b.var_get<{qualified['list']}>();")
-                    print(f"    {qualified['list']} res;")
-                    print(f"    {qualified['set']} bs(bl.begin(), bl.end());")
-                    print("    for(const auto& item : al) {")
-                    print("        if(bs.find(item) == bs.end()) res.push_back(item);")
-                    print("    }")
-                    print("    return var(std::move(res));")
-                else:
-                    print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for -: '{left}' and '{right}'\");")
-            
-            elif opname == "mul":
-                if left == "string" and right in ["int", "long", "long_long"]:
-                     print("    std::string s = a.var_get<std::string>();")
-                     print(f"    long long n = (long long)b.var_get<{cpp_types[right]}>();")
-                     print("    if(n <= 0) return var(std::string(\"\"));")
-                     print("    std::string res; res.reserve(s.size() * n);")
-                     print("    for(long long i=0; i<n; ++i) res += s;")
-                     print("    return var(res);")
-                elif right == "string" and left in ["int", "long", "long_long"]:
-                     print("    std::string s = b.var_get<std::string>();")
-                     print(f"    long long n = (long long)a.var_get<{cpp_types[left]}>();")
-                     print("    if(n <= 0) return var(std::string(\"\"));")
-                     print("    std::string res; res.reserve(s.size() * n);")
-                     print("    for(long long i=0; i<n; ++i) res += s;")
-                     print("    return var(res);")
-                elif left == "list" and right in ["int", "long", "long_long"]:
-                     print(f"    const auto& lst = a.var_get<{qualified['list']}>();")
-                     print(f"    long long n = (long long)b.var_get<{cpp_types[right]}>();")
-                     print(f"    if(n <= 0) return var({qualified['list']}{{}});")
-                     print(f"    {qualified['list']} res; res.reserve(lst.size() * n);")
-                     print("    for(long long i=0; i<n; ++i) res.insert(res.end(), lst.begin(), lst.end());")
-                     print("    return var(std::move(res));")
-                elif right == "list" and left in ["int", "long", "long_long"]:
-                     print(f"    const auto& lst = b.var_get<{qualified['list']}>();")
-                     print(f"    long long n = (long long)a.var_get<{cpp_types[left]}>();")
-                     print(f"    if(n <= 0) return var({qualified['list']}{{}});")
-                     print(f"    {qualified['list']} res; res.reserve(lst.size() * n);")
-                     print("    for(long long i=0; i<n; ++i) res.insert(res.end(), lst.begin(), lst.end());")
-                     print("    return var(std::move(res));")
-                elif is_numeric(left) and is_numeric(right):
-                    ctype = get_common_type(left, right)
-                    print(f"    // Numeric mul with policy-aware handling")
-                    print_cast('a', 'la', left, ctype)
-                    print_cast('b', 'lb', right, ctype)
-                    print(f"    if (policy == pythonic::overflow::Overflow::None_of_them) {{")
-                    print(f"        return var(la * lb);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Throw) {{")
-                    print(f"        auto res = pythonic::overflow::mul_throw(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Wrap) {{")
-                    print(f"        auto res = pythonic::overflow::mul_wrap(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else {{")
-                    print(f"        long double result = static_cast<long double>(la) * static_cast<long double>(lb);")
-                    is_float = left in ["float", "double", "long_double"] or right in ["float", "double", "long_double"]
-                    both_unsigned = left in ["uint","ulong","ulong_long"] and right in ["uint","ulong","ulong_long"]
-                    if is_float:
-                        print(f"        auto ptype = pythonic::promotion::Has_float;")
-                    elif both_unsigned:
-                        print(f"        auto ptype = pythonic::promotion::Both_unsigned;")
-                    else:
-                        print(f"        auto ptype = pythonic::promotion::Signed;")
-                    left_rank = rank_map.get(left, '0')
-                    right_rank = rank_map.get(right, '0')
-                    print(f"        int min_rank = std::max({left_rank}, {right_rank});")
-                    print(f"        return pythonic::promotion::smart_promote(result, ptype, smallest_fit, min_rank, false);")
-                    print("    }")
-                else:
-                     print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for *: '{left}' and '{right}'\");")
-
-            elif opname == "div":
-                if is_numeric(left) and is_numeric(right):
-                    ctype = get_common_type(left, right)
-                    print(f"    // Numeric div with policy-aware handling")
-                    print_cast('a', 'la', left, ctype)
-                    print_cast('b', 'lb', right, ctype)
-
-                    print(f"    if (static_cast<long double>(lb) == 0.0L) throw pythonic::PythonicZeroDivisionError(\"float division by zero\");")
-                    print(f"    if (policy == pythonic::overflow::Overflow::None_of_them) {{")
-                    print(f"        return var(la / lb);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Throw) {{")
-                    print(f"        auto res = pythonic::overflow::div_throw(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else if (policy == pythonic::overflow::Overflow::Wrap) {{")
-                    print(f"        auto res = pythonic::overflow::div_wrap(la, lb);")
-                    print(f"        return var(res);")
-                    print(f"    }} else {{")
-                    print(f"        long double result = static_cast<long double>(la) / static_cast<long double>(lb);")
-                    is_float = left in ["float", "double", "long_double"] or right in ["float", "double", "long_double"]
-                    both_unsigned = left in ["uint","ulong","ulong_long"] and right in ["uint","ulong","ulong_long"]
-                    
-                    print(f"        auto ptype = pythonic::promotion::Has_float;")
-                    left_rank = rank_map.get(left, '0')
-                    right_rank = rank_map.get(right, '0')
-                    print(f"        int min_rank = std::max({left_rank}, {right_rank});")
-                    print(f"        return pythonic::promotion::smart_promote(result, ptype, smallest_fit, min_rank, false);")
-                    print("    }")
-                else:
-                    print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for /: '{left}' and '{right}'\");")
-
-            elif opname == "mod":
-                if is_numeric(left) and is_numeric(right):
-                    # If both are integer-like, use integral modulo helpers
-                    int_types = ["int", "long", "long_long", "uint", "ulong", "ulong_long", "bool"]
-                    float_types = ["float", "double", "long_double"]
-                    if left in int_types and right in int_types:
-                        ctype = get_common_type(left, right)
-                        print_cast('a', 'la', left, ctype)
-                        print_cast('b', 'lb', right, ctype)
-                        print(f"    if (lb == 0) throw pythonic::PythonicZeroDivisionError(\"integer division or modulo by zero\");")
-                        print(f"    if (policy == pythonic::overflow::Overflow::None_of_them) {{")
-                        print(f"        return var(la % lb);")
-                        print(f"    }} else if (policy == pythonic::overflow::Overflow::Throw) {{")
-                        print(f"        auto res = pythonic::overflow::mod_throw(la, lb);")
-                        print(f"        return var(res);")
-                        print(f"    }} else if (policy == pythonic::overflow::Overflow::Wrap) {{")
-                        print(f"        auto res = pythonic::overflow::mod_wrap(la, lb);")
-                        print(f"        return var(res);")
-                        print(f"    }} else {{")
-                        print(f"        long double result = std::fmod(static_cast<long double>(la), static_cast<long double>(lb));")
-                        is_float = left in float_types or right in float_types
-                        both_unsigned = left in ["uint","ulong","ulong_long"] and right in ["uint","ulong","ulong_long"]
-                        if is_float:
-                            print(f"        auto ptype = pythonic::promotion::Has_float;")
-                        elif both_unsigned:
-                            print(f"        auto ptype = pythonic::promotion::Both_unsigned;")
-                        else:
-                            print(f"        auto ptype = pythonic::promotion::Signed;")
-                        left_rank = rank_map.get(left, '0')
-                        right_rank = rank_map.get(right, '0')
-                        print(f"        int min_rank = std::max({left_rank}, {right_rank});")
-                        print(f"        return pythonic::promotion::smart_promote(result, ptype, smallest_fit, min_rank, false);")
-                        print("    }")
-                    # If either operand is floating, perform floating modulo (fmod)
-                    elif left in float_types or right in float_types:
-                        # choose compute type based on presence of long_double/double/float
-                        compute = None
-                        if left == 'long_double' or right == 'long_double':
-                            compute = 'long double'
-                        elif left == 'double' or right == 'double':
-                            compute = 'double'
-                        else:
-                            compute = 'float'
-                        # Use print_cast here too; it will call var_get<bool>() correctly if needed.
-                        # For float compute types we still want to cast from the original stored type.
-                        if left == 'bool':
-                            print(f"    {compute} la = static_cast<{compute}>(a.var_get<bool>());")
-                        else:
-                            print(f"    {compute} la = static_cast<{compute}>({{}}.var_get<{cpp_types[left]}>());".format('a'))
-                        if right == 'bool':
-                            print(f"    {compute} lb = static_cast<{compute}>(b.var_get<bool>());")
-                        else:
-                            print(f"    {compute} lb = static_cast<{compute}>({{}}.var_get<{cpp_types[right]}>());".format('b'))
-                        print(f"    if (static_cast<long double>(lb) == 0.0L) throw pythonic::PythonicZeroDivisionError(\"float division by zero\");")
-                        print(f"    if (policy == pythonic::overflow::Overflow::None_of_them || policy == pythonic::overflow::Overflow::Throw || policy == pythonic::overflow::Overflow::Wrap) {{")
-                        print(f"        {compute} res = std::fmod(la, lb);")
-                        print(f"        return var(res);")
-                        print(f"    }} else {{")
-                        print(f"        long double result = std::fmod(static_cast<long double>(la), static_cast<long double>(lb));")
-                        is_float = True
-                        both_unsigned = False
-                        print(f"        auto ptype = pythonic::promotion::Has_float;")
-                        left_rank = rank_map.get(left, '0')
-                        right_rank = rank_map.get(right, '0')
-                        print(f"        int min_rank = std::max({left_rank}, {right_rank});")
-                        print(f"        return pythonic::promotion::smart_promote(result, ptype, smallest_fit, min_rank, false);")
-                        print("    }")
-                    else:
-                        print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for %: '{left}' and '{right}'\");")
-                else:
-                    print(f"    throw pythonic::PythonicTypeError(\"TypeError: unsupported operand type(s) for %: '{left}' and '{right}'\");")
-
-            else:
-                print(f"    throw std::runtime_error(\"Not implemented: {opname} for {left} and {right}\");")
-            
-            print("}")
+            # Use double underscore to avoid ambiguity
+            slot_funcs[opname, left, right] = f"{opname}__{left}__{right}"
+            lines.insert(0, f"static var {opname}__{left}__{right}(const var& a, const var& b, pythonic::overflow::Overflow policy, bool smallest_fit) {{")
+            lines.append("}")
+            block.append("\n".join(lines))
+    if opname in op_helpers:
+        block.insert(1, op_helpers[opname])
+    # The fallbacks go first so the OpTable below can name them without a declaration
+    if "not_implemented" in fallbacks:
+        block.insert(1, "\n".join([
+            f"static var not_implemented__{opname}(const var& a, const var& b, pythonic::overflow::Overflow, bool) {{",
+            f"    throw std::runtime_error(std::string(\"Not implemented: {opname} for \") + stub_tag_name(a) + \" and \" + stub_tag_name(b));",
+            "}"]))
+    if "type_error" in fallbacks:
+        block.insert(1, "\n".join([
+            f"static var type_error__{opname}(const var& a, const var& b, pythonic::overflow::Overflow, bool) {{",
+            f"    throw pythonic::PythonicTypeError(std::string(\"TypeError: unsupported operand type(s) for {op_symbols[opname]}: '\") + stub_tag_name(a) + \"' and '\" + stub_tag_name(b) + \"'\");",
+            "}"]))
 
 # Generate OpTable initializations
 
+# The tables are plain aggregates of function addresses, so they are constant
+# initialized (read-only data, no start-up code) rather than built by a lambda;
+# constinit makes the compiler reject any entry that would need start-up code
+table_blocks = {}
 for opname, opstruct_name in op_struct_map.items():
-    actual_op_func = ops[opname] # e.g. "add"
-    print(f"\n// OpTable initialization for {opstruct_name}")
-    print(f"template <>")
-    print(f"const std::array<std::array<pythonic::dispatch::BinaryOpFunc, pythonic::dispatch::TypeTagCount>, pythonic::dispatch::TypeTagCount> pythonic::dispatch::OpTable<pythonic::dispatch::{opstruct_name}>::table = []() {{")
-    print(f"    std::array<std::array<pythonic::dispatch::BinaryOpFunc, pythonic::dispatch::TypeTagCount>, pythonic::dispatch::TypeTagCount> t{{}};")
-    for i, left in enumerate(type_tags):
-        # build row
-        entries = ", ".join([f"pythonic::dispatch::{actual_op_func}__{left}__{right}" for right in type_tags])
-        print(f"    t[{i}] = {{{entries}}};")
-    print(f"    return t;")
-    print(f"}}();")
-
-print("\n} // namespace dispatch")
-print("} // namespace pythonic")
+    table_blocks[opname] = "\n".join([
+        f"\n// OpTable initialization for {opstruct_name}",
+        f"template <>",
+        f"constinit const std::array<std::array<pythonic::dispatch::BinaryOpFunc, pythonic::dispatch::TypeTagCount>, pythonic::dispatch::TypeTagCount> pythonic::dispatch::OpTable<pythonic::dispatch::{opstruct_name}>::table = {{{{",
+        ",\n".join(
+            f"    {{{{" + ", ".join(f"pythonic::dispatch::{slot_funcs[opname, left, right]}" for right in type_tags) + f"}}}} /* {left} */"
+            for left in type_tags),
+        f"}}}};",
+    ])
+
+if out_dir is None:
+    out = preamble + [stub for opname in ops for stub in stub_blocks[opname]]
+    out += [table_blocks[opname] for opname in op_struct_map] + closing
+    sys.stdout.write("\n".join(out) + "\n")
+else:
+    os.makedirs(out_dir, exist_ok=True)
+    for opname in op_struct_map:
+        text = "\n".join(preamble + stub_blocks[opname] + [table_blocks[opname]] + closing) + "\n"
+        path = os.path.join(out_dir, f"dispatch_{opname}.cpp")
+        # Leave unchanged files alone so their mtime stays put and the build
+        # only recompiles the operators whose stubs actually changed
+        try:
+            with open(path) as f:
+                if f.read() == text:
+                    continue
+        except FileNotFoundError:
+            pass
+        with open(path, "w") as f:
+            f.write(text)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Tests for extract_functions.py brace matching around string/char literals.
+
+Run: python3 -m unittest test_extract_functions   (from scripts/)
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from extract_functions import extract_function_signatures, match_brace  # noqa: E402
+
+
+def sigs(src: bytes):
+    return [sig for _, sig in extract_function_signatures(src, Path('t.hpp'))]
+
+
+class TestMatchBrace(unittest.TestCase):
+
+    def test_plain_nesting(self):
+        src = b'struct S { void f() { } int x; } tail'
+        self.assertEqual(match_brace(src, src.index(b'{')), src.index(b' tail'))
+
+    def test_brace_in_string_literal(self):
+        src = b'struct S { const char *s = "}"; int x; } tail'
+        self.assertEqual(match_brace(src, src.index(b'{')), src.index(b' tail'))
+
+    def test_brace_in_char_literal(self):
+        src = b"struct S { bool f(char c) { return c == '{'; } } tail"
+        self.assertEqual(match_brace(src, src.index(b'{')), src.index(b' tail'))
+
+    def test_escaped_quote_in_literal(self):
+        src = b'struct S { const char *s = "\\"}"; char q = \'\\\'\'; } tail'
+        self.assertEqual(match_brace(src, src.index(b'{')), src.index(b' tail'))
+
+    def test_unbalanced(self):
+        src = b'struct S { void f() { '
+        self.assertEqual(match_brace(src, src.index(b'{')), len(src))
+
+
+class TestLiteralsAndPrivateRanges(unittest.TestCase):
+    SRC = b"""
+class Lexer {
+public:
+    int depth = 0;
+    bool is_open(char c) { return c == '{'; }
+private:
+    int peek() { return 0; }
+};
+
+int calculator() { return 1; }
+"""
+
+    def test_private_helpers_skipped(self):
+        # A quoted '{' must not stretch the class past its end: peek() stays
+        # private and the free function after the class is still listed
+        self.assertEqual(sigs(self.SRC), ['bool is_open(char c)', 'int calculator()'])
+
+    def test_quoted_close_brace_does_not_end_class(self):
+        src = b"""
+class Parser {
+public:
+    int depth = 0;
+    const char *close() { return "}"; }
+private:
+    int advance() { return 1; }
+};
+"""
+        self.assertEqual(sigs(src), ['const char *close()'])
+
+
+if __name__ == '__main__':
+    unittest.main()